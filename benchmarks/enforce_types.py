@@ -0,0 +1,100 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+"""
+Measures the cost of the runtime type checks of the public methods of the SDK.
+
+Constructors and setters decorated with :samp:`enforce_types` are timed with the checks on, and with them turned off
+through the :samp:`PDF_SERVICES_SDK_ENFORCE_TYPES` environment variable. Since the variable is read when the SDK is
+imported, each column is measured in its own interpreter.
+
+Run from the repository root::
+
+    python benchmarks/enforce_types.py [--calls 200000]
+
+To compare with an older commit, run a copy of this script from a checkout of that commit.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src")
+ENFORCE_TYPES_ENV_VAR = "PDF_SERVICES_SDK_ENFORCE_TYPES"
+
+
+def measure(calls: int) -> dict:
+    """
+    :return: microseconds per call of each benchmarked call, with the checks as configured in this interpreter.
+    """
+    sys.path.insert(0, SRC_DIR)
+    from adobe.pdfservices.operation.io.cloud_asset import CloudAsset
+    from adobe.pdfservices.operation.io.external_asset import ExternalAsset
+    from adobe.pdfservices.operation.io.external_storage_type import ExternalStorageType
+    from adobe.pdfservices.operation.pdfjobs.jobs.ocr_pdf_job import OCRPDFJob
+    from adobe.pdfservices.operation.pdfjobs.params.combine_pdf.combine_pdf_params import CombinePDFParams
+    from adobe.pdfservices.operation.pdfjobs.params.page_ranges import PageRanges
+
+    asset = CloudAsset("asset")
+    page_ranges = PageRanges().add_range(1, 2)
+    benchmarks = {
+        "PageRanges().add_range(1, 2)": lambda: PageRanges().add_range(1, 2),
+        "ExternalAsset(uri, external_storage_type=)":
+            lambda: ExternalAsset("https://storage/in.pdf", external_storage_type=ExternalStorageType.S3),
+        "CombinePDFParams().add_asset(a, page_ranges=)":
+            lambda: CombinePDFParams().add_asset(asset, page_ranges=page_ranges),
+        "OCRPDFJob(a, output_asset=a)": lambda: OCRPDFJob(asset, output_asset=asset),
+    }
+    results = {}
+    for name, benchmark in benchmarks.items():
+        benchmark()
+        start = time.perf_counter()
+        for _ in range(calls):
+            benchmark()
+        results[name] = (time.perf_counter() - start) / calls * 1e6
+    return results
+
+
+def measure_in_subprocess(calls: int, enforce_types: bool) -> dict:
+    env = dict(os.environ)
+    env.pop(ENFORCE_TYPES_ENV_VAR, None)
+    if not enforce_types:
+        env[ENFORCE_TYPES_ENV_VAR] = "false"
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--calls", str(calls), "--measure"],
+                            capture_output=True, text=True, env=env, check=True).stdout
+    return json.loads(output)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000, help="number of calls timed for each benchmark")
+    parser.add_argument("--measure", action="store_true",
+                        help="only measure in this interpreter and print the results as JSON")
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.calls)))
+        return 0
+    checked = measure_in_subprocess(args.calls, True)
+    unchecked = measure_in_subprocess(args.calls, False)
+    print("{name:<46} {checked:>8} {unchecked:>8}".format(name="us/call", checked="checked", unchecked="off"))
+    for name, micros in checked.items():
+        print("{name:<46} {checked:8.2f} {unchecked:8.2f}".format(name=name, checked=micros,
+                                                                   unchecked=unchecked[name]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+"""
+Fails when importing the SDK got more expensive than its budget, to catch regressions of the lazy loading of
+modules.
+
+For each import statement, the number of SDK modules it loads is compared with a fixed budget, and the median of the
+cumulative :samp:`-X importtime` time of the SDK modules it imports is compared with a time budget. The module counts
+are exact, while the times depend on the host, so the time budget is generous and can be given on the command line.
+
+Run from the repository root::
+
+    python benchmarks/import_budget.py [--max-ms 250] [--runs 11]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src")
+
+# import statement -> maximum number of SDK modules it may load
+MODULE_BUDGETS = {
+    "from adobe.pdfservices.operation.pdf_services import PDFServices": 134,
+    "from adobe.pdfservices.operation.pdfjobs.result.extract_pdf_result import ExtractPDFResult": 12,
+    "from adobe.pdfservices.operation.pdfjobs.result import CompressPDFResult": 12,
+}
+
+
+def run_python(args: list) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    return subprocess.run([sys.executable] + args, capture_output=True, text=True, env=env, check=True)
+
+
+def get_sdk_module_count(statement: str) -> int:
+    output = run_python(["-c", statement + "; import sys; print(sum(name.startswith('adobe') "
+                                          "for name in sys.modules))"]).stdout
+    return int(output.split()[-1])
+
+
+def get_import_time_ms(statement: str) -> float:
+    """
+    :return: cumulative import time of the SDK modules imported directly by the statement, in milliseconds, which
+        excludes the start up of the interpreter but includes the third party modules the SDK imports.
+    """
+    total_us = 0
+    for line in run_python(["-X", "importtime", "-c", statement]).stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        # direct imports are indented by a single space
+        if name.startswith(" adobe") and not name.startswith("  "):
+            total_us += int(cumulative_us)
+    return total_us / 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-ms", type=float, default=250, help="time budget of each import statement")
+    parser.add_argument("--runs", type=int, default=11, help="number of runs the median time is taken from")
+    args = parser.parse_args()
+
+    failed = False
+    for statement, max_modules in MODULE_BUDGETS.items():
+        module_count = get_sdk_module_count(statement)
+        times = [get_import_time_ms(statement) for _ in range(args.runs)]
+        median = statistics.median(times)
+        over_budget = module_count > max_modules or median > args.max_ms
+        failed = failed or over_budget
+        print("{status} {statement}: {modules} SDK modules (budget {max_modules}), median {median:.1f} ms, "
+              "min {min:.1f} ms (budget {max_ms:.0f} ms)"
+              .format(status="FAIL" if over_budget else "ok  ", statement=statement, modules=module_count,
+                      max_modules=max_modules, median=median, min=min(times), max_ms=args.max_ms))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
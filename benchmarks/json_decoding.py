@@ -0,0 +1,141 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+"""
+Checks that decoding JSON into hinted classes is reentrant and measures its throughput.
+
+A document of three levels of :samp:`json_hint` classes is decoded concurrently from 16 threads with a very short
+thread switch interval and from a process pool, and every decoded object is checked. The throughput is then measured
+on a document of 1021 objects.
+
+Run from the repository root::
+
+    python benchmarks/json_decoding.py [--decodes 4000]
+
+The script also runs on commits where the class being decoded was kept in :samp:`JSONHintDecoder.current_class`, to
+compare with them; run a copy of it from a checkout of such a commit.
+"""
+
+import argparse
+import inspect
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from adobe.pdfservices.operation.internal.util.json_hint_encoder import JSONHintDecoder  # noqa: E402
+
+
+class Element:
+    json_hint = {'path': 'Path', 'page': 'Page', 'text': 'Text'}
+
+
+class Page:
+    json_hint = {'number': 'number', 'elements': {'name': 'elements', 'type': Element}}
+
+
+class Document:
+    json_hint = {'doc_id': 'id', 'pages': {'name': 'pages', 'type': Page}, 'meta': {'name': 'meta', 'type': Element}}
+
+
+def create_payload(tag: str, pages: int, elements: int) -> dict:
+    return {'id': tag, 'meta': {'Path': tag, 'Page': 0, 'Text': 'meta'},
+            'pages': [{'number': page, 'elements': [{'Path': '{tag}/{page}/{element}'.format(tag=tag, page=page,
+                                                                                           element=element),
+                                                     'Page': page, 'Text': 'x' * 20}
+                                                    for element in range(elements)]}
+                      for page in range(pages)]}
+
+
+def decode(payload: dict) -> Document:
+    if len(inspect.signature(JSONHintDecoder.as_class).parameters) == 2:
+        return JSONHintDecoder.as_class(payload, Document)
+    # decoder of older commits, which kept the class being decoded in a class attribute
+    JSONHintDecoder.current_class = Document
+    return JSONHintDecoder.as_class(payload)
+
+
+def decode_and_check(tag: str) -> bool:
+    document = decode(create_payload(tag, 5, 10))
+    if not isinstance(document, Document) or document.doc_id != tag or document.meta.path != tag:
+        return False
+    for page_number, page in enumerate(document.pages):
+        if not isinstance(page, Page) or page.number != page_number:
+            return False
+        for element_number, element in enumerate(page.elements):
+            if not isinstance(element, Element) or element.path != '{tag}/{page}/{element}'.format(
+                    tag=tag, page=page_number, element=element_number):
+                return False
+    return True
+
+
+def count_failures(results) -> int:
+    failures = 0
+    for result in results:
+        try:
+            failures += not result.result()
+        except Exception:
+            failures += 1
+    return failures
+
+
+def run_threads(decodes: int) -> int:
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(16) as executor:
+            failures = count_failures([executor.submit(decode_and_check, "thread{index}".format(index=index))
+                                       for index in range(decodes)])
+    finally:
+        sys.setswitchinterval(switch_interval)
+    print("16 threads x {decodes} decodes, 1 us switch interval: {failures} wrong or failed"
+          .format(decodes=decodes, failures=failures))
+    return failures
+
+
+def run_processes(decodes: int) -> int:
+    with ProcessPoolExecutor(2) as executor:
+        failures = count_failures([executor.submit(decode_and_check, "process{index}".format(index=index))
+                                   for index in range(decodes)])
+    print("2 processes x {decodes} decodes: {failures} wrong or failed".format(decodes=decodes, failures=failures))
+    return failures
+
+
+def run_throughput(runs: int):
+    payload = create_payload("throughput", 20, 50)
+    # the document, its meta element, 20 pages and 50 elements per page
+    objects = 1 + 1 + 20 + 20 * 50
+    decode(payload)
+    start = time.perf_counter()
+    for _ in range(runs):
+        decode(payload)
+    elapsed = time.perf_counter() - start
+    print("throughput: {per_document:.3f} ms per document of {objects} objects, {rate:,.0f} objects/s"
+          .format(per_document=elapsed / runs * 1000, objects=objects, rate=objects * runs / elapsed))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--decodes", type=int, default=4000, help="number of decodes made from the thread pool")
+    parser.add_argument("--runs", type=int, default=300, help="number of decodes the throughput is measured on")
+    args = parser.parse_args()
+
+    failures = run_threads(args.decodes)
+    failures += run_processes(200)
+    run_throughput(args.runs)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+"""
+Measures the time of encoding the JSON body of job submissions.
+
+The :samp:`to_json()` of the request DTOs of a combine with 20 inputs, a document merge with 5000 data records and a
+split are timed. With :samp:`--bodies`, the parsed submit bodies of a set of job types are also written to a file,
+through an in-process fake of PDF Services, so that the bodies produced by two commits can be compared with
+:samp:`diff`.
+
+Run from the repository root::
+
+    python benchmarks/json_encoding.py [--bodies bodies.json]
+
+To compare with an older commit, run a copy of this script from a checkout of that commit.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from adobe.pdfservices.operation.internal.api.dto.request.combinepdf.combine_pdf_internal_asset_request import \
+    CombinePDFInternalAssetRequest  # noqa: E402
+from adobe.pdfservices.operation.internal.api.dto.request.document_generation.\
+    document_generation_internal_asset_request import DocumentMergeInternalAssetRequest  # noqa: E402
+from adobe.pdfservices.operation.internal.api.dto.request.splitpdf.split_pdf_internal_asset_request import \
+    SplitPDFInternalAssetRequest  # noqa: E402
+from adobe.pdfservices.operation.io.cloud_asset import CloudAsset  # noqa: E402
+from adobe.pdfservices.operation.pdfjobs.params.combine_pdf.combine_pdf_params import CombinePDFParams  # noqa: E402
+from adobe.pdfservices.operation.pdfjobs.params.documentmerge.document_merge_params import \
+    DocumentMergeParams  # noqa: E402
+from adobe.pdfservices.operation.pdfjobs.params.page_ranges import PageRanges  # noqa: E402
+from adobe.pdfservices.operation.pdfjobs.params.split_pdf.split_pdf_params import SplitPDFParams  # noqa: E402
+
+
+def create_page_ranges(count: int) -> PageRanges:
+    page_ranges = PageRanges()
+    for index in range(count):
+        page_ranges.add_range(3 * index + 1, 3 * index + 3)
+    page_ranges.add_all_from(50)
+    return page_ranges
+
+
+def create_combine_params() -> CombinePDFParams:
+    combine_pdf_params = CombinePDFParams()
+    for index in range(20):
+        combine_pdf_params.add_asset(CloudAsset("asset{index}".format(index=index)), page_ranges=create_page_ranges(3))
+    return combine_pdf_params
+
+
+def create_merge_data(records: int) -> dict:
+    return {"customers": [{"name": "name{index}".format(index=index), "id": index, "tags": ["a", "b"],
+                           "address": {"x": 1.5, "y": None}} for index in range(records)]}
+
+
+def time_to_json():
+    requests = (
+        ("combine, 20 inputs", CombinePDFInternalAssetRequest(create_combine_params(), None), 50),
+        ("document merge, 5000 rows",
+         DocumentMergeInternalAssetRequest("asset", DocumentMergeParams(create_merge_data(5000)), None), 20),
+        ("split", SplitPDFInternalAssetRequest("asset", SplitPDFParams(page_ranges=create_page_ranges(5))), 5000),
+    )
+    for name, request, runs in requests:
+        body = request.to_json()
+        start = time.perf_counter()
+        for _ in range(runs):
+            request.to_json()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print("{name:<26} {per_call:8.3f} ms {size:7d} bytes".format(name=name, per_call=elapsed_ms / runs,
+                                                                     size=len(body)))
+
+
+def create_jobs() -> dict:
+    from adobe.pdfservices.operation.io.external_asset import ExternalAsset
+    from adobe.pdfservices.operation.io.external_storage_type import ExternalStorageType
+    from adobe.pdfservices.operation.pdfjobs.jobs.combine_pdf_job import CombinePDFJob
+    from adobe.pdfservices.operation.pdfjobs.jobs.compress_pdf_job import CompressPDFJob
+    from adobe.pdfservices.operation.pdfjobs.jobs.delete_pages_job import DeletePagesJob
+    from adobe.pdfservices.operation.pdfjobs.jobs.document_merge_job import DocumentMergeJob
+    from adobe.pdfservices.operation.pdfjobs.jobs.extract_pdf_job import ExtractPDFJob
+    from adobe.pdfservices.operation.pdfjobs.jobs.html_to_pdf_job import HTMLtoPDFJob
+    from adobe.pdfservices.operation.pdfjobs.jobs.import_pdf_form_data_job import ImportPDFFormDataJob
+    from adobe.pdfservices.operation.pdfjobs.jobs.insert_pages_job import InsertPagesJob
+    from adobe.pdfservices.operation.pdfjobs.jobs.ocr_pdf_job import OCRPDFJob
+    from adobe.pdfservices.operation.pdfjobs.jobs.pdf_watermark_job import PDFWatermarkJob
+    from adobe.pdfservices.operation.pdfjobs.jobs.protect_pdf_job import ProtectPDFJob
+    from adobe.pdfservices.operation.pdfjobs.jobs.split_pdf_job import SplitPDFJob
+    from adobe.pdfservices.operation.pdfjobs.params.delete_pages.delete_pages_params import DeletePagesParams
+    from adobe.pdfservices.operation.pdfjobs.params.extract_pdf.extract_element_type import ExtractElementType
+    from adobe.pdfservices.operation.pdfjobs.params.extract_pdf.extract_pdf_params import ExtractPDFParams
+    from adobe.pdfservices.operation.pdfjobs.params.html_to_pdf.html_to_pdf_params import HTMLtoPDFParams
+    from adobe.pdfservices.operation.pdfjobs.params.import_pdf_form_data.import_pdf_form_data_params import \
+        ImportPDFFormDataParams
+    from adobe.pdfservices.operation.pdfjobs.params.insert_pages.insert_pages_params import InsertPagesParams
+    from adobe.pdfservices.operation.pdfjobs.params.pdf_watermark.pdf_watermark_params import PDFWatermarkParams
+    from adobe.pdfservices.operation.pdfjobs.params.pdf_watermark.watermark_appearance import WatermarkAppearance
+    from adobe.pdfservices.operation.pdfjobs.params.protect_pdf.encryption_algorithm import EncryptionAlgorithm
+    from adobe.pdfservices.operation.pdfjobs.params.protect_pdf.password_protect_params import \
+        PasswordProtectParams
+
+    asset = CloudAsset("asset")
+    insert_pages_params = InsertPagesParams(asset)
+    insert_pages_params.add_pages_to_insert(CloudAsset("inserted"), base_page=2)
+    return {
+        "combine": CombinePDFJob(create_combine_params()),
+        "document merge": DocumentMergeJob(asset, DocumentMergeParams(create_merge_data(5000))),
+        "split": SplitPDFJob(asset, SplitPDFParams(page_ranges=create_page_ranges(5))),
+        "html to pdf": HTMLtoPDFJob(input_asset=asset,
+                                    html_to_pdf_params=HTMLtoPDFParams(include_header_footer=True)),
+        "extract": ExtractPDFJob(asset, extract_pdf_params=ExtractPDFParams(
+            elements_to_extract=[ExtractElementType.TEXT, ExtractElementType.TABLES])),
+        "protect": ProtectPDFJob(asset, PasswordProtectParams(EncryptionAlgorithm.AES_256, user_password="password")),
+        "delete pages": DeletePagesJob(asset, DeletePagesParams(create_page_ranges(4))),
+        "import form data": ImportPDFFormDataJob(asset).set_params(ImportPDFFormDataParams({"field": "value"})),
+        "compress": CompressPDFJob(asset),
+        "ocr, external assets": OCRPDFJob(
+            ExternalAsset("https://storage/in.pdf", external_storage_type=ExternalStorageType.S3),
+            output_asset=ExternalAsset("https://storage/out.pdf", external_storage_type=ExternalStorageType.S3)),
+        "watermark": PDFWatermarkJob(asset, CloudAsset("watermark"), pdf_watermark_params=PDFWatermarkParams(
+            page_ranges=create_page_ranges(2), watermark_appearance=WatermarkAppearance(opacity=40))),
+        "insert pages": InsertPagesJob(insert_pages_params),
+    }
+
+
+def record_bodies(file_path: str):
+    from adobe.pdfservices.operation.auth.service_principal_credentials import ServicePrincipalCredentials
+    from adobe.pdfservices.operation.config.client_config import ClientConfig
+    from adobe.pdfservices.operation.internal.http.http_method import HttpMethod
+    from adobe.pdfservices.operation.internal.http.transport.fake_transport import FakeTransport
+    from adobe.pdfservices.operation.internal.http.transport.http_response import HttpResponse
+    from adobe.pdfservices.operation.pdf_services import PDFServices
+
+    transport = FakeTransport()
+    transport.add_route(HttpMethod.POST, r"/token$",
+                        HttpResponse(200, {}, b'{"access_token": "token", "expires_in": 86399}'))
+    transport.add_route(HttpMethod.POST, r"/operation/",
+                        HttpResponse(201, {"location": "https://pdf-services.adobe.io/operation/job/status",
+                                           "x-request-id": "request"}, b""))
+    pdf_services = PDFServices(ServicePrincipalCredentials("client_id", "client_secret"),
+                               client_config=ClientConfig(transport=transport))
+    bodies = {}
+    for name, job in create_jobs().items():
+        pdf_services.submit(job)
+        bodies[name] = json.loads(transport.requests[-1].data)
+    with open(file_path, "w") as file:
+        json.dump(bodies, file, sort_keys=True, indent=1)
+    print("submit bodies of {count} job types written to {file_path}".format(count=len(bodies),
+                                                                              file_path=file_path))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bodies", help="file the parsed submit bodies are written to")
+    args = parser.parse_args()
+
+    time_to_json()
+    if args.bodies:
+        record_bodies(args.bodies)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
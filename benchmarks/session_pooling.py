@@ -0,0 +1,105 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+"""
+Compares the time of the HTTP round trips of a job with and without reusing connections.
+
+A job is simulated as a fixed number of sequential requests made through the SDK's HTTP client to a loopback HTTP/1.1
+server which keeps connections alive, so the difference between the transports is the cost of opening a new
+connection for each request. Against the real service each new connection also pays a TLS handshake, so the gain there
+is larger than the one measured here.
+
+Run from the repository root::
+
+    python benchmarks/session_pooling.py [--jobs 200] [--requests-per-job 8]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from adobe.pdfservices.operation.config.client_config import ClientConfig  # noqa: E402
+from adobe.pdfservices.operation.config.transport_type import TransportType  # noqa: E402
+from adobe.pdfservices.operation.internal.http import http_client  # noqa: E402
+from adobe.pdfservices.operation.internal.http.http_method import HttpMethod  # noqa: E402
+from adobe.pdfservices.operation.internal.http.http_request import HttpRequest  # noqa: E402
+from adobe.pdfservices.operation.internal.http.transport.requests_transport import RequestsTransport  # noqa: E402
+from adobe.pdfservices.operation.internal.http.transport.transport_factory import HttpTransportFactory  # noqa: E402
+
+
+class _StatusHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # send the headers and the body in a single segment, delayed ACKs would otherwise stall every kept alive request
+    wbufsize = 65536
+
+    def do_GET(self):
+        body = b'{"status": "in progress"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.headers.get("Connection", "").lower() == "close":
+            # acknowledge the request to close, as servers do, so that the client does not reuse the connection
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def run_job(transport, url: str, requests_per_job: int):
+    for _ in range(requests_per_job):
+        response = http_client.process_request(HttpRequest(HttpMethod.GET, "status", url, {}, transport=transport),
+                                               [200], None)
+        response.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200, help="number of jobs timed for each transport")
+    parser.add_argument("--requests-per-job", type=int, default=8, help="number of round trips of a job")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StatusHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = "http://127.0.0.1:{port}/status".format(port=server.server_port)
+
+    transports = {
+        "connection per request": RequestsTransport(pooled=False),
+        "pooled, keep alive off": HttpTransportFactory.get_transport(ClientConfig(keep_alive=False)),
+        "pooled (requests)": HttpTransportFactory.get_transport(ClientConfig()),
+        "pooled (urllib3)": HttpTransportFactory.get_transport(ClientConfig(transport_type=TransportType.URLLIB3)),
+    }
+    try:
+        for name, transport in transports.items():
+            # warm up, which also opens the pooled connection
+            run_job(transport, url, args.requests_per_job)
+            start = time.perf_counter()
+            for _ in range(args.jobs):
+                run_job(transport, url, args.requests_per_job)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print("{name:<24} {per_job:.2f} ms/job".format(name=name, per_job=elapsed_ms / args.jobs))
+            transport.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
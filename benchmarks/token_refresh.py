@@ -0,0 +1,144 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+"""
+Measures the contention on the access token of service principal credentials.
+
+Many threads call :samp:`session_token()` on a shared authenticator whose token endpoint is answered by a fake
+transport after a simulated round trip. The throughput, the slowest call and the number of token requests are
+reported for a token which is valid for long, and for one close enough to expiry to be refreshed while the threads
+run. It then checks that concurrent re-authentications after a 401 fetch a single token, and that the background
+refresher of an authenticator which is dropped without being closed is stopped.
+
+Run from the repository root::
+
+    python benchmarks/token_refresh.py [--threads 64] [--calls 20000] [--round-trip-ms 50]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from adobe.pdfservices.operation.auth.service_principal_credentials import ServicePrincipalCredentials  # noqa: E402
+from adobe.pdfservices.operation.config.client_config import ClientConfig  # noqa: E402
+from adobe.pdfservices.operation.internal.auth.service_principal_authenticator import \
+    ServicePrincipalAuthenticator  # noqa: E402
+from adobe.pdfservices.operation.internal.http.http_method import HttpMethod  # noqa: E402
+from adobe.pdfservices.operation.internal.http.transport.fake_transport import FakeTransport  # noqa: E402
+from adobe.pdfservices.operation.internal.http.transport.http_response import HttpResponse  # noqa: E402
+
+
+class _TokenEndpoint:
+
+    def __init__(self, expires_in: int, round_trip_ms: float):
+        self.expires_in = expires_in
+        self.round_trip_ms = round_trip_ms
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, http_request):
+        with self._lock:
+            self.requests += 1
+            access_token = "token{number}".format(number=self.requests)
+        time.sleep(self.round_trip_ms / 1000)
+        return HttpResponse(200, {}, json.dumps({"access_token": access_token,
+                                                 "expires_in": self.expires_in}).encode())
+
+
+def create_authenticator(expires_in: int, round_trip_ms: float):
+    endpoint = _TokenEndpoint(expires_in, round_trip_ms)
+    transport = FakeTransport()
+    transport.add_route(HttpMethod.POST, r"/token$", endpoint)
+    authenticator = ServicePrincipalAuthenticator(ServicePrincipalCredentials("client_id", "client_secret"),
+                                                  ClientConfig(), transport)
+    return authenticator, endpoint
+
+
+def run_contention(expires_in: int, threads: int, calls: int, round_trip_ms: float):
+    authenticator, endpoint = create_authenticator(expires_in, round_trip_ms)
+    authenticator.session_token()
+    worst_calls = []
+
+    def call_session_token():
+        worst = 0
+        for _ in range(calls):
+            start = time.perf_counter()
+            authenticator.session_token()
+            worst = max(worst, time.perf_counter() - start)
+        worst_calls.append(worst)
+
+    workers = [threading.Thread(target=call_session_token) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    authenticator.close()
+    print("token valid for {expires_in} s, {threads} threads x {calls} calls: {rate:,.0f} calls/s, "
+          "worst call {worst:.1f} ms, {requests} token requests"
+          .format(expires_in=expires_in, threads=threads, calls=calls, rate=threads * calls / elapsed,
+                  worst=max(worst_calls) * 1000, requests=endpoint.requests))
+
+
+def run_concurrent_reauthentication(threads: int, round_trip_ms: float) -> bool:
+    authenticator, endpoint = create_authenticator(86399, round_trip_ms)
+    expired_access_token = authenticator.session_token().access_token
+    workers = [threading.Thread(target=authenticator.refresh_expired_token, args=(expired_access_token,))
+               for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    authenticator.close()
+    # one request for the initial token and one for the refresh
+    refreshes = endpoint.requests - 1
+    print("{threads} concurrent re-authentications after a 401: {refreshes} token requests"
+          .format(threads=threads, refreshes=refreshes))
+    return refreshes == 1
+
+
+def run_dropped_authenticator() -> bool:
+    authenticator, endpoint = create_authenticator(86399, 0)
+    authenticator.session_token()
+    del authenticator
+    gc.collect()
+    # give the cancelled timer thread time to exit
+    time.sleep(0.1)
+    timers = sum(isinstance(thread, threading.Timer) for thread in threading.enumerate())
+    print("refresh timers left after dropping an authenticator without closing it: {timers}".format(timers=timers))
+    return timers == 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=64, help="number of threads calling session_token()")
+    parser.add_argument("--calls", type=int, default=20000, help="number of calls made by each thread")
+    parser.add_argument("--round-trip-ms", type=float, default=50, help="simulated time of a token request")
+    args = parser.parse_args()
+
+    # a token with 179 s left is inside the refresh window, a 24 h token is the steady state
+    for expires_in in (86399, 179):
+        run_contention(expires_in, args.threads, args.calls, args.round_trip_ms)
+    passed = run_concurrent_reauthentication(20, args.round_trip_ms)
+    passed = run_dropped_authenticator() and passed
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
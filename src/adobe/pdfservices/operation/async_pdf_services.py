@@ -0,0 +1,269 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Any, Optional
+
+from adobe.pdfservices.operation.auth.credentials import Credentials
+from adobe.pdfservices.operation.config.client_config import ClientConfig
+from adobe.pdfservices.operation.exception.exceptions import SdkException, ServiceApiException
+from adobe.pdfservices.operation.internal.constants.custom_error_messages import CustomErrorMessages
+from adobe.pdfservices.operation.internal.exceptions import OperationException
+from adobe.pdfservices.operation.internal.execution_context import ExecutionContext
+from adobe.pdfservices.operation.internal.pdf_services_helper import PDFServicesHelper
+from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
+from adobe.pdfservices.operation.internal.util.object_util import ObjectUtil
+from adobe.pdfservices.operation.internal.util.string_util import StringUtil
+from adobe.pdfservices.operation.io.asset import Asset
+from adobe.pdfservices.operation.io.stream_asset import StreamAsset
+from adobe.pdfservices.operation.pdf_services_job import PDFServicesJob
+from adobe.pdfservices.operation.pdf_services_job_status import PDFServicesJobStatus
+from adobe.pdfservices.operation.pdf_services_job_status_response import PDFServicesJobStatusResponse
+from adobe.pdfservices.operation.pdf_services_response import PDFServicesResponse
+from adobe.pdfservices.operation.pdfjobs.result.pdf_services_job_result import PDFServicesJobResult
+
+
+class AsyncPDFServices:
+    """
+    asyncio counterpart of :class:`PDFServices<adobe.pdfservices.operation.pdf_services.PDFServices>`, exposing the
+    same operations as coroutines and sharing its jobs, results and assets.
+
+    Each HTTP request runs on a bounded pool of worker threads using the pooled connections of the configured
+    transport, while waiting between status polls is done with :samp:`asyncio.sleep`. A job therefore only holds a
+    thread during a request, so thousands of jobs can be in flight on a single event loop.
+    """
+
+    @enforce_types
+    def __init__(self, credentials: Credentials, *, client_config: Optional[ClientConfig] = None,
+                 max_workers: Optional[int] = None):
+        """
+        Constructs a new :samp:`AsyncPDFServices` instance with the given Credentials and ClientConfig.
+
+        :param credentials: Credentials to be used for authentication; can not be None.
+        :type credentials: Credentials
+        :param client_config: Client configuration for AsyncPDFServices. (Optional, use key-value)
+        :type client_config: ClientConfig
+        :param max_workers: Maximum number of HTTP requests in flight at once. Default value is the pool maxsize of
+            the client configuration. (Optional, use key-value)
+        :type max_workers: int
+        """
+        self.__executionContext: ExecutionContext = ExecutionContext(credentials, client_config)
+        if max_workers is None:
+            max_workers = self.__executionContext.client_config.get_pool_maxsize()
+        if max_workers <= 0:
+            raise ValueError("Max workers must be greater than 0")
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pdfservices-async")
+        self._logger = logging.getLogger(__name__)
+
+    async def close(self):
+        """
+        Waits for the running requests to complete and releases the worker threads and pooled HTTP connections.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.__executor.shutdown)
+        self.__executionContext.close()
+
+    def get_metrics(self) -> dict:
+        """
+        Returns a snapshot of the counters collected by this :samp:`AsyncPDFServices` instance.
+
+        :return: counter names mapped to their values.
+        :rtype: dict
+        """
+        return self.__executionContext.metrics.snapshot()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def __run(self, func, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(self.__executor,
+                                                                functools.partial(func, *args, **kwargs))
+
+    @enforce_types
+    async def submit(self, pdf_services_job: PDFServicesJob, *, notify_config_list: Optional[List] = None) -> str:
+        """
+        Creates the :class:`PDFServicesJob<adobe.pdfservices.operation.pdf_services_job.PDFServicesJob>`
+        and returns the polling URL.
+
+        :param pdf_services_job: PDFServicesJob to be submitted; can not be None.
+        :type pdf_services_job: PDFServicesJob
+        :param notify_config_list: List of
+            :class:`NotifierConfig<adobe.pdfservices.operation.config.notifier.notifier_config.NotifierConfig>`
+            to be used for notification. (Optional, use key-value)
+        :type notify_config_list: list
+        :raises ServiceApiException: If an error is encountered while submitting the job.
+        :raises SdkException: Is thrown for client-side or network errors.
+        :raises ServiceUsageException: If service usage limits have been reached or credentials quota has been
+            exhausted.
+        :return: the polling URL.
+        :rtype: str
+        """
+        return await self.__run(pdf_services_job._process, self.__executionContext, notify_config_list)
+
+    @enforce_types
+    async def get_job_result(self, polling_url: str,
+                             result_type: PDFServicesJobResult.__class__) -> PDFServicesResponse:
+        """
+        Returns PDFServicesResponse for the submitted
+        :class:`PDFServicesJob<adobe.pdfservices.operation.pdf_services_job.PDFServicesJob>` result, polling the job
+        status without blocking the event loop until the job is done.
+
+        :param polling_url: URL to be polled to get the job result; can not be None.
+        :type polling_url: str
+        :param result_type: result class for
+            :class:`PDFServicesJob<adobe.pdfservices.operation.pdf_services_job.PDFServicesJob>`, it will be an
+            implementation of PDFServicesJobResult; can not be None.
+        :type result_type: PDFServicesJobResult.__class__
+        :raises ServiceApiException: If an error is encountered while submitting the job.
+        :raises SdkException: Is thrown for client-side or network errors.
+        :return: PDFServicesResponse for the submitted job.
+        :rtype: PDFServicesResponse
+        """
+        if StringUtil.is_blank(polling_url):
+            raise SdkException(CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE_OR_EMPTY.format("Polling URL"))
+        ObjectUtil.require_not_null(result_type,
+                                    CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Result class object"))
+
+        while True:
+            pdf_services_response = await self.__run(PDFServicesHelper.poll_job, self.__executionContext,
+                                                     polling_url, result_type)
+            if pdf_services_response.get_status() != PDFServicesJobStatus.IN_PROGRESS.get_value():
+                return pdf_services_response
+            retry_after = pdf_services_response.get_retry_interval()
+            self._logger.debug(f"Retry polling for job result after {retry_after} seconds")
+            await asyncio.sleep(retry_after)
+
+    @enforce_types
+    async def get_job_status(self, polling_url: str) -> PDFServicesJobStatusResponse:
+        """
+        :param polling_url: URL to be polled to get the job status; can not be None.
+        :type polling_url: str
+        :raises ServiceApiException: If an error is encountered while submitting the job.
+        :raises SdkException: Is thrown for client-side or network errors.
+        :raises ServiceUsageException: If service usage limits have been reached or credentials quota has been
+            exhausted.
+        :return: Returns PDFServicesJobStatusResponse for the submitted
+            :class:`PDFServicesJob<adobe.pdfservices.operation.pdf_services_job.PDFServicesJob>`.
+        :rtype: PDFServicesJobStatusResponse
+        """
+        if StringUtil.is_blank(polling_url):
+            raise SdkException(CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE_OR_EMPTY.format("Polling URL"))
+        return await self.__run(PDFServicesHelper.get_job_status, self.__executionContext, polling_url)
+
+    @enforce_types
+    async def upload(self, input_stream: Any, mime_type: str) -> Asset:
+        """
+        Upload content from input stream and returns an :class:`Asset<adobe.pdfservices.operation.io.asset.Asset>`
+        to be used in PDF Services SDK. The input stream can be anything accepted by
+        :class:`StreamAsset<adobe.pdfservices.operation.io.stream_asset.StreamAsset>`.
+
+        Method will not close the input stream, responsibility of closing the input stream lies with the client.
+
+        :param input_stream: input stream that is to be uploaded; can not be None.
+        :param mime_type: mime type of the input stream; can not be None.
+        :type mime_type: str
+        :raises ServiceApiException: If an error is encountered while submitting the job.
+        :raises SdkException: Is thrown for client-side or network errors.
+        :raises ServiceUsageException: If service usage limits have been reached or credentials quota has been
+            exhausted.
+        :return: asset containing the uploaded content
+        :rtype: Asset
+        """
+        ObjectUtil.require_not_null(input_stream, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Input stream"))
+        if StringUtil.is_blank(mime_type):
+            raise ValueError(CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE_OR_EMPTY.format("Mime Type"))
+
+        return await self.__run(PDFServicesHelper.upload, self.__executionContext, input_stream, mime_type)
+
+    @enforce_types
+    async def upload_assets(self, upload_asset_list: List) -> []:
+        """
+        Upload content from list of :class:`StreamAsset<adobe.pdfservices.operation.io.stream_asset.StreamAsset>`
+        concurrently and returns a list of :class:`Asset<adobe.pdfservices.operation.io.asset.Asset>` in the same
+        order.
+
+        Method will not close the input stream of the Stream Asset, responsibility of closing the input stream lies
+        with the client.
+
+        :param upload_asset_list: :class:`StreamAsset<adobe.pdfservices.operation.io.stream_asset.StreamAsset>`
+            list that is to be uploaded; can not be None.
+        :type upload_asset_list: list
+        :raises ServiceApiException: If an error is encountered while submitting the job.
+        :raises SdkException: Is thrown for client-side or network errors.
+        :return: returns a list of :class:`Asset<adobe.pdfservices.operation.io.asset.Asset>` to be used in PDF Services
+            SDK.
+        :rtype: list
+        """
+        ObjectUtil.require_not_null(upload_asset_list,
+                                    CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Upload asset list"))
+        if len(upload_asset_list) < 1:
+            raise SdkException("Upload Asset List is empty.")
+        for stream_asset in upload_asset_list:
+            if stream_asset is None or not isinstance(stream_asset, StreamAsset):
+                raise SdkException("Stream Asset List elements must be of the type StreamAsset.")
+
+        try:
+            return list(await asyncio.gather(*[self.__run(PDFServicesHelper.upload_stream_asset,
+                                                          self.__executionContext, stream_asset)
+                                               for stream_asset in upload_asset_list]))
+        except OperationException as oe:
+            raise ServiceApiException(oe.error_message, oe.request_tracking_id, oe.status_code, oe.error_code)
+
+    @enforce_types
+    async def get_content(self, asset: Asset, *, spool_threshold: Optional[int] = None) -> StreamAsset:
+        """
+        Returns content of the :class:`Asset<adobe.pdfservices.operation.io.asset.Asset>` as a
+        :class:`StreamAsset<adobe.pdfservices.operation.io.stream_asset.StreamAsset>`.
+
+        :param asset: asset for which content needs to be fetched; can not be None.
+        :type asset: Asset
+        :param spool_threshold: If provided, the content is downloaded in chunks and only kept in memory up to this
+            number of bytes, see :meth:`PDFServices.get_content`. (Optional, use key-value)
+        :type spool_threshold: int
+        :raises ServiceApiException: If an error is encountered while submitting the job.
+        :raises SdkException: Is thrown for client-side or network errors.
+        :return: content of the asset.
+        :rtype: StreamAsset
+        """
+        ObjectUtil.require_not_null(asset, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Asset"))
+        return await self.__run(PDFServicesHelper.get_content, self.__executionContext, asset, spool_threshold)
+
+    @enforce_types
+    async def refresh_download_uri(self, asset: Asset) -> Asset:
+        """
+        :param asset: asset to be refreshed; can not be None.
+        :type asset: Asset
+        :raises ServiceApiException: If an error is encountered while submitting the job.
+        :raises SdkException: Is thrown for client-side or network errors.
+        :return: a new Asset with a new valid download URI.
+        :rtype: Asset
+        """
+        ObjectUtil.require_not_null(asset, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Asset"))
+        return await self.__run(PDFServicesHelper.refresh_download_uri, self.__executionContext, asset)
+
+    @enforce_types
+    async def delete_asset(self, asset: Asset):
+        """
+        Deletes asset from PDF Services storage.
+
+        :param asset: Asset to be deleted; can not be None.
+        :type asset: Asset
+        :raises ServiceApiException: If an error is encountered while submitting the job.
+        :raises SdkException: Is thrown for client-side or network errors.
+        """
+        ObjectUtil.require_not_null(asset, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Asset"))
+        await self.__run(PDFServicesHelper.delete_asset, self.__executionContext, asset)
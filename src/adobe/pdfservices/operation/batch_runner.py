@@ -0,0 +1,429 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import glob
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from adobe.pdfservices.operation.exception.exceptions import SdkException
+from adobe.pdfservices.operation.internal.constants.custom_error_messages import CustomErrorMessages
+from adobe.pdfservices.operation.internal.journal.batch_journal import BatchJournal
+from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
+from adobe.pdfservices.operation.internal.util.object_util import ObjectUtil
+from adobe.pdfservices.operation.internal.util.string_util import StringUtil
+from adobe.pdfservices.operation.job_poller import JobPoller
+from adobe.pdfservices.operation.pdf_services import PDFServices
+from adobe.pdfservices.operation.pdf_services_media_type import PDFServicesMediaType
+from adobe.pdfservices.operation.pdfjobs.result.pdf_services_job_result import PDFServicesJobResult
+from adobe.pdfservices.operation.result_processor import ResultProcessor
+
+_JOURNAL_FILE_NAME = ".pdfservices-batch.sqlite3"
+_PROGRESS_INTERVAL_SECONDS = 30
+
+
+class BatchSummary:
+    """
+    Throughput and latency summary of a :class:`BatchRunner` run.
+
+    Latencies are recorded in seconds for each stage of the files processed in the run: :samp:`upload`,
+    :samp:`submit`, :samp:`job` (from submission until the job is done), :samp:`download`, :samp:`process` (when
+    a :class:`ResultProcessor<adobe.pdfservices.operation.result_processor.ResultProcessor>` is used) and
+    :samp:`total`.
+    """
+
+    STAGES = ("upload", "submit", "job", "download", "process", "total")
+
+    def __init__(self, total: int, succeeded: int, failed: int, skipped: int, elapsed: float, latencies: dict):
+        self.__total = total
+        self.__succeeded = succeeded
+        self.__failed = failed
+        self.__skipped = skipped
+        self.__elapsed = elapsed
+        self.__latencies = {stage: sorted(latencies.get(stage, [])) for stage in BatchSummary.STAGES}
+
+    def get_total(self) -> int:
+        """
+        :return: Number of files matching the input glob.
+        :rtype: int
+        """
+        return self.__total
+
+    def get_succeeded(self) -> int:
+        """
+        :return: Number of files whose result was written in this run.
+        :rtype: int
+        """
+        return self.__succeeded
+
+    def get_failed(self) -> int:
+        """
+        :return: Number of files which failed in this run; they are retried by the next run.
+        :rtype: int
+        """
+        return self.__failed
+
+    def get_skipped(self) -> int:
+        """
+        :return: Number of files skipped because their result was written by a previous run.
+        :rtype: int
+        """
+        return self.__skipped
+
+    def get_elapsed(self) -> float:
+        """
+        :return: Duration of the run in seconds.
+        :rtype: float
+        """
+        return self.__elapsed
+
+    def get_throughput(self) -> float:
+        """
+        :return: Number of files processed per second, successfully or not.
+        :rtype: float
+        """
+        return (self.__succeeded + self.__failed) / self.__elapsed if self.__elapsed > 0 else 0.0
+
+    def get_latency_percentiles(self, stage: str) -> dict:
+        """
+        :param stage: One of :samp:`BatchSummary.STAGES`.
+        :type stage: str
+        :return: The p50, p95, p99 and max latencies of the stage in seconds, or an empty dict if no file went
+            through it.
+        :rtype: dict
+        """
+        if stage not in self.__latencies:
+            raise ValueError("Unknown stage {stage}".format(stage=stage))
+        latencies = self.__latencies[stage]
+        if not latencies:
+            return {}
+        return {'p50': self.__get_percentile(latencies, 50),
+                'p95': self.__get_percentile(latencies, 95),
+                'p99': self.__get_percentile(latencies, 99),
+                'max': latencies[-1]}
+
+    @staticmethod
+    def __get_percentile(latencies: list, percentile: int) -> float:
+        return latencies[min(len(latencies) - 1, len(latencies) * percentile // 100)]
+
+    def __str__(self):
+        lines = ["{total} files: {succeeded} succeeded, {failed} failed, {skipped} skipped in {elapsed:.1f}s "
+                 "({throughput:.2f} files/s)".format(total=self.__total, succeeded=self.__succeeded,
+                                                     failed=self.__failed, skipped=self.__skipped,
+                                                     elapsed=self.__elapsed, throughput=self.get_throughput())]
+        for stage in BatchSummary.STAGES:
+            percentiles = self.get_latency_percentiles(stage)
+            if percentiles:
+                lines.append("  {stage:<8} p50 {p50:.3f}s  p95 {p95:.3f}s  p99 {p99:.3f}s  max {max:.3f}s"
+                             .format(stage=stage, **percentiles))
+        return "\n".join(lines)
+
+
+class _BatchFile:
+
+    def __init__(self, input_path: str, output_path: str):
+        self.input_path = input_path
+        self.output_path = output_path
+        self.started_at = time.monotonic()
+        self.submitted_at = None
+
+
+class _BatchRun:
+    """
+    State of a single run: the stage executors, the poller, the journal and the counters.
+    """
+
+    def __init__(self, runner: 'BatchRunner', journal: BatchJournal):
+        self.runner = runner
+        self.journal = journal
+        self.upload_executor = ThreadPoolExecutor(runner._upload_workers,
+                                                  thread_name_prefix="pdfservices-upload")
+        self.submit_executor = ThreadPoolExecutor(runner._submit_workers,
+                                                  thread_name_prefix="pdfservices-submit")
+        self.download_executor = ThreadPoolExecutor(runner._download_workers,
+                                                    thread_name_prefix="pdfservices-download")
+        self.poller = JobPoller(runner._pdf_services, max_workers=runner._poll_workers)
+        self.condition = threading.Condition()
+        self.in_flight = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.latencies = {stage: [] for stage in BatchSummary.STAGES}
+
+    def start(self, batch_file: _BatchFile, polling_url: Optional[str]):
+        with self.condition:
+            while self.in_flight >= self.runner._max_in_flight:
+                self.condition.wait()
+            self.in_flight += 1
+        if polling_url is not None:
+            self.poll(batch_file, polling_url)
+        else:
+            self.upload_executor.submit(self.guard, self.upload, batch_file)
+
+    def guard(self, stage, batch_file: _BatchFile, *args):
+        try:
+            stage(batch_file, *args)
+        except Exception as ex:
+            self.fail(batch_file, ex)
+
+    def upload(self, batch_file: _BatchFile):
+        started_at = time.monotonic()
+        asset = self.runner._pdf_services.upload_file(batch_file.input_path,
+                                                      self.runner._get_mime_type(batch_file.input_path))
+        self.record("upload", started_at)
+        self.submit_executor.submit(self.guard, self.submit, batch_file, asset)
+
+    def submit(self, batch_file: _BatchFile, asset):
+        started_at = time.monotonic()
+        polling_url = self.runner._pdf_services.submit(self.runner._job_factory(asset))
+        self.record("submit", started_at)
+        self.journal.set_submitted(batch_file.input_path, polling_url)
+        self.poll(batch_file, polling_url)
+
+    def poll(self, batch_file: _BatchFile, polling_url: str):
+        batch_file.submitted_at = time.monotonic()
+        self.poller.poll(polling_url, self.runner._result_type,
+                         callback=lambda future: self.guard(self.on_polled, batch_file, future))
+
+    def on_polled(self, batch_file: _BatchFile, future: Future):
+        if future.cancelled():
+            # the run was interrupted, the job stays journaled as submitted
+            self.finish(batch_file, succeeded=False)
+            return
+        pdf_services_response = future.result()
+        self.record("job", batch_file.submitted_at)
+        self.download_executor.submit(self.guard, self.download, batch_file, pdf_services_response)
+
+    def download(self, batch_file: _BatchFile, pdf_services_response):
+        started_at = time.monotonic()
+        os.makedirs(os.path.dirname(batch_file.output_path), exist_ok=True)
+        if self.runner._result_processor is not None:
+            future = self.runner._result_processor.process(pdf_services_response.get_result().get_asset(),
+                                                           args=(batch_file.output_path,))
+            self.record("download", started_at)
+            processing_started_at = time.monotonic()
+            future.add_done_callback(lambda f: self.guard(self.on_processed, batch_file, f, processing_started_at))
+            return
+        self.runner._pdf_services.get_content_to_path(pdf_services_response.get_result().get_asset(),
+                                                      batch_file.output_path)
+        self.record("download", started_at)
+        self.journal.set_done(batch_file.input_path, batch_file.output_path)
+        self.finish(batch_file, succeeded=True)
+
+    def on_processed(self, batch_file: _BatchFile, future: Future, started_at: float):
+        # raises the exception of the post-processor, if any
+        future.result()
+        self.record("process", started_at)
+        self.journal.set_done(batch_file.input_path, batch_file.output_path)
+        self.finish(batch_file, succeeded=True)
+
+    def fail(self, batch_file: _BatchFile, ex: Exception):
+        error = "{type}: {message}".format(type=type(ex).__name__, message=ex)
+        self.runner._logger.warning("Processing {path} failed with {error}".format(path=batch_file.input_path,
+                                                                                  error=error))
+        try:
+            self.journal.set_failed(batch_file.input_path, error)
+        finally:
+            self.finish(batch_file, succeeded=False)
+
+    def finish(self, batch_file: _BatchFile, succeeded: bool):
+        with self.condition:
+            self.latencies["total"].append(time.monotonic() - batch_file.started_at)
+            if succeeded:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    def record(self, stage: str, started_at: float):
+        with self.condition:
+            self.latencies[stage].append(time.monotonic() - started_at)
+
+    def wait(self, total: int, started_at: float):
+        with self.condition:
+            while self.in_flight > 0:
+                if not self.condition.wait(_PROGRESS_INTERVAL_SECONDS):
+                    processed = self.succeeded + self.failed
+                    self.runner._logger.info("Batch progress: {processed}/{total} files processed, {failed} failed, "
+                                             "{throughput:.2f} files/s"
+                                             .format(processed=processed, total=total, failed=self.failed,
+                                                     throughput=processed / (time.monotonic() - started_at)))
+
+    def close(self):
+        self.poller.close()
+        for executor in (self.upload_executor, self.submit_executor, self.download_executor):
+            executor.shutdown(cancel_futures=True)
+        self.journal.close()
+
+
+class BatchRunner:
+    """
+    Runs a job on each file matching a glob and writes the results to an output directory.
+
+    Files go through separately bounded stages: upload, submit, polling by a shared
+    :class:`JobPoller<adobe.pdfservices.operation.job_poller.JobPoller>`, and download. At most :samp:`max_in_flight`
+    files are between upload and download at any time, so uploaded assets do not expire while waiting.
+
+    With a :class:`ResultProcessor<adobe.pdfservices.operation.result_processor.ResultProcessor>`, the results are
+    not written as downloaded but handed through shared memory to its worker processes, with the output path of each
+    file as the extra argument of the post-processor, which is then responsible for writing the output.
+
+    Progress is recorded in a SQLite journal. A run started again with the same journal skips the files whose result
+    was written, reattaches to the jobs which were submitted, and retries the files which failed.
+
+    Sample usage.
+
+    .. code-block:: python
+
+        batch_runner = BatchRunner(pdf_services,
+                                   lambda asset: CompressPDFJob(asset),
+                                   CompressPDFResult,
+                                   "output/")
+        summary = batch_runner.run("input/**/*.pdf")
+        print(summary)
+    """
+
+    @enforce_types
+    def __init__(self, pdf_services: PDFServices, job_factory: Callable, result_type: PDFServicesJobResult.__class__,
+                 output_dir: str, *,
+                 journal_path: Optional[str] = None,
+                 mime_type: Optional[str] = None,
+                 output_extension: Optional[str] = None,
+                 upload_workers: int = 4,
+                 submit_workers: int = 4,
+                 poll_workers: int = 4,
+                 download_workers: int = 4,
+                 max_in_flight: int = 100,
+                 result_processor: Optional[ResultProcessor] = None):
+        """
+        Constructs a new :samp:`BatchRunner`.
+
+        :param pdf_services: PDFServices instance used to run the jobs; can not be None.
+        :type pdf_services: PDFServices
+        :param job_factory: Job class, or callable creating the job, called with the uploaded asset of each file;
+            can not be None.
+        :type job_factory: Callable
+        :param result_type: result class of the job, with a single result asset; can not be None.
+        :type result_type: PDFServicesJobResult.__class__
+        :param output_dir: Directory in which the results are written, with the paths of the input files relative to
+            their common directory; can not be None.
+        :type output_dir: str
+        :param journal_path: Path of the SQLite journal. Default value is a journal file in the output directory.
+            (Optional, use key-value)
+        :type journal_path: str
+        :param mime_type: Mime type of the input files. Default value is the mime type of the extension of each file.
+            (Optional, use key-value)
+        :type mime_type: str
+        :param output_extension: Extension of the result files, e.g. :samp:`".docx"`. Default value is the
+            extension of the input file. (Optional, use key-value)
+        :type output_extension: str
+        :param upload_workers: Number of files uploaded concurrently. Default value is 4. (Optional, use key-value)
+        :type upload_workers: int
+        :param submit_workers: Number of jobs submitted concurrently. Default value is 4. (Optional, use key-value)
+        :type submit_workers: int
+        :param poll_workers: Number of job status polls issued concurrently. Default value is 4.
+            (Optional, use key-value)
+        :type poll_workers: int
+        :param download_workers: Number of results downloaded concurrently. Default value is 4.
+            (Optional, use key-value)
+        :type download_workers: int
+        :param max_in_flight: Maximum number of files being processed at once. Default value is 100.
+            (Optional, use key-value)
+        :type max_in_flight: int
+        :param result_processor: Post-processes the result of each file in worker processes, instead of writing it
+            to the output path. The result processor is not closed by the batch runner. (Optional, use key-value)
+        :type result_processor: ResultProcessor
+        """
+        ObjectUtil.require_not_null(job_factory, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Job factory"))
+        ObjectUtil.require_not_null(result_type,
+                                    CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Result class object"))
+        if StringUtil.is_blank(output_dir):
+            raise ValueError(CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE_OR_EMPTY.format("Output directory"))
+        if not hasattr(result_type, 'get_asset'):
+            raise ValueError("Only jobs with a single result asset can be run in batches.")
+        for name, value in (("upload workers", upload_workers), ("submit workers", submit_workers),
+                            ("poll workers", poll_workers), ("download workers", download_workers),
+                            ("max in flight", max_in_flight)):
+            if value <= 0:
+                raise ValueError("Invalid value for {name} {value}. Must be valid integer greater than 0"
+                                 .format(name=name, value=value))
+        self._pdf_services = pdf_services
+        self._job_factory = job_factory
+        self._result_type = result_type
+        self._output_dir = output_dir
+        self._journal_path = journal_path or os.path.join(output_dir, _JOURNAL_FILE_NAME)
+        self._mime_type = mime_type
+        self._output_extension = output_extension
+        self._upload_workers = upload_workers
+        self._submit_workers = submit_workers
+        self._poll_workers = poll_workers
+        self._download_workers = download_workers
+        self._max_in_flight = max_in_flight
+        self._result_processor = result_processor
+        self._logger = logging.getLogger(__name__)
+
+    @enforce_types
+    def run(self, input_glob: str) -> BatchSummary:
+        """
+        Processes the files matching the glob and blocks until they are all done or failed.
+
+        :param input_glob: Glob of the input files, :samp:`**` matches any number of directories; can not be None.
+        :type input_glob: str
+        :return: Summary of the run.
+        :rtype: BatchSummary
+        """
+        if StringUtil.is_blank(input_glob):
+            raise ValueError(CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE_OR_EMPTY.format("Input glob"))
+        input_paths = sorted(os.path.abspath(path) for path in glob.glob(input_glob, recursive=True)
+                             if os.path.isfile(path))
+        root_dir = os.path.commonpath([os.path.dirname(path) for path in input_paths]) if input_paths else None
+
+        started_at = time.monotonic()
+        journal = BatchJournal(self._journal_path)
+        entries = journal.get_entries()
+        batch_run = _BatchRun(self, journal)
+        skipped = 0
+        try:
+            for input_path in input_paths:
+                entry = entries.get(input_path)
+                if entry is not None and entry['state'] == BatchJournal.DONE and os.path.exists(entry['output_path']):
+                    skipped += 1
+                    continue
+                polling_url = entry['polling_url'] if entry is not None and \
+                    entry['state'] == BatchJournal.SUBMITTED else None
+                batch_run.start(_BatchFile(input_path, self.__get_output_path(input_path, root_dir)), polling_url)
+            batch_run.wait(len(input_paths) - skipped, started_at)
+        finally:
+            batch_run.close()
+
+        summary = BatchSummary(len(input_paths), batch_run.succeeded, batch_run.failed, skipped,
+                               time.monotonic() - started_at, batch_run.latencies)
+        self._logger.info("Batch run finished: {summary}".format(summary=summary))
+        return summary
+
+    def _get_mime_type(self, input_path: str) -> str:
+        if self._mime_type is not None:
+            return self._mime_type
+        extension = os.path.splitext(input_path)[1][1:].upper()
+        if extension not in PDFServicesMediaType.__members__:
+            raise SdkException("Unknown mime type of {path}, it must be given to the batch runner."
+                               .format(path=input_path))
+        return PDFServicesMediaType[extension].value
+
+    def __get_output_path(self, input_path: str, root_dir: str) -> str:
+        output_path = os.path.join(self._output_dir, os.path.relpath(input_path, root_dir))
+        if self._output_extension is not None:
+            output_path = os.path.splitext(output_path)[0] + self._output_extension
+        return output_path
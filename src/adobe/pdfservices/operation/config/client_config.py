@@ -11,11 +11,18 @@
 # from Adobe.
 
 import json
+from typing import Optional
 
 from adobe.pdfservices.operation.config.proxy.proxy_server_config import ProxyServerConfig
+from adobe.pdfservices.operation.config.rate_limit_config import RateLimitConfig
+from adobe.pdfservices.operation.config.result_cache_config import ResultCacheConfig
+from adobe.pdfservices.operation.config.retry_config import RetryConfig
+from adobe.pdfservices.operation.config.transport_type import TransportType
+from adobe.pdfservices.operation.config.upload_cache_config import UploadCacheConfig
 from adobe.pdfservices.operation.internal.constants.custom_error_messages import CustomErrorMessages
 from adobe.pdfservices.operation.internal.constants.pdf_services_uri import PDFServicesURI
 from adobe.pdfservices.operation.internal.constants.service_constants import ServiceConstants
+from adobe.pdfservices.operation.internal.http.transport.http_transport import HttpTransport
 from adobe.pdfservices.operation.internal.util import file_utils
 from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
 from adobe.pdfservices.operation.internal.util.string_util import StringUtil
@@ -38,13 +45,40 @@ class ClientConfig:
     _PROXY_CREDENTIALS = "usernamePasswordCredentials"
     _PROXY_USERNAME = "username"
     _PROXY_PASSWORD = "password"
+    _POOL_CONNECTIONS_KEY = "poolConnections"
+    _POOL_MAXSIZE_KEY = "poolMaxsize"
+    _KEEP_ALIVE_KEY = "keepAlive"
+    _TRANSPORT_TYPE_KEY = "transportType"
+    _RETRY_CONFIG = "retryConfig"
+    _MAX_WORKERS_KEY = "maxWorkers"
+    _MAX_UPLOAD_WORKERS_KEY = "maxUploadWorkers"
+    _MAX_DELETE_WORKERS_KEY = "maxDeleteWorkers"
+    _TOKEN_CACHE_DIR_KEY = "tokenCacheDir"
+    _RATE_LIMIT_CONFIG = "rateLimitConfig"
+    _UPLOAD_CACHE_CONFIG = "uploadCacheConfig"
+    _RESULT_CACHE_CONFIG = "resultCacheConfig"
+    _JOB_JOURNAL_PATH_KEY = "jobJournalPath"
 
     @enforce_types
     def __init__(self, *,
                  connect_timeout: int = ServiceConstants.HTTP_CONNECT_TIMEOUT,
                  read_timeout: int = ServiceConstants.HTTP_READ_TIMEOUT,
                  region: Region = Region.US,
-                 proxy_server_config: ProxyServerConfig = None):
+                 proxy_server_config: ProxyServerConfig = None,
+                 pool_connections: int = ServiceConstants.HTTP_POOL_CONNECTIONS,
+                 pool_maxsize: int = ServiceConstants.HTTP_POOL_MAXSIZE,
+                 keep_alive: bool = True,
+                 transport_type: TransportType = TransportType.REQUESTS,
+                 transport: Optional[HttpTransport] = None,
+                 retry_config: Optional[RetryConfig] = None,
+                 max_workers: int = ServiceConstants.MAX_WORKERS,
+                 max_upload_workers: int = ServiceConstants.MAX_UPLOAD_WORKERS,
+                 max_delete_workers: int = ServiceConstants.MAX_DELETE_WORKERS,
+                 token_cache_dir: Optional[str] = None,
+                 rate_limit_config: Optional[RateLimitConfig] = None,
+                 upload_cache_config: Optional[UploadCacheConfig] = None,
+                 result_cache_config: Optional[ResultCacheConfig] = None,
+                 job_journal_path: Optional[str] = None):
         """
         Constructs an instance of :samp:`ClientConfig`.
 
@@ -59,11 +93,71 @@ class ClientConfig:
         :type region: Region
         :param proxy_server_config: Sets the configuration for proxy server.
         :type proxy_server_config: ProxyServerConfig
+        :param pool_connections: Number of per-host connection pools kept by the HTTP session.
+            Default value is 10.
+        :type pool_connections: int
+        :param pool_maxsize: Maximum number of connections kept alive in each pool. Should be at least the number of
+            threads issuing requests concurrently. Default value is 10.
+        :type pool_maxsize: int
+        :param keep_alive: Whether connections are kept alive and reused across API calls. Default value is True.
+        :type keep_alive: bool
+        :param transport_type: HTTP transport used for the API calls. Default value is REQUESTS.
+        :type transport_type: TransportType
+        :param transport: Custom transport instance used for the API calls; takes precedence over transport_type.
+            Mainly intended for tests, e.g.
+            :class:`FakeTransport<adobe.pdfservices.operation.internal.http.transport.fake_transport.FakeTransport>`.
+            It is shared by all the instances created with this configuration and is not closed when they are closed;
+            the caller owns it and closes it when done.
+        :type transport: HttpTransport
+        :param retry_config: Retry policy for transient failures. Requests are not retried if not provided.
+        :type retry_config: RetryConfig
+        :param max_workers: Number of worker threads of the executor used by :samp:`PDFServices` for the jobs run
+            with :samp:`execute` and :samp:`submit_async`. Default value is 10.
+        :type max_workers: int
+        :param max_upload_workers: Number of worker threads of the executor used by :samp:`PDFServices` to upload
+            the assets of :samp:`upload_assets`, :samp:`iter_upload_assets` and :samp:`try_upload_assets`. Default
+            value is 10.
+        :type max_upload_workers: int
+        :param max_delete_workers: Number of worker threads of the executor used by :samp:`PDFServices` to delete
+            the assets of :samp:`delete_assets`, :samp:`delete_assets_in_background` and the intermediate assets of
+            pipelines. Default value is 10.
+        :type max_delete_workers: int
+        :param token_cache_dir: Directory of a cache in which the access token is shared by all the processes using
+            the same credentials on a node, so that only one of them requests a new token. The token is not shared
+            if not provided.
+        :type token_cache_dir: str
+        :param rate_limit_config: Client-side rate limits for the API requests. Requests are not rate limited if not
+            provided.
+        :type rate_limit_config: RateLimitConfig
+        :param upload_cache_config: Cache of uploaded content, to reuse the cloud asset of content uploaded before.
+            Uploads are not cached if not provided.
+        :type upload_cache_config: UploadCacheConfig
+        :param result_cache_config: Cache of job results, to reuse the result of jobs run before with the same input
+            content, operation and parameters. Results are not cached if not provided.
+        :type result_cache_config: ResultCacheConfig
+        :param job_journal_path: Path of a SQLite journal in which submitted jobs are recorded until their result is
+            retrieved, so that they can be recovered with :samp:`PDFServices.recover_jobs` after a restart. Jobs are
+            not journaled if not provided.
+        :type job_journal_path: str
         """
         self._connect_timeout = connect_timeout
         self._read_timeout = read_timeout
         self._pdf_services_uri = PDFServicesURI.get_uri_for_region(region)
         self._proxy_server_config = proxy_server_config
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._keep_alive = keep_alive
+        self._transport_type = transport_type
+        self._transport = transport
+        self._retry_config = retry_config
+        self._max_workers = max_workers
+        self._max_upload_workers = max_upload_workers
+        self._max_delete_workers = max_delete_workers
+        self._token_cache_dir = token_cache_dir
+        self._rate_limit_config = rate_limit_config
+        self._upload_cache_config = upload_cache_config
+        self._result_cache_config = result_cache_config
+        self._job_journal_path = job_journal_path
 
     def get_pdf_services_uri(self):
         """
@@ -93,6 +187,104 @@ class ClientConfig:
         """
         return self._proxy_server_config
 
+    def get_pool_connections(self):
+        """
+        :return: Number of per-host connection pools.
+        :rtype: int
+        """
+        return self._pool_connections
+
+    def get_pool_maxsize(self):
+        """
+        :return: Maximum number of connections kept alive in each pool.
+        :rtype: int
+        """
+        return self._pool_maxsize
+
+    def is_keep_alive(self):
+        """
+        :return: Whether connections are kept alive and reused across API calls.
+        :rtype: bool
+        """
+        return self._keep_alive
+
+    def get_transport_type(self):
+        """
+        :return: HTTP transport type.
+        :rtype: TransportType
+        """
+        return self._transport_type
+
+    def get_transport(self):
+        """
+        :return: Custom transport instance, if any.
+        :rtype: HttpTransport
+        """
+        return self._transport
+
+    def get_retry_config(self):
+        """
+        :return: Retry policy for transient failures, if any.
+        :rtype: RetryConfig
+        """
+        return self._retry_config
+
+    def get_max_workers(self):
+        """
+        :return: Number of worker threads of the PDFServices executor.
+        :rtype: int
+        """
+        return self._max_workers
+
+    def get_max_upload_workers(self):
+        """
+        :return: Number of worker threads of the PDFServices upload executor.
+        :rtype: int
+        """
+        return self._max_upload_workers
+
+    def get_max_delete_workers(self):
+        """
+        :return: Number of worker threads of the PDFServices delete executor.
+        :rtype: int
+        """
+        return self._max_delete_workers
+
+    def get_token_cache_dir(self):
+        """
+        :return: Directory of the shared access token cache, if any.
+        :rtype: str
+        """
+        return self._token_cache_dir
+
+    def get_rate_limit_config(self):
+        """
+        :return: Client-side rate limits for the API requests, if any.
+        :rtype: RateLimitConfig
+        """
+        return self._rate_limit_config
+
+    def get_upload_cache_config(self):
+        """
+        :return: Configuration of the upload cache, if any.
+        :rtype: UploadCacheConfig
+        """
+        return self._upload_cache_config
+
+    def get_result_cache_config(self):
+        """
+        :return: Configuration of the job result cache, if any.
+        :rtype: ResultCacheConfig
+        """
+        return self._result_cache_config
+
+    def get_job_journal_path(self):
+        """
+        :return: Path of the job journal, if any.
+        :rtype: str
+        """
+        return self._job_journal_path
+
     def validate(self):
         """
         Validator for the created client config.
@@ -107,6 +299,53 @@ class ClientConfig:
                 "Invalid value for connect timeout {timeout}. Must be valid integer greater than 0".format(
                     timeout=self._connect_timeout))
 
+        if self._pool_connections <= 0:
+            raise ValueError(
+                "Invalid value for pool connections {pool_connections}. Must be valid integer greater than 0".format(
+                    pool_connections=self._pool_connections))
+
+        if self._pool_maxsize <= 0:
+            raise ValueError(
+                "Invalid value for pool maxsize {pool_maxsize}. Must be valid integer greater than 0".format(
+                    pool_maxsize=self._pool_maxsize))
+
+        if not isinstance(self._keep_alive, bool):
+            raise ValueError("Invalid value for keep alive {keep_alive}. Must be true or false"
+                             .format(keep_alive=self._keep_alive))
+
+        if self._max_workers <= 0:
+            raise ValueError(
+                "Invalid value for max workers {max_workers}. Must be valid integer greater than 0".format(
+                    max_workers=self._max_workers))
+
+        if self._max_upload_workers <= 0:
+            raise ValueError(
+                "Invalid value for max upload workers {max_upload_workers}. Must be valid integer greater than 0"
+                .format(max_upload_workers=self._max_upload_workers))
+
+        if self._max_delete_workers <= 0:
+            raise ValueError(
+                "Invalid value for max delete workers {max_delete_workers}. Must be valid integer greater than 0"
+                .format(max_delete_workers=self._max_delete_workers))
+
+        if self._token_cache_dir is not None and StringUtil.is_blank(self._token_cache_dir):
+            raise ValueError(CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE_OR_EMPTY.format("Token cache directory"))
+
+        if self._job_journal_path is not None and StringUtil.is_blank(self._job_journal_path):
+            raise ValueError(CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE_OR_EMPTY.format("Job journal path"))
+
+        if self._retry_config is not None:
+            self._retry_config.validate()
+
+        if self._rate_limit_config is not None:
+            self._rate_limit_config.validate()
+
+        if self._upload_cache_config is not None:
+            self._upload_cache_config.validate()
+
+        if self._result_cache_config is not None:
+            self._result_cache_config.validate()
+
         if self._proxy_server_config is not None:
             if int(self._proxy_server_config.get_port()) <= 0:
                 raise ValueError("Invalid value for proxy port. Must be valid integer greater than 0")
@@ -131,6 +370,15 @@ class ClientConfig:
             {
                 "connectTimeout": "4000",
                 "readTimeout": "20000",
+                "poolConnections": "10",
+                "poolMaxsize": "10",
+                "keepAlive": true,
+                "transportType": "urllib3",
+                "maxWorkers": "10",
+                "maxUploadWorkers": "10",
+                "maxDeleteWorkers": "10",
+                "tokenCacheDir": "/var/cache/pdfservices",
+                "jobJournalPath": "/var/lib/pdfservices/jobs.sqlite3",
                 "proxyServerConfig": {
                     "host": "127.0.0.1",
                     "port": "8080",
@@ -140,7 +388,25 @@ class ClientConfig:
                         "password": "password"
                         }
                 },
-                "region": "EU"
+                "region": "EU",
+                "retryConfig": {
+                    "maxAttempts": 5,
+                    "initialDelay": 500,
+                    "maxDelay": 20000
+                },
+                "rateLimitConfig": {
+                    "requestKeyRates": {"pdf_services_api": 5},
+                    "operationRates": {"ocr": 1}
+                },
+                "uploadCacheConfig": {
+                    "maxEntries": 1000,
+                    "cacheDir": "/var/cache/pdfservices/uploads",
+                    "maxDiskEntries": 10000
+                },
+                "resultCacheConfig": {
+                    "cacheDir": "/var/cache/pdfservices/results",
+                    "maxSize": 1073741824
+                }
             }
         """
         try:
@@ -151,6 +417,31 @@ class ClientConfig:
 
             self._read_timeout = int(config_dict.get(ClientConfig._READ_TIMEOUT_KEY, self._read_timeout))
 
+            self._pool_connections = int(config_dict.get(ClientConfig._POOL_CONNECTIONS_KEY, self._pool_connections))
+
+            self._pool_maxsize = int(config_dict.get(ClientConfig._POOL_MAXSIZE_KEY, self._pool_maxsize))
+
+            self._keep_alive = config_dict.get(ClientConfig._KEEP_ALIVE_KEY, self._keep_alive)
+            if not isinstance(self._keep_alive, bool):
+                raise ValueError("Invalid value for keep alive {keep_alive}. Must be true or false"
+                                 .format(keep_alive=self._keep_alive))
+
+            self._max_workers = int(config_dict.get(ClientConfig._MAX_WORKERS_KEY, self._max_workers))
+
+            self._max_upload_workers = int(config_dict.get(ClientConfig._MAX_UPLOAD_WORKERS_KEY,
+                                                           self._max_upload_workers))
+
+            self._max_delete_workers = int(config_dict.get(ClientConfig._MAX_DELETE_WORKERS_KEY,
+                                                           self._max_delete_workers))
+
+            self._token_cache_dir = config_dict.get(ClientConfig._TOKEN_CACHE_DIR_KEY, self._token_cache_dir)
+
+            self._job_journal_path = config_dict.get(ClientConfig._JOB_JOURNAL_PATH_KEY, self._job_journal_path)
+
+            transport_type_node = config_dict.get(ClientConfig._TRANSPORT_TYPE_KEY)
+            if transport_type_node:
+                self._transport_type = TransportType.get(transport_type_node)
+
             region_node = config_dict.get(ClientConfig._REGION)
             if region_node:
                 self._pdf_services_uri = PDFServicesURI.get_uri_for_region(region_node)
@@ -165,6 +456,23 @@ class ClientConfig:
             if proxy_server_config:
                 self._proxy_server_config = ProxyServerConfig("host").from_json(proxy_server_config)
 
+            retry_config = config_dict.get(ClientConfig._RETRY_CONFIG)
+            if retry_config:
+                self._retry_config = RetryConfig().from_json(retry_config)
+
+            rate_limit_config = config_dict.get(ClientConfig._RATE_LIMIT_CONFIG)
+            if rate_limit_config:
+                self._rate_limit_config = RateLimitConfig().from_json(rate_limit_config)
+
+            upload_cache_config = config_dict.get(ClientConfig._UPLOAD_CACHE_CONFIG)
+            if upload_cache_config:
+                self._upload_cache_config = UploadCacheConfig().from_json(upload_cache_config)
+
+            result_cache_config = config_dict.get(ClientConfig._RESULT_CACHE_CONFIG)
+            if result_cache_config:
+                self._result_cache_config = ResultCacheConfig(cache_dir=result_cache_config.get("cacheDir")) \
+                    .from_json(result_cache_config)
+
             return self
         except Exception as e:
             raise ValueError("Error while reading client config file: " + str(e))
@@ -10,7 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
 from typing import Dict
 
 from adobe.pdfservices.operation.config.notifier.notifier_data import NotifierData
@@ -55,4 +54,4 @@ class CallbackNotifierData(NotifierData):
         :return: Representation of CallbackNotifierData as a JSON string, used internally by the SDK.
         :rtype: str
         """
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
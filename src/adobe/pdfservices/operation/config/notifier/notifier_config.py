@@ -10,8 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
-
 from adobe.pdfservices.operation.config.notifier.notifier_data import NotifierData
 from adobe.pdfservices.operation.config.notifier.notifier_type import NotifierType
 from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
@@ -50,4 +48,4 @@ class NotifierConfig:
         :return: representation of NotifierConfig as a JSON string, used internally by the SDK.
         :rtype: str
         """
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
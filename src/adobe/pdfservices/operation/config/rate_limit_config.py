@@ -0,0 +1,158 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+from typing import Optional, Union
+
+from adobe.pdfservices.operation.internal.constants.operation_header_info_endpoint_map import \
+    OperationHeaderInfoEndpointMap
+from adobe.pdfservices.operation.internal.constants.request_key import RequestKey
+from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
+
+
+class RateLimitConfig:
+    """
+    Encapsulates the client-side rate limits applied to the API requests of a credential, to stay under the service
+    usage limits instead of failing with them.
+
+    Each limit is a token bucket refilled at the given number of requests per second. A request waiting for a permit
+    blocks the calling thread until one is available. When adaptive, a 429 response halves the rate of the buckets
+    the request went through and pauses them for the Retry-After interval; the rate then recovers linearly to the
+    configured one.
+    """
+
+    @enforce_types
+    def __init__(self, *,
+                 request_key_rates: Optional[dict] = None,
+                 operation_rates: Optional[dict] = None,
+                 burst_size: Optional[int] = None,
+                 adaptive: bool = True,
+                 recovery_interval: int = 60000):
+        """
+        Constructs an instance of :samp:`RateLimitConfig`.
+
+        :param request_key_rates: Maximum number of requests per second for a :samp:`RequestKey`, e.g.
+            :samp:`{RequestKey.PLATFORM: 5}` to limit the calls to the PDF Services API other than status polls, i.e.
+            job submissions, upload and download URI requests and asset deletions. Status polls are limited with
+            :samp:`RequestKey.STATUS`, and :samp:`operation_rates` limits only job submissions. (Optional, use
+            key-value)
+        :type request_key_rates: dict
+        :param operation_rates: Maximum number of job submissions per second for an operation endpoint, given as the
+            endpoint name, e.g. :samp:`"compresspdf"`, or as an :samp:`OperationHeaderInfoEndpointMap` member.
+            (Optional, use key-value)
+        :type operation_rates: dict
+        :param burst_size: Number of requests which can be sent at once after the limit was not used for a while.
+            Default value is the rate of each limit, with a minimum of 1. (Optional, use key-value)
+        :type burst_size: int
+        :param adaptive: Whether rates are lowered when 429 responses are received. Default value is True.
+            (Optional, use key-value)
+        :type adaptive: bool
+        :param recovery_interval: Time in milliseconds for a lowered rate to recover to the configured one. Default
+            value is 60000 milliseconds. (Optional, use key-value)
+        :type recovery_interval: int
+        """
+        self._request_key_rates = {RequestKey(key): rate for key, rate in (request_key_rates or {}).items()}
+        self._operation_rates = {self.__get_endpoint(operation): rate
+                                 for operation, rate in (operation_rates or {}).items()}
+        self._burst_size = burst_size
+        self._adaptive = adaptive
+        self._recovery_interval = recovery_interval
+
+    @staticmethod
+    def __get_endpoint(operation):
+        if isinstance(operation, OperationHeaderInfoEndpointMap):
+            return operation.value[1]
+        return operation
+
+    def get_request_key_rates(self):
+        """
+        :return: Maximum number of requests per second for each request key.
+        :rtype: dict
+        """
+        return self._request_key_rates
+
+    def get_operation_rates(self):
+        """
+        :return: Maximum number of job submissions per second for each operation endpoint.
+        :rtype: dict
+        """
+        return self._operation_rates
+
+    def get_burst_size(self):
+        """
+        :return: Number of requests which can be sent at once, if set.
+        :rtype: int
+        """
+        return self._burst_size
+
+    def is_adaptive(self):
+        """
+        :return: Whether rates are lowered when 429 responses are received.
+        :rtype: bool
+        """
+        return self._adaptive
+
+    def get_recovery_interval(self):
+        """
+        :return: Time for a lowered rate to recover, in seconds.
+        :rtype: float
+        """
+        return self._recovery_interval / 1000
+
+    def validate(self):
+        """
+        Validator for the created rate limit config.
+        """
+        for key, rate in list(self._request_key_rates.items()) + list(self._operation_rates.items()):
+            if not isinstance(rate, (int, float)) or rate <= 0:
+                raise ValueError("Invalid rate {rate} for {key}. Must be a number greater than 0"
+                                 .format(rate=rate, key=key))
+        if self._burst_size is not None and self._burst_size < 1:
+            raise ValueError("Invalid value for burst size {burst_size}. Must be valid integer greater than 0"
+                             .format(burst_size=self._burst_size))
+        if self._recovery_interval < 0:
+            raise ValueError("Recovery interval must not be negative")
+        if not isinstance(self._adaptive, bool):
+            raise ValueError("Invalid value for adaptive {adaptive}. Must be true or false"
+                             .format(adaptive=self._adaptive))
+
+    def from_json(self, json_data: dict):
+        """
+        Creates a rate limit config instance from a json file.
+
+        .. code-block:: JSON
+
+            {
+            "rateLimitConfig": {
+                    "requestKeyRates": {"pdf_services_api": 5, "upload": 20},
+                    "operationRates": {"ocr": 1},
+                    "burstSize": 5,
+                    "adaptive": true,
+                    "recoveryInterval": 60000
+                },
+            }
+
+        :param json_data: A dictionary containing rate limit config in the specified format.
+        :type json_data: dict
+        """
+        if json_data.get("requestKeyRates") is not None:
+            self._request_key_rates = {RequestKey(key): float(rate)
+                                       for key, rate in json_data.get("requestKeyRates").items()}
+        if json_data.get("operationRates") is not None:
+            self._operation_rates = {operation: float(rate) for operation, rate in json_data.get("operationRates").items()}
+        if json_data.get("burstSize") is not None:
+            self._burst_size = int(json_data.get("burstSize"))
+        self._adaptive = json_data.get("adaptive", self._adaptive)
+        if not isinstance(self._adaptive, bool):
+            raise ValueError("Invalid value for adaptive {adaptive}. Must be true or false"
+                             .format(adaptive=self._adaptive))
+        self._recovery_interval = int(json_data.get("recoveryInterval", self._recovery_interval))
+        return self
@@ -0,0 +1,91 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+from adobe.pdfservices.operation.internal.constants.custom_error_messages import CustomErrorMessages
+from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
+from adobe.pdfservices.operation.internal.util.string_util import StringUtil
+
+
+class ResultCacheConfig:
+    """
+    Encapsulates the configuration of the job result cache, which returns the result of a job run before with the
+    same input content, operation and parameters instead of submitting it again.
+
+    Results are kept in files of the cache directory, shared by all the processes using it, and the least recently
+    used ones are evicted when their total size exceeds the maximum size. Result assets are downloaded when the job
+    is done, and their content is then served from the cache. Result assets served from the cache are local only,
+    without an asset id, as the service deletes its copy after 24 hours; they are uploaded again when used as the
+    input of a job, and deleting them does nothing.
+
+    Only jobs whose inputs are cloud assets uploaded with the :samp:`PDFServices` instance, and which do not use
+    notifiers or external storage, are cached.
+    """
+
+    @enforce_types
+    def __init__(self, *,
+                 cache_dir: str,
+                 max_size: int = 1024 * 1024 * 1024):
+        """
+        Constructs an instance of :samp:`ResultCacheConfig`.
+
+        :param cache_dir: Directory in which the results are kept; can not be None. (use key-value)
+        :type cache_dir: str
+        :param max_size: Maximum total size in bytes of the cached results. Default value is 1 GiB.
+            (Optional, use key-value)
+        :type max_size: int
+        """
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+
+    def get_cache_dir(self):
+        """
+        :return: Directory in which the results are kept.
+        :rtype: str
+        """
+        return self._cache_dir
+
+    def get_max_size(self):
+        """
+        :return: Maximum total size in bytes of the cached results.
+        :rtype: int
+        """
+        return self._max_size
+
+    def validate(self):
+        """
+        Validator for the created result cache config.
+        """
+        if StringUtil.is_blank(self._cache_dir):
+            raise ValueError(CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE_OR_EMPTY.format("Result cache directory"))
+        if self._max_size <= 0:
+            raise ValueError("Invalid value for max size {max_size}. Must be valid integer greater than 0"
+                             .format(max_size=self._max_size))
+
+    def from_json(self, json_data: dict):
+        """
+        Creates a result cache config instance from a json file.
+
+        .. code-block:: JSON
+
+            {
+            "resultCacheConfig": {
+                    "cacheDir": "/var/cache/pdfservices/results",
+                    "maxSize": 1073741824
+                },
+            }
+
+        :param json_data: A dictionary containing result cache config in the specified format.
+        :type json_data: dict
+        """
+        self._cache_dir = json_data.get("cacheDir", self._cache_dir)
+        self._max_size = int(json_data.get("maxSize", self._max_size))
+        return self
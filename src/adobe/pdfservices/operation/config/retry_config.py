@@ -0,0 +1,193 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+from typing import Optional, Union
+
+from adobe.pdfservices.operation.internal.constants.request_key import RequestKey
+from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
+
+
+class RetryConfig:
+    """
+    Encapsulates the retry policy applied to transient API failures, i.e. service usage limits (429) and gateway
+    errors (502, 503, 504) as well as network errors.
+
+    Requests which are not idempotent, such as job submission, are retried only when the failure guarantees that the
+    request was not processed (429 and 503). The same request id is sent on every attempt.
+    """
+
+    DEFAULT_RETRYABLE_STATUS_CODES = [429, 502, 503, 504]
+    """
+    Represents the status codes retried by default.
+    """
+
+    DEFAULT_RETRYABLE_REQUEST_KEYS = [RequestKey.STATUS, RequestKey.PLATFORM, RequestKey.UPLOAD, RequestKey.DOWNLOAD,
+                                      RequestKey.AUTHN]
+    """
+    Represents the request types retried by default.
+    """
+
+    @enforce_types
+    def __init__(self, *,
+                 max_attempts: int = 3,
+                 initial_delay: int = 1000,
+                 max_delay: int = 30000,
+                 backoff_multiplier: Union[int, float] = 2,
+                 jitter: Union[int, float] = 0.5,
+                 honor_retry_after: bool = True,
+                 retryable_status_codes: Optional[list] = None,
+                 retryable_request_keys: Optional[list] = None):
+        """
+        Constructs an instance of :samp:`RetryConfig`.
+
+        :param max_attempts: Maximum number of attempts for a request, including the first one. Default value is 3.
+        :type max_attempts: int
+        :param initial_delay: Delay in milliseconds before the first retry. Default value is 1000 milliseconds.
+        :type initial_delay: int
+        :param max_delay: Upper bound in milliseconds for the delay between two attempts, including delays requested
+            through the Retry-After header. Default value is 30000 milliseconds.
+        :type max_delay: int
+        :param backoff_multiplier: Factor by which the delay grows after every attempt. Default value is 2.
+        :type backoff_multiplier: float
+        :param jitter: Fraction of the delay, between 0 and 1, which is randomly subtracted from it so that
+            concurrent clients do not retry in lockstep. Default value is 0.5.
+        :type jitter: float
+        :param honor_retry_after: Whether the Retry-After response header is used as the minimum delay. Default
+            value is True.
+        :type honor_retry_after: bool
+        :param retryable_status_codes: HTTP status codes to retry. Default value is
+            :samp:`DEFAULT_RETRYABLE_STATUS_CODES`.
+        :type retryable_status_codes: list
+        :param retryable_request_keys: :samp:`RequestKey` values of the requests to retry. Default value is
+            :samp:`DEFAULT_RETRYABLE_REQUEST_KEYS`.
+        :type retryable_request_keys: list
+        """
+        self._max_attempts = max_attempts
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._backoff_multiplier = backoff_multiplier
+        self._jitter = jitter
+        self._honor_retry_after = honor_retry_after
+        self._retryable_status_codes = frozenset(retryable_status_codes if retryable_status_codes is not None
+                                                 else self.DEFAULT_RETRYABLE_STATUS_CODES)
+        self._retryable_request_keys = frozenset(retryable_request_keys if retryable_request_keys is not None
+                                                 else self.DEFAULT_RETRYABLE_REQUEST_KEYS)
+
+    def get_max_attempts(self):
+        """
+        :return: Maximum number of attempts for a request.
+        :rtype: int
+        """
+        return self._max_attempts
+
+    def get_initial_delay(self):
+        """
+        :return: Delay before the first retry, in seconds.
+        :rtype: float
+        """
+        return self._initial_delay / 1000
+
+    def get_max_delay(self):
+        """
+        :return: Upper bound for the delay between two attempts, in seconds.
+        :rtype: float
+        """
+        return self._max_delay / 1000
+
+    def get_backoff_multiplier(self):
+        """
+        :return: Factor by which the delay grows after every attempt.
+        :rtype: float
+        """
+        return self._backoff_multiplier
+
+    def get_jitter(self):
+        """
+        :return: Fraction of the delay which is randomly subtracted from it.
+        :rtype: float
+        """
+        return self._jitter
+
+    def is_honor_retry_after(self):
+        """
+        :return: Whether the Retry-After response header is honored.
+        :rtype: bool
+        """
+        return self._honor_retry_after
+
+    def get_retryable_status_codes(self):
+        """
+        :return: HTTP status codes which are retried.
+        :rtype: frozenset
+        """
+        return self._retryable_status_codes
+
+    def get_retryable_request_keys(self):
+        """
+        :return: Request keys of the requests which are retried.
+        :rtype: frozenset
+        """
+        return self._retryable_request_keys
+
+    def validate(self):
+        """
+        Validator for the created retry config.
+        """
+        if self._max_attempts < 1:
+            raise ValueError("Invalid value for max attempts {max_attempts}. Must be valid integer greater than 0"
+                             .format(max_attempts=self._max_attempts))
+        if self._initial_delay < 0 or self._max_delay < 0:
+            raise ValueError("Retry delays must not be negative")
+        if self._backoff_multiplier < 1:
+            raise ValueError("Invalid value for backoff multiplier {multiplier}. Must be greater than or equal to 1"
+                             .format(multiplier=self._backoff_multiplier))
+        if not 0 <= self._jitter <= 1:
+            raise ValueError("Invalid value for jitter {jitter}. Must be between 0 and 1".format(jitter=self._jitter))
+        if not isinstance(self._honor_retry_after, bool):
+            raise ValueError("Invalid value for honor retry after {honor_retry_after}. Must be true or false"
+                             .format(honor_retry_after=self._honor_retry_after))
+
+    def from_json(self, json_data: dict):
+        """
+        Creates a retry config instance from a json file.
+
+        .. code-block:: JSON
+
+            {
+            "retryConfig": {
+                    "maxAttempts": 5,
+                    "initialDelay": 500,
+                    "maxDelay": 20000,
+                    "backoffMultiplier": 2,
+                    "jitter": 0.5,
+                    "honorRetryAfter": true,
+                    "retryableStatusCodes": [429, 503]
+                },
+            }
+
+        :param json_data: A dictionary containing retry config in the specified format.
+        :type json_data: dict
+        """
+        self._max_attempts = int(json_data.get("maxAttempts", self._max_attempts))
+        self._initial_delay = int(json_data.get("initialDelay", self._initial_delay))
+        self._max_delay = int(json_data.get("maxDelay", self._max_delay))
+        self._backoff_multiplier = float(json_data.get("backoffMultiplier", self._backoff_multiplier))
+        self._jitter = float(json_data.get("jitter", self._jitter))
+        self._honor_retry_after = json_data.get("honorRetryAfter", self._honor_retry_after)
+        if not isinstance(self._honor_retry_after, bool):
+            raise ValueError("Invalid value for honor retry after {honor_retry_after}. Must be true or false"
+                             .format(honor_retry_after=self._honor_retry_after))
+        if json_data.get("retryableStatusCodes") is not None:
+            self._retryable_status_codes = frozenset(int(code) for code in json_data.get("retryableStatusCodes"))
+        if json_data.get("retryableRequestKeys") is not None:
+            self._retryable_request_keys = frozenset(RequestKey(key) for key in json_data.get("retryableRequestKeys"))
+        return self
@@ -0,0 +1,52 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+from enum import Enum
+
+
+class TransportType(Enum):
+    """
+    Supported HTTP transports for
+    :class:`ClientConfig<adobe.pdfservices.operation.config.client_config.ClientConfig>`.
+    """
+
+    REQUESTS = "requests"
+    """
+    Represents the connection-pooled transport backed by requests.
+    """
+
+    URLLIB3 = "urllib3"
+    """
+    Represents the connection-pooled transport backed directly by urllib3.
+    """
+
+    def __str__(self):
+        """
+        :return: String representation of transport type.
+        :rtype: str
+        """
+        return self.value
+
+    @classmethod
+    def get(cls, transport_type):
+        """
+        Returns the instance of :samp:`TransportType` for the input string.
+
+        :param transport_type: String value of the transport type.
+        :type transport_type: str
+        :return: the instance of TransportType for the input string.
+        :rtype: TransportType
+        """
+        for transport in cls:
+            if transport.value == transport_type.lower():
+                return transport
+        raise ValueError(f"Invalid value for transport type {transport_type}")
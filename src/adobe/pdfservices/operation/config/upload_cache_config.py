@@ -0,0 +1,125 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+from typing import Optional
+
+from adobe.pdfservices.operation.internal.constants.custom_error_messages import CustomErrorMessages
+from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
+from adobe.pdfservices.operation.internal.util.string_util import StringUtil
+
+
+class UploadCacheConfig:
+    """
+    Encapsulates the configuration of the upload cache, which reuses the cloud asset of content uploaded before
+    instead of uploading the same content again.
+
+    Uploads are identified by a hash of their content and media type, per credential and region. Entries are kept in
+    an in-memory LRU cache and, if a cache directory is given, in files shared by all the processes using it. They
+    expire before the service deletes the uploaded assets, and are invalidated when the asset is deleted with
+    :samp:`PDFServices.delete_asset`.
+
+    Only content which can be read twice is cached, i.e. files, bytes and seekable streams.
+    """
+
+    @enforce_types
+    def __init__(self, *,
+                 max_entries: int = 1000,
+                 ttl: int = 82800000,
+                 cache_dir: Optional[str] = None,
+                 max_disk_entries: int = 10000):
+        """
+        Constructs an instance of :samp:`UploadCacheConfig`.
+
+        :param max_entries: Maximum number of uploads kept in memory. Default value is 1000. (Optional, use key-value)
+        :type max_entries: int
+        :param ttl: Time in milliseconds after which a cached upload expires. Must be lower than the retention of
+            uploaded assets by the service, 24 hours. Default value is 82800000 milliseconds (23 hours).
+            (Optional, use key-value)
+        :type ttl: int
+        :param cache_dir: Directory in which the cached uploads are also kept, to be shared across processes and
+            restarts. Uploads are only cached in memory if not provided. (Optional, use key-value)
+        :type cache_dir: str
+        :param max_disk_entries: Maximum number of uploads kept in the cache directory; the least recently cached
+            ones are removed beyond it. Default value is 10000. (Optional, use key-value)
+        :type max_disk_entries: int
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._cache_dir = cache_dir
+        self._max_disk_entries = max_disk_entries
+
+    def get_max_entries(self):
+        """
+        :return: Maximum number of uploads kept in memory.
+        :rtype: int
+        """
+        return self._max_entries
+
+    def get_ttl(self):
+        """
+        :return: Time after which a cached upload expires, in seconds.
+        :rtype: float
+        """
+        return self._ttl / 1000
+
+    def get_cache_dir(self):
+        """
+        :return: Directory in which the cached uploads are kept, if any.
+        :rtype: str
+        """
+        return self._cache_dir
+
+    def get_max_disk_entries(self):
+        """
+        :return: Maximum number of uploads kept in the cache directory.
+        :rtype: int
+        """
+        return self._max_disk_entries
+
+    def validate(self):
+        """
+        Validator for the created upload cache config.
+        """
+        if self._max_entries <= 0:
+            raise ValueError("Invalid value for max entries {max_entries}. Must be valid integer greater than 0"
+                             .format(max_entries=self._max_entries))
+        if self._ttl <= 0:
+            raise ValueError("Invalid value for ttl {ttl}. Must be valid integer greater than 0".format(ttl=self._ttl))
+        if self._max_disk_entries <= 0:
+            raise ValueError("Invalid value for max disk entries {max_disk_entries}. Must be valid integer greater "
+                             "than 0".format(max_disk_entries=self._max_disk_entries))
+        if self._cache_dir is not None and StringUtil.is_blank(self._cache_dir):
+            raise ValueError(CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE_OR_EMPTY.format("Upload cache directory"))
+
+    def from_json(self, json_data: dict):
+        """
+        Creates an upload cache config instance from a json file.
+
+        .. code-block:: JSON
+
+            {
+            "uploadCacheConfig": {
+                    "maxEntries": 1000,
+                    "ttl": 82800000,
+                    "cacheDir": "/var/cache/pdfservices/uploads",
+                    "maxDiskEntries": 10000
+                },
+            }
+
+        :param json_data: A dictionary containing upload cache config in the specified format.
+        :type json_data: dict
+        """
+        self._max_entries = int(json_data.get("maxEntries", self._max_entries))
+        self._ttl = int(json_data.get("ttl", self._ttl))
+        self._cache_dir = json_data.get("cacheDir", self._cache_dir)
+        self._max_disk_entries = int(json_data.get("maxDiskEntries", self._max_disk_entries))
+        return self
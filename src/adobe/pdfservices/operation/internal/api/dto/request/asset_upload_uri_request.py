@@ -10,8 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
-
 from adobe.pdfservices.operation.internal.util.json_hint_encoder import JSONHintEncoder
 
 
@@ -29,4 +27,4 @@ class AssetUploadURIRequest:
         return self.mediaType
 
     def to_json(self):
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
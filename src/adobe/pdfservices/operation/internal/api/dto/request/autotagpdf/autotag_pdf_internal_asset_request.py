@@ -10,7 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
 from abc import ABC
 from typing import List
 
@@ -39,4 +38,4 @@ class AutotagPDFInternalAssetRequest(PDFServicesAPIRequest, ABC):
         self.notify_config_list = notify_config_list
 
     def to_json(self):
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
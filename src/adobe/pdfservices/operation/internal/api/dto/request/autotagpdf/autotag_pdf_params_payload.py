@@ -10,8 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
-
 from adobe.pdfservices.operation.internal.util.json_hint_encoder import JSONHintEncoder
 from adobe.pdfservices.operation.pdfjobs.params.autotag_pdf.autotag_pdf_params import AutotagPDFParams
 
@@ -27,4 +25,4 @@ class AutotagPDFParamsPayload:
         self.generate_report = autotag_pdf_params.get_generate_report()
 
     def to_json(self):
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
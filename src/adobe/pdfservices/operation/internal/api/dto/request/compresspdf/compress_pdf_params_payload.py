@@ -10,8 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
-
 from adobe.pdfservices.operation.internal.util.json_hint_encoder import JSONHintEncoder
 from adobe.pdfservices.operation.pdfjobs.params.compress_pdf.compress_pdf_params import CompressPDFParams
 from adobe.pdfservices.operation.pdfjobs.params.compress_pdf.compression_level import CompressionLevel
@@ -28,4 +26,4 @@ class CompressPDFParamsPayload:
             self.compression_level = compress_pdf_params.get_compression_level().get_compression_level()
 
     def to_json(self):
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
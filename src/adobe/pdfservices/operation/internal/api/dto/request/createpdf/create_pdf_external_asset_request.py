@@ -10,7 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
 from typing import List
 
 from adobe.pdfservices.operation.config.notifier.notifier_config import NotifierConfig
@@ -43,4 +42,4 @@ class CreatePDFExternalAssetRequest(PDFServicesAPIRequest):
         self.notify_config_list = notify_config_list
 
     def to_json(self):
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
@@ -10,7 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
 from typing import List
 
 from adobe.pdfservices.operation.config.notifier.notifier_config import NotifierConfig
@@ -38,4 +37,4 @@ class CreatePDFInternalAssetRequest(PDFServicesAPIRequest):
             self.create_tagged_pdf = create_pdf_params.get_create_tagged_pdf()
 
     def to_json(self):
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
@@ -10,8 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
-
 from adobe.pdfservices.operation.internal.util.json_hint_encoder import JSONHintEncoder
 from adobe.pdfservices.operation.pdfjobs.params.create_pdf.CreatePDFParams import CreatePDFParams
 
@@ -31,4 +29,4 @@ class CreatePDFParamsPayload:
                 self.create_tagged_pdf = create_pdf_params.get_create_tagged_pdf()
 
     def to_json(self):
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
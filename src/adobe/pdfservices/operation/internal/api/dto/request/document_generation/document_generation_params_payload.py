@@ -10,8 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
-
 from adobe.pdfservices.operation.internal.util.json_hint_encoder import JSONHintEncoder
 from adobe.pdfservices.operation.pdfjobs.params.documentmerge.document_merge_params import DocumentMergeParams
 
@@ -30,4 +28,4 @@ class DocumentGenerationParamsPayload:
         self.output_format = document_merge_params.get_output_format().get_format()
 
     def to_json(self):
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
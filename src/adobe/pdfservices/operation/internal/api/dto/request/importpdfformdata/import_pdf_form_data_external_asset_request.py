@@ -10,7 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
 from typing import List
 
 from adobe.pdfservices.operation.config.notifier.notifier_config import NotifierConfig
@@ -44,7 +43,7 @@ class ImportPDFFormDataParamsPayload:
         :return: JSON representation of the payload
         :rtype: str
         """
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
 
 
 class ImportPDFFormDataExternalAssetRequest(PDFServicesAPIRequest):
@@ -94,4 +93,4 @@ class ImportPDFFormDataExternalAssetRequest(PDFServicesAPIRequest):
         :return: JSON representation of the request
         :rtype: str
         """
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True) 
\ No newline at end of file
+        return JSONHintEncoder.to_json(self)
\ No newline at end of file
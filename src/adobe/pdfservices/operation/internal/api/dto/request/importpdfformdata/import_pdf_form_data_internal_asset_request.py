@@ -10,7 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
 from typing import List
 
 from adobe.pdfservices.operation.config.notifier.notifier_config import NotifierConfig
@@ -52,4 +51,4 @@ class ImportPDFFormDataInternalAssetRequest(PDFServicesAPIRequest):
         :return: JSON representation of the request
         :rtype: str
         """
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True) 
\ No newline at end of file
+        return JSONHintEncoder.to_json(self)
\ No newline at end of file
@@ -10,8 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
-
 from adobe.pdfservices.operation.internal.api.dto.request.pagemanipulation.delete_page_action import \
     DeletePageAction
 from adobe.pdfservices.operation.internal.api.dto.request.pagemanipulation.page_action import PageAction
@@ -40,4 +38,4 @@ class PageActionCommand:
         return page_action_command
 
     def to_json(self):
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
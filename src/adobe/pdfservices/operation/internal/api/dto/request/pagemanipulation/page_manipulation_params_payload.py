@@ -10,8 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
-
 from adobe.pdfservices.operation.internal.api.dto.request.pagemanipulation.page_action_commands import \
     PageActionCommands
 from adobe.pdfservices.operation.internal.util.json_hint_encoder import JSONHintEncoder
@@ -26,4 +24,4 @@ class PageManipulationParamsPayload:
         self.page_actions = page_action_commands.get_commands()
 
     def to_json(self):
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
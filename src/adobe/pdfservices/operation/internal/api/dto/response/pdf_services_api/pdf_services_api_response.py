@@ -37,5 +37,4 @@ class PDFServicesAPIResponse:
 
     @staticmethod
     def from_json(json_str):
-        JSONHintDecoder.current_class = PDFServicesAPIResponse
-        return JSONHintDecoder.as_class(json.loads(json_str))
+        return JSONHintDecoder.from_json(json_str, PDFServicesAPIResponse)
@@ -23,6 +23,7 @@ from adobe.pdfservices.operation.internal.http import http_client
 from adobe.pdfservices.operation.internal.http.http_method import HttpMethod
 from adobe.pdfservices.operation.internal.http.http_request import HttpRequest
 from adobe.pdfservices.operation.internal.http.request_header_const import DefaultHeaders
+from adobe.pdfservices.operation.internal.http.retry_policy import RetryPolicy
 from adobe.pdfservices.operation.internal.util.validation_util import ValidationUtil
 from adobe.pdfservices.operation.pdf_services_media_type import PDFServicesMediaType
 
@@ -48,7 +49,11 @@ class PDFServicesAPI:
                                        authenticator=context.authenticator,
                                        connect_timeout=context.client_config.get_connect_timeout(),
                                        read_timeout=context.client_config.get_read_timeout(),
-                                       proxies=context.client_config.get_proxy_server_config())
+                                       proxies=context.client_config.get_proxy_server_config(),
+                                       transport=context.transport,
+                                       retry_policy=context.retry_policy,
+                                       rate_limiter=context.rate_limiter,
+                                       operation_endpoint=operation_endpoint)
         except Exception as ex:
             raise SdkException("Error generating http request for submitting the job.")
         response = http_client.process_request(http_request=http_request,
@@ -68,7 +73,10 @@ class PDFServicesAPI:
                                    connect_timeout=context.client_config.get_connect_timeout(),
                                    read_timeout=context.client_config.get_read_timeout(),
                                    retryable=True,
-                                   proxies=context.client_config.get_proxy_server_config())
+                                   proxies=context.client_config.get_proxy_server_config(),
+                                   transport=context.transport,
+                                   retry_policy=context.retry_policy,
+                                   rate_limiter=context.rate_limiter)
 
         return http_client.process_request(http_request=http_request,
                                            success_status_codes=[HTTPStatus.OK, HTTPStatus.ACCEPTED],
@@ -88,7 +96,10 @@ class PDFServicesAPI:
                                        connect_timeout=context.client_config.get_connect_timeout(),
                                        read_timeout=context.client_config.get_read_timeout(),
                                        retryable=True,
-                                       proxies=context.client_config.get_proxy_server_config())
+                                       proxies=context.client_config.get_proxy_server_config(),
+                                       transport=context.transport,
+                                       retry_policy=context.retry_policy,
+                                       rate_limiter=context.rate_limiter)
         except Exception as ex:
             raise SdkException("Error generating http request for submitting the job.")
         response = http_client.process_request(http_request=http_request,
@@ -97,7 +108,7 @@ class PDFServicesAPI:
         return response
 
     @staticmethod
-    def delete_asset(context: ExecutionContext, asset_id: str, x_request_id: str):
+    def delete_asset(context: ExecutionContext, asset_id: str, x_request_id: str, retry_policy: RetryPolicy = None):
         try:
             http_request = HttpRequest(http_method=HttpMethod.DELETE,
                                        request_key=RequestKey.PLATFORM,
@@ -108,7 +119,11 @@ class PDFServicesAPI:
                                        connect_timeout=context.client_config.get_connect_timeout(),
                                        read_timeout=context.client_config.get_read_timeout(),
                                        retryable=True,
-                                       proxies=context.client_config.get_proxy_server_config())
+                                       proxies=context.client_config.get_proxy_server_config(),
+                                       transport=context.transport,
+                                       retry_policy=retry_policy if retry_policy is not None else
+                                       context.retry_policy,
+                                       rate_limiter=context.rate_limiter)
         except Exception as ex:
             raise SdkException("Error generating http request for submitting the job.")
         response = http_client.process_request(http_request=http_request,
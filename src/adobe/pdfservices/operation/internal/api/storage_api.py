@@ -31,16 +31,22 @@ class StorageApi:
     assets = "/assets"
 
     @staticmethod
-    def upload_to_cloud(context: ExecutionContext, uri: str, input_stream, media_type):
+    def upload_to_cloud(context: ExecutionContext, uri: str, input_stream, media_type, content_length: int = None):
         try:
+            headers = {DefaultHeaders.CONTENT_TYPE_HEADER_NAME: media_type}
+            if content_length is not None:
+                headers[DefaultHeaders.CONTENT_LENGTH_HEADER_NAME] = str(content_length)
             http_request = HttpRequest(http_method=HttpMethod.PUT,
                                        request_key=RequestKey.UPLOAD,
                                        url=uri,
                                        data=input_stream,
-                                       headers={DefaultHeaders.CONTENT_TYPE_HEADER_NAME: media_type},
+                                       headers=headers,
                                        connect_timeout=context.client_config.get_connect_timeout(),
                                        read_timeout=context.client_config.get_read_timeout(),
-                                       proxies=context.client_config.get_proxy_server_config())
+                                       proxies=context.client_config.get_proxy_server_config(),
+                                       transport=context.transport,
+                                       retry_policy=context.retry_policy,
+                                       rate_limiter=context.rate_limiter)
             response = http_client.process_request(http_request=http_request,
                                                    success_status_codes=[HTTPStatus.ACCEPTED, HTTPStatus.OK],
                                                    error_response_handler=StorageApi.handle_error_response)
@@ -68,7 +74,10 @@ class StorageApi:
                                        authenticator=context.authenticator,
                                        connect_timeout=context.client_config.get_connect_timeout(),
                                        read_timeout=context.client_config.get_read_timeout(),
-                                       proxies=context.client_config.get_proxy_server_config())
+                                       proxies=context.client_config.get_proxy_server_config(),
+                                       transport=context.transport,
+                                       retry_policy=context.retry_policy,
+                                       rate_limiter=context.rate_limiter)
 
             response = http_client.process_request(http_request=http_request,
                                                    success_status_codes=[HTTPStatus.ACCEPTED, HTTPStatus.OK],
@@ -90,7 +99,10 @@ class StorageApi:
                                        authenticator=context.authenticator,
                                        connect_timeout=context.client_config.get_connect_timeout(),
                                        read_timeout=context.client_config.get_read_timeout(),
-                                       proxies=context.client_config.get_proxy_server_config())
+                                       proxies=context.client_config.get_proxy_server_config(),
+                                       transport=context.transport,
+                                       retry_policy=context.retry_policy,
+                                       rate_limiter=context.rate_limiter)
 
             response = http_client.process_request(http_request=http_request,
                                                    success_status_codes=[HTTPStatus.ACCEPTED, HTTPStatus.OK],
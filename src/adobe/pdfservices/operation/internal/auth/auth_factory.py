@@ -21,9 +21,10 @@ from adobe.pdfservices.operation.internal.auth.service_token_credentials import
 class AuthenticatorFactory:
 
     @staticmethod
-    def get_authenticator(credential: Credentials, client_config: ClientConfig):
+    def get_authenticator(credential: Credentials, client_config: ClientConfig, transport=None, retry_policy=None,
+                          rate_limiter=None):
         if isinstance(credential, ServicePrincipalCredentials):
-            return ServicePrincipalAuthenticator(credential, client_config)
+            return ServicePrincipalAuthenticator(credential, client_config, transport, retry_policy, rate_limiter)
         if isinstance(credential, ServiceTokenCredentials):
             return ServiceTokenAuthenticator(credential)
         else:
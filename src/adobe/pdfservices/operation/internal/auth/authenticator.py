@@ -27,3 +27,11 @@ class Authenticator(ABC):
     @abstractmethod
     def get_api_key(self):
         pass
+
+    def refresh_expired_token(self, expired_access_token: str):
+        """ Refreshes the access token after a request with the given access token was rejected as expired """
+        return self.refresh_token()
+
+    def close(self):
+        """ Releases the resources held by the authenticator """
+        pass
@@ -0,0 +1,95 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+
+from adobe.pdfservices.operation.internal.auth.session_token import SessionToken
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileTokenCache:
+    """
+    Access token cache shared by the processes of a node through a file, so that they reuse a single
+    :samp:`SessionToken` per client id and only one of them requests a new token when it is about to expire.
+
+    The token file is replaced atomically by renaming, so it can be read without locking; refreshing the token is
+    serialized across processes by an exclusive lock on a sidecar lock file.
+    """
+
+    def __init__(self, cache_dir: str, client_id: str, token_endpoint: str):
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        key = hashlib.sha256("{client_id}|{token_endpoint}".format(client_id=client_id,
+                                                                   token_endpoint=token_endpoint).encode()).hexdigest()
+        self._cache_dir = cache_dir
+        self._token_path = os.path.join(cache_dir, "pdfservices-token-{key}.json".format(key=key[:32]))
+        self._lock_path = self._token_path + ".lock"
+        self._logger = logging.getLogger(__name__)
+
+    def read(self):
+        """
+        Returns the cached token, or None if there is none or it can not be read.
+        """
+        try:
+            with open(self._token_path) as file:
+                content = json.load(file)
+            token = SessionToken(content['access_token'], content['expires_in_ms'])
+            token.expired_at = datetime.fromtimestamp(content['expires_at'])
+            return token
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            self._logger.warning("Ignoring unreadable access token cache file {path}".format(path=self._token_path))
+            return None
+
+    def write(self, token: SessionToken):
+        # mkstemp creates the file readable by the current user only
+        fd, temp_path = tempfile.mkstemp(dir=self._cache_dir, prefix=".pdfservices-token-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as file:
+                json.dump({'access_token': token.access_token,
+                           'expires_in_ms': token.expires_in_ms,
+                           'expires_at': token.expired_at.timestamp()}, file)
+            os.replace(temp_path, self._token_path)
+        except OSError:
+            os.remove(temp_path)
+            raise
+
+    @contextmanager
+    def lock(self):
+        """
+        Holds an exclusive lock shared with the other processes using the cache.
+        """
+        with open(self._lock_path, 'a+b') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
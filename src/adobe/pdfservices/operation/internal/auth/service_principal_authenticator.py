@@ -12,17 +12,20 @@
 
 import json
 import logging
+import random
 import sys
 import threading
+import weakref
 from datetime import datetime
 from http import HTTPStatus
 
 from adobe.pdfservices.operation.auth.service_principal_credentials import ServicePrincipalCredentials
 from adobe.pdfservices.operation.exception.exceptions import SdkException, ServiceApiException
 from adobe.pdfservices.operation.internal.auth.authenticator import Authenticator
+from adobe.pdfservices.operation.internal.auth.file_token_cache import FileTokenCache
 from adobe.pdfservices.operation.internal.auth.session_token import SessionToken
 from adobe.pdfservices.operation.internal.constants.request_key import RequestKey
-from adobe.pdfservices.operation.internal.constants.service_constants import custom_error_messages
+from adobe.pdfservices.operation.internal.constants.service_constants import custom_error_messages, ServiceConstants
 from adobe.pdfservices.operation.internal.exceptions import OperationException
 from adobe.pdfservices.operation.internal.http import http_client
 from adobe.pdfservices.operation.internal.http.http_method import HttpMethod
@@ -38,25 +41,48 @@ class ServicePrincipalAuthenticator(Authenticator):
     service_principal_configuration: ServicePrincipalCredentials
     token_endpoint = ''
 
-    def __init__(self, service_principal_configuration, client_config):
+    def __init__(self, service_principal_configuration, client_config, transport=None, retry_policy=None,
+                 rate_limiter=None):
         self.service_principal_configuration = service_principal_configuration
         self.token_endpoint = client_config.get_pdf_services_uri()
         self._logger = logging.getLogger(__name__)
         self.proxy_server_config = client_config.get_proxy_server_config()
+        self.transport = transport
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.token_cache = None
+        if client_config.get_token_cache_dir() is not None:
+            self.token_cache = FileTokenCache(client_config.get_token_cache_dir(),
+                                              service_principal_configuration.get_client_id(), self.token_endpoint)
 
         # thread locking to avoid refreshing token multiple times in multi threaded cases
         self.lock = threading.Lock()
+        self._refresher = None
+        self._refresher_finalizer = None
+        self._refresher_lock = threading.Lock()
+        self._closed = False
 
     def session_token(self):
         """ Access token for the PDF Services API """
+        # Fast path without locking; tokens are immutable, replaced atomically and refreshed ahead of expiry by the
+        # background refresher, so request threads only wait here on the first call or if refreshing kept failing
+        token = self.token
+        if token is not None and self._seconds_to_expire(token) > self._expiry_margin(token):
+            return token
         with self.lock:
-            if self.token:
-                if self.time_to_expire() > 2:
-                    return self.token
+            token = self.token
+            if token is not None and self._seconds_to_expire(token) > self._expiry_margin(token):
+                return token
             self._logger.debug(
                 "Refreshing access token with creation time: {creation_time} minutes".format(
                     creation_time=datetime.now()))
-            return self.refresh_token()
+            try:
+                return self.refresh_token()
+            except Exception:
+                if token is None or self._seconds_to_expire(token) <= 0:
+                    raise
+                self._logger.warning("Refreshing access token failed, using the current token until it expires")
+                return token
 
     def time_to_expire(self):
         """ Time remaining in minutes till token expiry """
@@ -64,6 +90,48 @@ class ServicePrincipalAuthenticator(Authenticator):
 
     def refresh_token(self):
         """ Refreshes the access token sent to PDF Services API """
+        if self.token_cache is None:
+            token = self._fetch_token()
+        else:
+            token = self._refresh_shared_token(self.token)
+        self.token = token
+        self._schedule_refresh(self._refresh_delay(token))
+        return token
+
+    def refresh_expired_token(self, expired_access_token: str):
+        """ Refreshes the access token once for all requests which were rejected with the same expired token """
+        with self.lock:
+            token = self.token
+            if token is not None and token.access_token != expired_access_token:
+                return token
+            return self.refresh_token()
+
+    def _refresh_shared_token(self, current_token: SessionToken):
+        # another process may already have replaced the token being refreshed, in which case it is reused
+        token = self._get_cached_token(current_token)
+        if token is not None:
+            return token
+        with self.token_cache.lock():
+            token = self._get_cached_token(current_token)
+            if token is not None:
+                return token
+            token = self._fetch_token()
+            try:
+                self.token_cache.write(token)
+            except OSError:
+                self._logger.warning("Could not write access token to the shared token cache", exc_info=True)
+            return token
+
+    def _get_cached_token(self, current_token: SessionToken):
+        token = self.token_cache.read()
+        if token is None or self._seconds_to_expire(token) <= self._expiry_margin(token):
+            return None
+        if current_token is not None and token.access_token == current_token.access_token:
+            return None
+        self._logger.debug("Using access token from the shared token cache")
+        return token
+
+    def _fetch_token(self):
         url = "{token_endpoint}/{ims_proxy_token_endpoint}".format(
             token_endpoint=self.token_endpoint,
             ims_proxy_token_endpoint='token'
@@ -74,17 +142,83 @@ class ServicePrincipalAuthenticator(Authenticator):
         try:
             http_request = HttpRequest(http_method=HttpMethod.POST, request_key=RequestKey.AUTHN, url=url,
                                        data=access_token_request_payload, headers={},
-                                       proxies=self.proxy_server_config)
+                                       proxies=self.proxy_server_config, transport=self.transport,
+                                       retry_policy=self.retry_policy, rate_limiter=self.rate_limiter)
             response = http_client.process_request(http_request=http_request, success_status_codes=[HTTPStatus.OK],
                                                    error_response_handler=self.handle_ims_failure)
 
             content = json.loads(response.content)
-            self.token = SessionToken(content['access_token'], content['expires_in'] * 1000)
+            return SessionToken(content['access_token'], content['expires_in'] * 1000)
         except ServiceApiException as ex:
             raise ex
         except Exception:
             raise SdkException("Exception in fetching access token", sys.exc_info())
-        return self.token
+
+    def close(self):
+        """ Stops the background token refresher """
+        with self._refresher_lock:
+            self._closed = True
+            self._cancel_refresher()
+
+    @staticmethod
+    def _seconds_to_expire(token: SessionToken):
+        return token.expired_at.timestamp() - datetime.now().timestamp()
+
+    @staticmethod
+    def _expiry_margin(token: SessionToken):
+        # margin in which request threads refresh the token themselves, kept below the refresh ahead time
+        return min(ServiceConstants.TOKEN_EXPIRY_MARGIN_SECONDS, token.expires_in_ms / 1000 / 4)
+
+    @staticmethod
+    def _refresh_delay(token: SessionToken):
+        # jitter spreads the refreshes of instances which fetched their token at the same time
+        refresh_ahead = min(ServiceConstants.TOKEN_REFRESH_AHEAD_SECONDS +
+                            random.uniform(0, ServiceConstants.TOKEN_REFRESH_JITTER_SECONDS),
+                            token.expires_in_ms / 1000 / 2)
+        return max(ServicePrincipalAuthenticator._seconds_to_expire(token) - refresh_ahead, 0)
+
+    def _schedule_refresh(self, delay):
+        with self._refresher_lock:
+            if self._closed:
+                return
+            self._cancel_refresher()
+            # The timer only holds a weak reference to the authenticator, so that one which is never closed can still
+            # be garbage collected, which also cancels the pending refresh
+            refresher = threading.Timer(delay, ServicePrincipalAuthenticator._refresh_in_background,
+                                        args=(weakref.ref(self),))
+            refresher.daemon = True
+            self._refresher = refresher
+            self._refresher_finalizer = weakref.finalize(self, refresher.cancel)
+            refresher.start()
+
+    def _cancel_refresher(self):
+        if self._refresher is not None:
+            self._refresher_finalizer.detach()
+            self._refresher.cancel()
+            self._refresher = None
+            self._refresher_finalizer = None
+
+    @staticmethod
+    def _refresh_in_background(authenticator_ref):
+        authenticator = authenticator_ref()
+        if authenticator is not None:
+            authenticator._refresh_now()
+
+    def _refresh_now(self):
+        try:
+            with self.lock:
+                self.refresh_token()
+            self._logger.debug("Refreshed access token in background")
+        except Exception:
+            token = self.token
+            if self._seconds_to_expire(token) - self._expiry_margin(token) > \
+                    ServiceConstants.TOKEN_REFRESH_RETRY_SECONDS:
+                self._logger.warning("Refreshing access token in background failed, retrying in {delay} seconds"
+                                     .format(delay=ServiceConstants.TOKEN_REFRESH_RETRY_SECONDS))
+                self._schedule_refresh(ServiceConstants.TOKEN_REFRESH_RETRY_SECONDS)
+            else:
+                self._logger.warning("Refreshing access token in background failed, the token will be refreshed on "
+                                     "the next request")
 
     def get_api_key(self):
         """ API key for Service Principle credentials """
@@ -19,5 +19,6 @@ class SessionToken:
 
     def __init__(self, access_token, expired_in_ms):
         self.access_token = access_token
+        self.expires_in_ms = expired_in_ms
         self.expired_at = (datetime.now() + timedelta(milliseconds=expired_in_ms)) if expired_in_ms is not None \
             else None
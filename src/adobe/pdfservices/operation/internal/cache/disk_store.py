@@ -0,0 +1,129 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+
+class DiskStore:
+    """
+    Store of JSON entries in the files of a directory, shared by all the processes using it.
+
+    Each entry is kept in its own file, spread over subdirectories by the first characters of its key, and replaced
+    atomically by renaming, so entries can be read and written concurrently without locking.
+
+    Entries with an :samp:`expires_at` time are removed when they are read after it. The directory is swept every
+    tenth of :samp:`max_entries` writes, starting with the first one, removing the expired entries and then the least
+    recently written ones beyond :samp:`max_entries`, so that it is bounded even if entries are never read again.
+    """
+
+    def __init__(self, directory: str, max_entries: int):
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._directory = directory
+        self._max_entries = max_entries
+        self._sweep_interval = max(max_entries // 10, 1)
+        self._writes_until_sweep = 1
+        self._sweep_lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    def get(self, key: str):
+        """
+        Returns the entry for the key, or None if there is none or it can not be read.
+        """
+        path = self._get_path(key)
+        entry = self._read(path)
+        if entry is not None and self._is_expired(entry):
+            self._remove_path(path)
+            return None
+        return entry
+
+    def contains(self, key: str):
+        return os.path.exists(self._get_path(key))
+
+    def put(self, key: str, entry: dict):
+        path = self._get_path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as file:
+                json.dump(entry, file)
+            os.replace(temp_path, path)
+        except OSError:
+            os.remove(temp_path)
+            raise
+        with self._sweep_lock:
+            self._writes_until_sweep -= 1
+            if self._writes_until_sweep > 0:
+                return
+            self._writes_until_sweep = self._sweep_interval
+        self.sweep()
+
+    def remove(self, key: str):
+        self._remove_path(self._get_path(key))
+
+    def sweep(self):
+        """
+        Removes the expired and unreadable entries, then the least recently written ones beyond the maximum number of
+        entries.
+        """
+        entries = []
+        try:
+            with os.scandir(self._directory) as subdirectories:
+                for subdirectory in subdirectories:
+                    if not subdirectory.is_dir():
+                        continue
+                    with os.scandir(subdirectory.path) as files:
+                        for file in files:
+                            if file.name.startswith(".") or not file.name.endswith(".json"):
+                                continue
+                            entry = self._read(file.path)
+                            if entry is None or self._is_expired(entry):
+                                self._remove_path(file.path)
+                            else:
+                                entries.append((file.stat().st_mtime, file.path))
+        except OSError:
+            self._logger.warning("Could not sweep cache directory {directory}".format(directory=self._directory),
+                                 exc_info=True)
+            return
+        if len(entries) > self._max_entries:
+            entries.sort()
+            for _, path in entries[:len(entries) - self._max_entries]:
+                self._remove_path(path)
+
+    def _read(self, path: str):
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self._logger.warning("Ignoring unreadable cache file {path}".format(path=path))
+            return None
+
+    def _remove_path(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _is_expired(entry):
+        expires_at = entry.get('expires_at') if isinstance(entry, dict) else None
+        return expires_at is not None and expires_at <= time.time()
+
+    def _get_path(self, key: str):
+        return os.path.join(self._directory, key[:2], key + ".json")
@@ -0,0 +1,282 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import hashlib
+import io
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from adobe.pdfservices.operation.config.result_cache_config import ResultCacheConfig
+from adobe.pdfservices.operation.exception.exceptions import SdkException
+from adobe.pdfservices.operation.internal.api.dto.request.pdf_services_api.pdf_services_api_request import \
+    PDFServicesAPIRequest
+from adobe.pdfservices.operation.internal.cache.lru_cache import LRUCache
+from adobe.pdfservices.operation.internal.http.transport.http_response import HttpResponse
+from adobe.pdfservices.operation.internal.metrics import Metrics
+
+_LOCATION_PREFIX = "pdfservices-cache://job/"
+_URI_PREFIX = "pdfservices-cache://content/"
+_MANIFEST = "result.json"
+# inputs are cloud assets, which the service deletes after 24 hours
+_MAX_INPUTS = 100000
+_INPUT_TTL_SECONDS = 24 * 60 * 60
+
+
+class _CachedContent(io.FileIO):
+    """ Cached result file read as the raw stream of an :samp:`HttpResponse` """
+
+    def release_conn(self):
+        self.close()
+
+
+class ResultCache:
+    """
+    Disk cache of job results, keyed by the operation and the request of the job in which the input asset ids are
+    replaced by the digest of their content.
+
+    A job found in the cache is not submitted; its polling URL is a cache location resolved by :samp:`load` instead of
+    the service. When a job missing from the cache is done, :samp:`store` downloads its result assets next to the
+    status response, whose download URIs are replaced by cache URIs served by :samp:`open_content`.
+
+    Cached result assets are local only: the status kept in the cache has no asset ids, since the service deletes the
+    result assets after 24 hours, or earlier when a pipeline deletes its intermediate assets, while the cache may
+    serve them for longer. Their content is served from the cache, and they are uploaded again when used as the input
+    of a job. The status returned by :samp:`store` for the job which just ran keeps its asset ids, which are recorded
+    as inputs with the digest of their content, so that the jobs of a pipeline using them are cached as well.
+
+    Each result is kept in its own directory, renamed into place once complete. The modification time of its status
+    file is updated on each hit, and the least recently used results are evicted when the cache grows above its
+    maximum size.
+    """
+
+    def __init__(self, config: ResultCacheConfig, metrics: Metrics):
+        os.makedirs(config.get_cache_dir(), mode=0o700, exist_ok=True)
+        self._cache_dir = config.get_cache_dir()
+        self._max_size = config.get_max_size()
+        self._metrics = metrics
+        self._input_digests = LRUCache(_MAX_INPUTS)
+        self._pending = {}
+        self._size = None
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def is_cached_location(location: str):
+        return location.startswith(_LOCATION_PREFIX)
+
+    @staticmethod
+    def is_cached_uri(uri: str):
+        return uri is not None and uri.startswith(_URI_PREFIX)
+
+    def register_input(self, asset_id: str, content_digest: str):
+        """
+        Records the digest of the content of an uploaded asset, for jobs using it as input to be cached.
+        """
+        self._input_digests.put(asset_id, content_digest, time.monotonic() + _INPUT_TTL_SECONDS)
+
+    def get_key(self, platform_api_request: PDFServicesAPIRequest, operation_name: str):
+        """
+        Returns the cache key of a job request, or None if the job can not be cached.
+        """
+        request = json.loads(platform_api_request.to_json())
+        if request.get('notifiers'):
+            return None
+        request.pop('notifiers', None)
+        if not self.__replace_asset_ids(request):
+            return None
+        canonical_request = json.dumps(request, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256("{operation}|{request}".format(operation=operation_name,
+                                                              request=canonical_request).encode()).hexdigest()
+
+    def __replace_asset_ids(self, node):
+        # replaces asset ids in place, returns their number or None if the content of one of them is not known
+        count = 0
+        children = node.items() if isinstance(node, dict) else enumerate(node)
+        for name, value in list(children):
+            if name == 'assetID':
+                digest = self._input_digests.get(value)
+                if digest is None:
+                    return None
+                node[name] = digest
+                count += 1
+            elif isinstance(value, (dict, list)):
+                child_count = self.__replace_asset_ids(value)
+                if child_count is None:
+                    return None
+                count += child_count
+        return count
+
+    def get_location(self, key: str):
+        """
+        Returns the cache location of the result of a job, or None if it is not cached.
+        """
+        manifest_path = self.__get_manifest_path(key)
+        try:
+            os.utime(manifest_path)
+        except FileNotFoundError:
+            self._metrics.increment(Metrics.RESULT_CACHE_MISSES)
+            return None
+        self._metrics.increment(Metrics.RESULT_CACHE_HITS)
+        return _LOCATION_PREFIX + key
+
+    def track(self, location: str, key: str):
+        """
+        Associates the polling URL of a submitted job with its cache key, so that its result is stored when done.
+        """
+        with self._lock:
+            self._pending[location] = key
+
+    def untrack(self, location: str):
+        with self._lock:
+            self._pending.pop(location, None)
+
+    def load(self, location: str):
+        """
+        Returns the status response of the job result with the given cache location.
+        """
+        key = location[len(_LOCATION_PREFIX):]
+        try:
+            with open(self.__get_manifest_path(key)) as file:
+                return json.load(file)['status']
+        except (OSError, ValueError, KeyError):
+            raise SdkException("Cached job result is not available anymore, the job must be submitted again.")
+
+    def store(self, location: str, response_content: dict, download):
+        """
+        Downloads the result assets of a done job with :samp:`download(uri)`, caches them with the status response,
+        and returns the status response referring to the cached content.
+        """
+        with self._lock:
+            key = self._pending.pop(location, None)
+        if key is None:
+            return response_content
+        parent_dir = os.path.join(self._cache_dir, key[:2])
+        os.makedirs(parent_dir, mode=0o700, exist_ok=True)
+        temp_dir = tempfile.mkdtemp(dir=parent_dir, prefix="." + key)
+        try:
+            content_types = {}
+            status = self.__download_assets(key, response_content, download, temp_dir, content_types)
+            with open(os.path.join(temp_dir, _MANIFEST), 'w') as file:
+                json.dump({'status': self.__remove_asset_ids(status), 'content_types': content_types}, file)
+            size = self.__get_dir_size(temp_dir)
+            try:
+                os.rename(temp_dir, os.path.join(parent_dir, key))
+            except OSError:
+                # cached by another job or process meanwhile
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                return status
+        except Exception:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            self._logger.warning("Could not cache job result", exc_info=True)
+            return response_content
+        self.__add_size(size)
+        return status
+
+    def __download_assets(self, key: str, node, download, directory: str, content_types: dict):
+        if isinstance(node, list):
+            return [self.__download_assets(key, item, download, directory, content_types) for item in node]
+        if not isinstance(node, dict):
+            return node
+        node = {name: self.__download_assets(key, value, download, directory, content_types)
+                for name, value in node.items()}
+        if node.get('downloadUri'):
+            name = str(len(content_types))
+            response = download(node['downloadUri'])
+            digest = hashlib.sha256()
+            try:
+                with open(os.path.join(directory, name), 'wb') as file:
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        file.write(chunk)
+                        digest.update(chunk)
+            finally:
+                response.close()
+            content_types[name] = response.headers.get('content-type')
+            node['downloadUri'] = "{prefix}{key}/{name}".format(prefix=_URI_PREFIX, key=key, name=name)
+            if node.get('assetID'):
+                self.register_input(node['assetID'], digest.hexdigest())
+        return node
+
+    def __remove_asset_ids(self, node):
+        if isinstance(node, list):
+            return [self.__remove_asset_ids(item) for item in node]
+        if not isinstance(node, dict):
+            return node
+        return {name: self.__remove_asset_ids(value) for name, value in node.items()
+                if not (name == 'assetID' and self.is_cached_uri(node.get('downloadUri')))}
+
+    def open_content(self, uri: str):
+        """
+        Returns a response streaming the cached content with the given cache URI.
+        """
+        path, content_type = self.get_content_file(uri)
+        try:
+            return HttpResponse(200, {'content-type': content_type}, raw=_CachedContent(path))
+        except OSError:
+            raise SdkException("Cached job result is not available anymore, the job must be submitted again.")
+
+    def get_content_file(self, uri: str):
+        """
+        Returns the path and the media type of the cached content with the given cache URI.
+        """
+        key, name = uri[len(_URI_PREFIX):].split('/', 1)
+        directory = os.path.join(self._cache_dir, key[:2], key)
+        try:
+            with open(os.path.join(directory, _MANIFEST)) as file:
+                content_type = json.load(file)['content_types'][name]
+        except (OSError, ValueError, KeyError):
+            raise SdkException("Cached job result is not available anymore, the job must be submitted again.")
+        return os.path.join(directory, name), content_type
+
+    def __get_manifest_path(self, key: str):
+        return os.path.join(self._cache_dir, key[:2], key, _MANIFEST)
+
+    def __add_size(self, size: int):
+        with self._lock:
+            if self._size is None:
+                self._size = sum(entry_size for _, entry_size, _ in self.__list_entries())
+            else:
+                self._size += size
+            if self._size <= self._max_size:
+                return
+            # results cached by other processes are only accounted for here
+            entries = sorted(self.__list_entries())
+            self._size = sum(entry_size for _, entry_size, _ in entries)
+            for _, entry_size, directory in entries:
+                if self._size <= self._max_size:
+                    break
+                shutil.rmtree(directory, ignore_errors=True)
+                self._size -= entry_size
+
+    def __list_entries(self):
+        # (last use time, size, directory) of each cached result
+        entries = []
+        for parent in os.scandir(self._cache_dir):
+            if not parent.is_dir():
+                continue
+            for entry in os.scandir(parent.path):
+                if entry.name.startswith('.') or not entry.is_dir():
+                    continue
+                try:
+                    last_used = os.stat(os.path.join(entry.path, _MANIFEST)).st_mtime
+                except FileNotFoundError:
+                    continue
+                entries.append((last_used, self.__get_dir_size(entry.path), entry.path))
+        return entries
+
+    @staticmethod
+    def __get_dir_size(directory: str):
+        return sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
@@ -0,0 +1,114 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import hashlib
+import logging
+import os
+import time
+
+from adobe.pdfservices.operation.config.upload_cache_config import UploadCacheConfig
+from adobe.pdfservices.operation.internal.cache.disk_store import DiskStore
+from adobe.pdfservices.operation.internal.cache.lru_cache import LRUCache
+from adobe.pdfservices.operation.internal.metrics import Metrics
+
+
+class UploadCache:
+    """
+    Cache of the asset ids of uploaded content, keyed by the digest of the content, its media type, the client id and the
+    PDF Services URI, since assets are only visible to the credentials which uploaded them.
+
+    Entries are kept in memory and, if configured, in a :samp:`DiskStore` along with an index by asset id used to
+    invalidate them when the asset is deleted. The disk tier takes precedence, so that an asset deleted by another
+    process is not reused from memory; a memory hit only checks that the entry file still exists.
+    """
+
+    def __init__(self, config: UploadCacheConfig, metrics: Metrics, client_id: str, pdf_services_uri: str):
+        self._ttl = config.get_ttl()
+        self._metrics = metrics
+        self._key_prefix = "{client_id}|{uri}|".format(client_id=client_id, uri=pdf_services_uri).encode()
+        self._entries = LRUCache(config.get_max_entries())
+        self._uploads = None
+        self._assets = None
+        if config.get_cache_dir() is not None:
+            self._uploads = DiskStore(os.path.join(config.get_cache_dir(), "uploads"), config.get_max_disk_entries())
+            self._assets = DiskStore(os.path.join(config.get_cache_dir(), "assets"), config.get_max_disk_entries())
+        self._logger = logging.getLogger(__name__)
+
+    def get_key(self, content_digest: str, media_type: str):
+        """
+        Returns the cache key of content with the given digest and media type.
+        """
+        return hashlib.sha256(self._key_prefix + "{media_type}|{content_digest}".format(
+            media_type=media_type, content_digest=content_digest).encode()).hexdigest()
+
+    def get(self, key: str):
+        """
+        Returns the asset id of the content with the given key, or None if it was not uploaded or expired.
+        """
+        asset_id = self._entries.get(key)
+        if self._uploads is not None:
+            if asset_id is not None and not self._uploads.contains(key):
+                # invalidated by another process
+                self._entries.pop(key)
+                asset_id = None
+            elif asset_id is None:
+                asset_id = self._get_from_disk(key)
+        if asset_id is None:
+            self._metrics.increment(Metrics.UPLOAD_CACHE_MISSES)
+            return None
+        self._metrics.increment(Metrics.UPLOAD_CACHE_HITS)
+        return asset_id
+
+    def put(self, key: str, asset_id: str):
+        self._entries.put(key, asset_id, time.monotonic() + self._ttl)
+        if self._uploads is None:
+            return
+        expires_at = time.time() + self._ttl
+        try:
+            self._uploads.put(key, {'asset_id': asset_id, 'expires_at': expires_at})
+            self._assets.put(self._get_asset_key(asset_id), {'key': key, 'expires_at': expires_at})
+        except OSError:
+            self._logger.warning("Could not write upload to the upload cache", exc_info=True)
+
+    def invalidate(self, asset_id: str):
+        """
+        Removes the upload of the given asset from the cache.
+        """
+        self._entries.pop_value(asset_id)
+        if self._assets is None:
+            return
+        asset_key = self._get_asset_key(asset_id)
+        entry = self._assets.get(asset_key)
+        if entry is None:
+            return
+        try:
+            upload = self._uploads.get(entry['key'])
+            if upload is not None and upload.get('asset_id') == asset_id:
+                self._uploads.remove(entry['key'])
+            self._assets.remove(asset_key)
+        except OSError:
+            self._logger.warning("Could not remove asset {asset_id} from the upload cache".format(asset_id=asset_id),
+                                 exc_info=True)
+
+    def _get_from_disk(self, key: str):
+        entry = self._uploads.get(key)
+        if entry is None:
+            return None
+        remaining = entry.get('expires_at', 0) - time.time()
+        if remaining <= 0:
+            return None
+        self._entries.put(key, entry['asset_id'], time.monotonic() + remaining)
+        return entry['asset_id']
+
+    @staticmethod
+    def _get_asset_key(asset_id: str):
+        return hashlib.sha256(asset_id.encode()).hexdigest()
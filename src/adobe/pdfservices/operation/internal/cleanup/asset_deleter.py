@@ -0,0 +1,120 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from http import HTTPStatus
+from typing import Iterable, Optional
+
+from adobe.pdfservices.operation.config.retry_config import RetryConfig
+from adobe.pdfservices.operation.exception.exceptions import ServiceApiException, SdkException
+from adobe.pdfservices.operation.internal.execution_context import ExecutionContext
+from adobe.pdfservices.operation.internal.http.retry_policy import RetryPolicy
+from adobe.pdfservices.operation.internal.metrics import Metrics
+from adobe.pdfservices.operation.internal.pdf_services_helper import PDFServicesHelper
+from adobe.pdfservices.operation.io.cloud_asset import CloudAsset
+
+
+class AssetDeleter:
+    """
+    Deletes cloud assets on a bounded pool of threads, either in bulk for a caller waiting for the outcome, or in the
+    background from a cleanup queue whose pending count is reported.
+
+    Deletions go through the rate limiter of the execution context like any other request. They are idempotent, so
+    they are retried with the retry policy of the execution context, or with the default :samp:`RetryConfig` if none
+    is configured, and an asset which is already gone counts as deleted.
+    """
+
+    def __init__(self, context: ExecutionContext, max_workers: int):
+        self._context = context
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pdfservices-delete")
+        self._retry_policy = context.retry_policy if context.retry_policy is not None else \
+            RetryPolicy(RetryConfig(), context.metrics)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._logger = logging.getLogger(__name__)
+
+    def delete_assets(self, assets: Iterable[CloudAsset], timeout: Optional[float]) -> dict:
+        """
+        Deletes the assets and waits for the deletions, returning the errors of those which failed by asset id.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        # the assets are consumed lazily, so that only a bounded number of deletions is queued at any time
+        slots = threading.BoundedSemaphore(2 * self._max_workers)
+        futures = {}
+        errors = {}
+        for asset in assets:
+            if not isinstance(asset, CloudAsset):
+                raise SdkException("Only internal storage is supported for delete asset.")
+            remaining = self.__get_remaining(deadline)
+            if remaining == 0 or not slots.acquire(timeout=remaining):
+                errors[asset.get_asset_id()] = SdkException("Timeout occurred while deleting the asset.")
+                continue
+            future = self._executor.submit(self.__delete, asset)
+            future.add_done_callback(lambda f: slots.release())
+            futures[future] = asset
+        done, not_done = wait(futures, timeout=self.__get_remaining(deadline))
+        for future in done:
+            if future.exception() is not None:
+                errors[futures[future].get_asset_id()] = future.exception()
+        for future in not_done:
+            future.cancel()
+            errors[futures[future].get_asset_id()] = SdkException("Timeout occurred while deleting the asset.")
+        return errors
+
+    def enqueue(self, asset: CloudAsset):
+        """
+        Deletes the asset in the background; a failed deletion is logged.
+        """
+        if not isinstance(asset, CloudAsset):
+            raise SdkException("Only internal storage is supported for delete asset.")
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(self.__delete, asset)
+        except RuntimeError:
+            with self._lock:
+                self._pending -= 1
+            raise SdkException("Asset can not be deleted, PDFServices is closed.")
+        future.add_done_callback(lambda f: self.__on_background_deleted(asset, f))
+
+    def get_pending_count(self) -> int:
+        with self._lock:
+            return self._pending
+
+    def close(self):
+        """
+        Waits for the deletions in progress and queued in the background.
+        """
+        self._executor.shutdown()
+
+    def __delete(self, asset: CloudAsset):
+        try:
+            PDFServicesHelper.delete_asset(self._context, asset, self._retry_policy)
+        except ServiceApiException as ex:
+            if ex.status_code != HTTPStatus.NOT_FOUND:
+                self._context.metrics.increment(Metrics.ASSET_DELETIONS_FAILED)
+                raise
+        self._context.metrics.increment(Metrics.ASSETS_DELETED)
+
+    def __on_background_deleted(self, asset: CloudAsset, future):
+        with self._lock:
+            self._pending -= 1
+        if not future.cancelled() and future.exception() is not None:
+            self._logger.warning("Deleting asset {asset_id} in the background failed with {error}"
+                                 .format(asset_id=asset.get_asset_id(), error=future.exception()))
+
+    @staticmethod
+    def __get_remaining(deadline: Optional[float]) -> Optional[float]:
+        return max(deadline - time.monotonic(), 0) if deadline is not None else None
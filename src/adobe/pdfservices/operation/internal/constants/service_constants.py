@@ -38,6 +38,19 @@ custom_error_messages = {
 class ServiceConstants:
     HTTP_CONNECT_TIMEOUT = 4000
     HTTP_READ_TIMEOUT = 10000
+    HTTP_POOL_CONNECTIONS = 10
+    HTTP_POOL_MAXSIZE = 10
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    MAX_WORKERS = 10
+    MAX_UPLOAD_WORKERS = 10
+    MAX_DELETE_WORKERS = 10
+    TOKEN_EXPIRY_MARGIN_SECONDS = 120
+    TOKEN_REFRESH_AHEAD_SECONDS = 600
+    TOKEN_REFRESH_JITTER_SECONDS = 300
+    TOKEN_REFRESH_RETRY_SECONDS = 30
+    CREDENTIAL_DRAIN_SECONDS = 60
+    ASSET_RETENTION_SECONDS = 24 * 60 * 60
+    POOL_OWNER_MAX_ENTRIES = 100000
     OPERATION_RESULT_TEMP_DIRECTORY = 'sdk_result'
     EXTRACT_OPERATION_NAME = "EXTRACT_PDF"
     AUTOTAG_OPERATION_NAME = "AUTOTAG_PDF"
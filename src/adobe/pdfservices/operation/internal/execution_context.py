@@ -15,12 +15,26 @@ from adobe.pdfservices.operation.auth.service_principal_credentials import Servi
 from adobe.pdfservices.operation.config.client_config import ClientConfig
 from adobe.pdfservices.operation.internal.auth.auth_factory import AuthenticatorFactory
 from adobe.pdfservices.operation.internal.auth.authenticator import Authenticator
+from adobe.pdfservices.operation.internal.cache.result_cache import ResultCache
+from adobe.pdfservices.operation.internal.cache.upload_cache import UploadCache
+from adobe.pdfservices.operation.internal.http.rate_limiter import RateLimiter
+from adobe.pdfservices.operation.internal.http.retry_policy import RetryPolicy
+from adobe.pdfservices.operation.internal.http.transport.transport_factory import HttpTransportFactory
+from adobe.pdfservices.operation.internal.metrics import Metrics
 
 
 class ExecutionContext:
     _credentials = None
     _authenticator = None
     _client_config: ClientConfig = None
+    _transport = None
+    _owns_transport = False
+    _retry_policy = None
+    _metrics = None
+    _rate_limiter = None
+    _upload_cache = None
+    _result_cache = None
+    _job_journal = None
 
     def __init__(self, credentials: Credentials, client_config: ClientConfig = None):
         self._credentials = credentials
@@ -30,8 +44,29 @@ class ExecutionContext:
             self._client_config: ClientConfig = ClientConfig()
 
         self._client_config.validate()
+        self._transport = HttpTransportFactory.get_transport(self._client_config)
+        # a custom transport of the client config may be shared with other instances, it is closed by its owner
+        self._owns_transport = self._client_config.get_transport() is None
+        self._metrics = Metrics()
+        if self._client_config.get_retry_config() is not None:
+            self._retry_policy = RetryPolicy(self._client_config.get_retry_config(), self._metrics)
+        if self._client_config.get_rate_limit_config() is not None:
+            self._rate_limiter = RateLimiter(self._client_config.get_rate_limit_config(), self._metrics)
         self._authenticator: Authenticator = AuthenticatorFactory.get_authenticator(credentials,
-                                                                                    self._client_config)
+                                                                                    self._client_config,
+                                                                                    self._transport,
+                                                                                    self._retry_policy,
+                                                                                    self._rate_limiter)
+        if self._client_config.get_upload_cache_config() is not None:
+            self._upload_cache = UploadCache(self._client_config.get_upload_cache_config(), self._metrics,
+                                             self._authenticator.get_api_key(),
+                                             self._client_config.get_pdf_services_uri())
+        if self._client_config.get_result_cache_config() is not None:
+            self._result_cache = ResultCache(self._client_config.get_result_cache_config(), self._metrics)
+        if self._client_config.get_job_journal_path() is not None:
+            from adobe.pdfservices.operation.internal.journal.job_journal import JobJournal
+            self._job_journal = JobJournal(self._client_config.get_job_journal_path(),
+                                           self._authenticator.get_api_key())
 
     @property
     def client_config(self):
@@ -45,6 +80,42 @@ class ExecutionContext:
     def credentials(self):
         return self._credentials
 
+    @property
+    def transport(self):
+        return self._transport
+
+    @property
+    def retry_policy(self):
+        return self._retry_policy
+
+    @property
+    def rate_limiter(self):
+        return self._rate_limiter
+
+    @property
+    def upload_cache(self):
+        return self._upload_cache
+
+    @property
+    def result_cache(self):
+        return self._result_cache
+
+    @property
+    def job_journal(self):
+        return self._job_journal
+
+    @property
+    def metrics(self):
+        return self._metrics
+
+    def close(self):
+        if self._authenticator is not None:
+            self._authenticator.close()
+        if self._transport is not None and self._owns_transport:
+            self._transport.close()
+        if self._job_journal is not None:
+            self._job_journal.close()
+
     def validate(self):
         if not self._client_config:
             raise ValueError("Client Context not initialized before invoking the operation")
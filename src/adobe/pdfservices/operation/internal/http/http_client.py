@@ -17,13 +17,16 @@ from typing import Callable, List
 import requests
 
 from adobe.pdfservices.operation.exception.exceptions import SdkException
-from adobe.pdfservices.operation.internal.http.http_method import HttpMethod
 from adobe.pdfservices.operation.internal.http.http_request import HttpRequest
 from adobe.pdfservices.operation.internal.http.request_header_const import DefaultHeaders
 from adobe.pdfservices.operation.internal.http.response_util import ResponseUtil
+from adobe.pdfservices.operation.internal.http.transport.requests_transport import RequestsTransport
 
 _logger = logging.getLogger(__name__)
 
+# Used for requests created without a transport, opens a new connection per call
+_DEFAULT_TRANSPORT = RequestsTransport(pooled=False)
+
 
 def process_request(http_request: HttpRequest, success_status_codes: List,
                     error_response_handler: Callable[[requests.Response], None]):
@@ -34,12 +37,35 @@ def process_request(http_request: HttpRequest, success_status_codes: List,
         http_request.headers[DefaultHeaders.AUTHORIZATION_HEADER_NAME] = "Bearer " + access_token
         http_request.headers[DefaultHeaders.X_API_KEY_HEADER_NAME] = http_request.authenticator.get_api_key()
 
-    # retry the request if it fails with 401 and specific error code
+    attempt = 1
+    # retry the request if it fails with 401 and specific error code, or with a transient error as per retry policy
     while True:
-        response = _execute_request(http_request)
+        if http_request.rate_limiter:
+            http_request.rate_limiter.acquire(http_request)
+        try:
+            response = _execute_request(http_request)
+        except SdkException:
+            delay = http_request.retry_policy.get_retry_delay(http_request, attempt) \
+                if http_request.retry_policy else None
+            if delay is None:
+                raise
+            http_request.retry_policy.on_retry(http_request, attempt, delay)
+            attempt += 1
+            continue
+        if http_request.rate_limiter:
+            http_request.rate_limiter.on_response(http_request, response)
+        delay = http_request.retry_policy.get_retry_delay(http_request, attempt, response) \
+            if http_request.retry_policy and response.status_code not in success_status_codes else None
+        if delay is not None:
+            http_request.retry_policy.on_retry(http_request, attempt, delay, response)
+            # release the connection back to the pool before retrying
+            response.close()
+            attempt += 1
+            continue
         if _handle_response_and_retry(response, success_status_codes,
                                       error_response_handler, not http_request.authenticator,
                                       http_request.request_key) and http_request.retryable:
+            response.close()
             _force_authenticate(http_request)
             # Only single retry is required in case of token expiry
             http_request.retryable = False
@@ -56,42 +82,9 @@ def _append_default_headers(headers: dict):
 
 
 def _execute_request(http_request: HttpRequest):
-    response = None
-    timeout = (http_request.connect_timeout, http_request.read_timeout)
+    transport = http_request.transport if http_request.transport is not None else _DEFAULT_TRANSPORT
     try:
-        if http_request.method == HttpMethod.POST:
-            if http_request.data:
-                response = requests.post(url=http_request.url,
-                                         data=http_request.data,
-                                         headers=http_request.headers,
-                                         timeout=timeout,
-                                         proxies=http_request.proxies.proxy_config_map() if
-                                         http_request.proxies is not None else None)
-            elif http_request.files:
-                response = requests.post(url=http_request.url,
-                                         files=http_request.files,
-                                         headers=http_request.headers,
-                                         timeout=timeout,
-                                         proxies=http_request.proxies.proxy_config_map() if
-                                         http_request.proxies is not None else None)
-                for key, val in http_request.files.items():
-                    if hasattr(val[1], 'close'):
-                        val[1].close()
-        elif http_request.method == HttpMethod.GET:
-            response = requests.get(url=http_request.url, allow_redirects=True, headers=http_request.headers,
-                                    timeout=timeout,
-                                    proxies=http_request.proxies.proxy_config_map() if
-                                    http_request.proxies is not None else None)
-        elif http_request.method == HttpMethod.PUT:
-            response = requests.put(url=http_request.url, data=http_request.data, headers=http_request.headers,
-                                    timeout=timeout,
-                                    proxies=http_request.proxies.proxy_config_map() if
-                                    http_request.proxies is not None else None)
-        elif http_request.method == HttpMethod.DELETE:
-            response = requests.delete(url=http_request.url, headers=http_request.headers, timeout=timeout,
-                                       proxies=http_request.proxies.proxy_config_map() if
-                                       http_request.proxies is not None else None)
-
+        response = transport.execute(http_request)
     except Exception as e:
         raise SdkException("Request could not be completed. Possible cause attached!", sys.exc_info())
     return response
@@ -99,7 +92,8 @@ def _execute_request(http_request: HttpRequest):
 
 def _force_authenticate(http_request: HttpRequest):
     _logger.debug("Re-authenticate as access_token is expired")
-    access_token = http_request.authenticator.refresh_token().access_token
+    expired_access_token = http_request.headers[DefaultHeaders.AUTHORIZATION_HEADER_NAME][len("Bearer "):]
+    access_token = http_request.authenticator.refresh_expired_token(expired_access_token).access_token
     http_request.headers[DefaultHeaders.AUTHORIZATION_HEADER_NAME] = "Bearer " + access_token
 
 
@@ -20,7 +20,8 @@ class HttpRequest:
     # (url, data/files, headers, authenticator (if none its not authenticated), socket_timeout, connect_timeout)
     def __init__(self, http_method: HttpMethod, request_key: str, url: str, headers: dict, data=None, files=None,
                  authenticator: Authenticator = None, read_timeout=None, connect_timeout=None, retryable: bool = False,
-                 proxies: ProxyServerConfig = None):
+                 proxies: ProxyServerConfig = None, transport=None, retry_policy=None,
+                 stream: bool = False, rate_limiter=None, operation_endpoint: str = None):
         self.method = http_method
         self.request_key = request_key
         self.url = url
@@ -32,3 +33,17 @@ class HttpRequest:
         self.connect_timeout = connect_timeout
         self.retryable = retryable
         self.proxies = proxies
+        self.transport = transport
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        # operation endpoint of job submissions, for per operation rate limits
+        self.operation_endpoint = operation_endpoint
+        # whether the response body is left unread, to be consumed in chunks by the caller
+        self.stream = stream
+        # remember where a seekable body starts so that it can be sent again on retries
+        self.body_position = None
+        if hasattr(data, 'seek') and hasattr(data, 'tell'):
+            try:
+                self.body_position = data.tell()
+            except (OSError, ValueError):
+                pass
@@ -0,0 +1,121 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import logging
+import math
+import threading
+import time
+
+from adobe.pdfservices.operation.config.rate_limit_config import RateLimitConfig
+from adobe.pdfservices.operation.internal.http.http_request import HttpRequest
+from adobe.pdfservices.operation.internal.http.response_util import ResponseUtil
+from adobe.pdfservices.operation.internal.metrics import Metrics
+
+
+class _TokenBucket:
+    # a throttled bucket never goes below this fraction of its configured rate
+    _MIN_RATE_FRACTION = 0.1
+    _THROTTLE_FACTOR = 0.5
+    _THROTTLE_HOLD_SECONDS = 1
+
+    def __init__(self, rate: float, capacity: int, recovery_interval: float):
+        self._configured_rate = rate
+        self._rate = rate
+        self._capacity = capacity
+        self._recovery_interval = recovery_interval
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0
+        self._throttled_at = None
+        self._throttled_rate = None
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a permit and returns the number of seconds to wait before using it. Permits are handed out in order,
+        so waiting callers do not compete for the next refill.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0
+            return max(wait, self._paused_until - now)
+
+    def throttle(self, retry_after):
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if retry_after is not None:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            if self._throttled_at is not None and now - self._throttled_at < self._THROTTLE_HOLD_SECONDS:
+                # requests sent before the rate was lowered are still being rejected
+                return
+            self._throttled_rate = max(self._rate * self._THROTTLE_FACTOR,
+                                       self._configured_rate * self._MIN_RATE_FRACTION)
+            self._throttled_at = now
+            self._rate = self._throttled_rate
+            self._tokens = min(self._tokens, 0)
+
+    def _refill(self, now: float):
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+        if self._throttled_at is not None:
+            recovered = (now - self._throttled_at) / self._recovery_interval if self._recovery_interval else 1
+            if recovered >= 1:
+                self._rate = self._configured_rate
+                self._throttled_at = None
+            else:
+                self._rate = self._throttled_rate + (self._configured_rate - self._throttled_rate) * recovered
+
+
+class RateLimiter:
+    """
+    Applies a :samp:`RateLimitConfig` to the requests of an :samp:`ExecutionContext`, blocking requests until the
+    token buckets of their request key and operation endpoint grant a permit.
+    """
+
+    def __init__(self, rate_limit_config: RateLimitConfig, metrics: Metrics):
+        self._rate_limit_config = rate_limit_config
+        self._metrics = metrics
+        self._request_key_buckets = {key: self._create_bucket(rate)
+                                     for key, rate in rate_limit_config.get_request_key_rates().items()}
+        self._operation_buckets = {operation: self._create_bucket(rate)
+                                   for operation, rate in rate_limit_config.get_operation_rates().items()}
+        self._logger = logging.getLogger(__name__)
+
+    def _create_bucket(self, rate: float) -> _TokenBucket:
+        capacity = self._rate_limit_config.get_burst_size() or max(1, math.floor(rate))
+        return _TokenBucket(rate, capacity, self._rate_limit_config.get_recovery_interval())
+
+    def _get_buckets(self, http_request: HttpRequest):
+        buckets = []
+        if http_request.request_key in self._request_key_buckets:
+            buckets.append(self._request_key_buckets[http_request.request_key])
+        if http_request.operation_endpoint in self._operation_buckets:
+            buckets.append(self._operation_buckets[http_request.operation_endpoint])
+        return buckets
+
+    def acquire(self, http_request: HttpRequest):
+        wait = max([bucket.reserve() for bucket in self._get_buckets(http_request)], default=0)
+        if wait > 0:
+            self._logger.debug("Waiting {wait:.2f} seconds for a {request_key} request permit"
+                               .format(wait=wait, request_key=http_request.request_key.value))
+            self._metrics.increment(Metrics.RATE_LIMITED)
+            time.sleep(wait)
+
+    def on_response(self, http_request: HttpRequest, response):
+        if response.status_code != 429 or not self._rate_limit_config.is_adaptive():
+            return
+        retry_after = ResponseUtil.get_retry_after(response)
+        for bucket in self._get_buckets(http_request):
+            bucket.throttle(retry_after)
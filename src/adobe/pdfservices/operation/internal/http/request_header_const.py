@@ -16,10 +16,12 @@ class DefaultHeaders:
     ACCEPT_HEADER_NAME = "Accept"
     DC_REQUEST_ID_HEADER_KEY = "x-request-id"
     CONTENT_TYPE_HEADER_NAME = "Content-Type"
+    CONTENT_LENGTH_HEADER_NAME = "Content-Length"
     AUTHORIZATION_HEADER_NAME = "Authorization"
     LOCATION_HEADER_NAME = "location"
     X_API_KEY_HEADER_NAME = "x-api-key"
     DC_APP_INFO_HEADER_KEY = "x-api-app-info"
     X_DCSDK_OPS_INFO_HEADER_NAME = "x-dcsdk-ops-info"
     SESSION_TOKEN_REQUEST_ID_HEADER_KEY = "X-DEBUG-ID"
+    CONNECTION_HEADER_NAME = "Connection"
     JSON_TXT_CONTENT_TYPE = "application/json, text/plain, */*"
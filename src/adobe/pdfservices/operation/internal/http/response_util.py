@@ -10,10 +10,10 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
+import email.utils
 import json
 import logging
-from defusedxml.ElementTree import fromstring
-from xml.sax import SAXParseException
+import time
 
 import requests
 
@@ -76,6 +76,21 @@ class ResponseUtil:
         # Handle CPF error response
         return ResponseUtil.handle_service_api_error_response(response)
 
+    @staticmethod
+    def get_retry_after(response):
+        """ Seconds to wait as per the Retry-After header of the response, given in seconds or as an HTTP date """
+        retry_after = response.headers.get('retry-after')
+        if retry_after is None:
+            return None
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            pass
+        try:
+            return max(email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time(), 0)
+        except (TypeError, ValueError):
+            return None
+
     @staticmethod
     def get_request_tracking_id_from_response(response: requests.Response, is_ims_api_call):
         if is_ims_api_call:
@@ -97,6 +112,9 @@ class ResponseUtil:
     @staticmethod
     def handle_upload_asset_failure(response: requests.Response, request_key: str):
         if request_key == RequestKey.UPLOAD:
+            # imported on first use, the XML parsers are only needed for storage errors and are slow to import
+            from defusedxml.ElementTree import fromstring
+            from xml.sax import SAXParseException
             try:
                 response_content = fromstring(response.content)
                 error_code = response_content.find('Code').text
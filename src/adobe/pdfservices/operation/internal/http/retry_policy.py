@@ -0,0 +1,97 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import logging
+import random
+import time
+from typing import Optional
+
+from adobe.pdfservices.operation.config.retry_config import RetryConfig
+from adobe.pdfservices.operation.internal.http.http_method import HttpMethod
+from adobe.pdfservices.operation.internal.http.http_request import HttpRequest
+from adobe.pdfservices.operation.internal.http.response_util import ResponseUtil
+from adobe.pdfservices.operation.internal.metrics import Metrics
+
+
+class RetryPolicy:
+    """
+    Applies a :samp:`RetryConfig` to the requests of an :samp:`ExecutionContext` and records retry metrics.
+    """
+
+    # Statuses for which the service guarantees that the request was not processed
+    _NON_IDEMPOTENT_RETRYABLE_STATUS_CODES = frozenset([429, 503])
+    _IDEMPOTENT_METHODS = frozenset([HttpMethod.GET, HttpMethod.PUT, HttpMethod.DELETE])
+
+    def __init__(self, retry_config: RetryConfig, metrics: Metrics):
+        self._retry_config = retry_config
+        self._metrics = metrics
+        self._logger = logging.getLogger(__name__)
+
+    def get_retry_delay(self, http_request: HttpRequest, attempt: int, response=None) -> Optional[float]:
+        """
+        Returns the delay in seconds before retrying a request which failed on the given attempt, either with a
+        response or with a network error if response is None. Returns None if the request must not be retried.
+        """
+        if not self._is_retryable(http_request, attempt, response):
+            return None
+        delay = min(self._retry_config.get_initial_delay() *
+                    (self._retry_config.get_backoff_multiplier() ** (attempt - 1)),
+                    self._retry_config.get_max_delay())
+        delay -= random.uniform(0, self._retry_config.get_jitter() * delay)
+        if response is not None and self._retry_config.is_honor_retry_after():
+            retry_after = ResponseUtil.get_retry_after(response)
+            if retry_after is not None:
+                delay = min(max(delay, retry_after), self._retry_config.get_max_delay())
+        return delay
+
+    def _is_retryable(self, http_request: HttpRequest, attempt: int, response) -> bool:
+        if http_request.request_key not in self._retry_config.get_retryable_request_keys():
+            return False
+        if response is not None:
+            if response.status_code not in self._retry_config.get_retryable_status_codes():
+                return False
+            if http_request.method not in self._IDEMPOTENT_METHODS and \
+                    response.status_code not in self._NON_IDEMPOTENT_RETRYABLE_STATUS_CODES:
+                return False
+        elif http_request.method not in self._IDEMPOTENT_METHODS:
+            # A network error may have happened after the request was processed
+            return False
+        if not self._rewind_body(http_request):
+            return False
+        if attempt >= self._retry_config.get_max_attempts():
+            self._metrics.increment(Metrics.RETRIES_EXHAUSTED)
+            return False
+        return True
+
+    def on_retry(self, http_request: HttpRequest, attempt: int, delay: float, response=None):
+        reason = response.status_code if response is not None else "network error"
+        self._logger.debug("Retrying {request_key} request after {reason}, attempt {attempt}, in {delay:.2f} seconds"
+                           .format(request_key=http_request.request_key.value, reason=reason,
+                                   attempt=attempt + 1, delay=delay))
+        self._metrics.increment(Metrics.RETRIES)
+        self._metrics.increment("{retries}.{request_key}".format(retries=Metrics.RETRIES,
+                                                                 request_key=http_request.request_key.value))
+        self._metrics.increment("{retries}.{reason}".format(retries=Metrics.RETRIES, reason=reason))
+        time.sleep(delay)
+
+    @staticmethod
+    def _rewind_body(http_request: HttpRequest) -> bool:
+        data = http_request.data
+        if data is None or isinstance(data, (bytes, bytearray, str, dict)):
+            return True
+        if hasattr(data, 'seek') and hasattr(data, 'tell'):
+            if http_request.body_position is None:
+                return False
+            data.seek(http_request.body_position)
+            return True
+        # Generators and other one-shot streams cannot be sent again
+        return False
@@ -0,0 +1,69 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import json
+import re
+import threading
+from typing import Callable, Union
+
+from adobe.pdfservices.operation.internal.http.http_method import HttpMethod
+from adobe.pdfservices.operation.internal.http.http_request import HttpRequest
+from adobe.pdfservices.operation.internal.http.transport.http_response import HttpResponse
+from adobe.pdfservices.operation.internal.http.transport.http_transport import HttpTransport
+
+
+class FakeTransport(HttpTransport):
+    """
+    In-process transport that answers requests from registered routes without touching the network. Intended for
+    tests and for benchmarking the SDK itself.
+
+    .. code-block:: python
+
+        transport = FakeTransport()
+        transport.add_route(HttpMethod.POST, r".*/token$",
+                            HttpResponse(200, content=b'{"access_token": "token", "expires_in": 86399}'))
+        client_config = ClientConfig(transport=transport)
+    """
+
+    def __init__(self):
+        self._routes = []
+        self._requests = []
+        self._lock = threading.Lock()
+
+    def add_route(self, method: HttpMethod, url_pattern: str,
+                  response: Union[HttpResponse, Callable[[HttpRequest], HttpResponse]]):
+        """
+        Registers the response returned for requests with the given method whose URL matches :samp:`url_pattern`.
+        Routes registered later take precedence. :samp:`response` may be a callable receiving the
+        :samp:`HttpRequest`.
+        """
+        with self._lock:
+            self._routes.insert(0, (method, re.compile(url_pattern), response))
+
+    @property
+    def requests(self):
+        """ Requests executed so far, in order """
+        with self._lock:
+            return list(self._requests)
+
+    def execute(self, http_request: HttpRequest):
+        with self._lock:
+            self._requests.append(http_request)
+            routes = list(self._routes)
+        for method, url_pattern, response in routes:
+            if method == http_request.method and url_pattern.search(http_request.url):
+                return response(http_request) if callable(response) else response
+        return HttpResponse(404, {"x-request-id": "fake"},
+                            json.dumps({"error": {"code": "NotFound",
+                                                  "message": "No fake route for {method} {url}".format(
+                                                      method=http_request.method.value,
+                                                      url=http_request.url)}}).encode())
@@ -0,0 +1,56 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+from requests.structures import CaseInsensitiveDict
+
+
+class HttpResponse:
+    """
+    Minimal response object mirroring the parts of :samp:`requests.Response` used by the SDK. Used by the transports
+    that are not backed by requests.
+    """
+
+    def __init__(self, status_code: int, headers=None, content: bytes = None, raw=None):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self._content = content
+        self.raw = raw
+        self._consumed = raw is None
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = self.raw.read() if self.raw is not None else b''
+            self._consumed = True
+        return self._content
+
+    def iter_content(self, chunk_size: int = 1024 * 64):
+        if self._content is not None:
+            for i in range(0, len(self._content), chunk_size):
+                yield self._content[i:i + chunk_size]
+            return
+        while True:
+            chunk = self.raw.read(chunk_size)
+            if not chunk:
+                self._consumed = True
+                break
+            yield chunk
+
+    def close(self):
+        if self.raw is not None:
+            # a partially read connection can not be reused, mirror requests.Response.close
+            if not self._consumed:
+                self.raw.close()
+            self.raw.release_conn()
+
+    def __repr__(self):
+        return "<HttpResponse [{status_code}]>".format(status_code=self.status_code)
@@ -0,0 +1,30 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+from abc import ABC, abstractmethod
+
+from adobe.pdfservices.operation.internal.http.http_request import HttpRequest
+
+
+class HttpTransport(ABC):
+    """
+    Performs the network I/O for an :samp:`HttpRequest`. Implementations must be safe to share across threads and
+    return a response exposing :samp:`status_code`, :samp:`headers`, :samp:`content`, :samp:`iter_content` and
+    :samp:`close`, so that status handling in :samp:`ResponseUtil` is identical for every backend.
+    """
+
+    @abstractmethod
+    def execute(self, http_request: HttpRequest):
+        pass
+
+    def close(self):
+        pass
@@ -0,0 +1,68 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from adobe.pdfservices.operation.internal.http.http_method import HttpMethod
+from adobe.pdfservices.operation.internal.http.http_request import HttpRequest
+from adobe.pdfservices.operation.internal.http.request_header_const import DefaultHeaders
+from adobe.pdfservices.operation.internal.http.transport.http_transport import HttpTransport
+
+
+class RequestsTransport(HttpTransport):
+    """
+    Transport backed by requests. When pooled, a :samp:`requests.Session` with an urllib3 connection pool is reused
+    for every call, otherwise each call opens a fresh connection through the requests module functions.
+    """
+
+    def __init__(self, pooled: bool = True, pool_connections: int = 10, pool_maxsize: int = 10,
+                 keep_alive: bool = True):
+        self._session = None
+        if pooled:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+            if not keep_alive:
+                self._session.headers[DefaultHeaders.CONNECTION_HEADER_NAME] = "close"
+
+    def execute(self, http_request: HttpRequest):
+        response = None
+        timeout = (http_request.connect_timeout, http_request.read_timeout)
+        proxies = http_request.proxies.proxy_config_map() if http_request.proxies is not None else None
+        # requests.Session exposes the same verb methods as the requests module
+        client = self._session if self._session is not None else requests
+        if http_request.method == HttpMethod.POST:
+            if http_request.data:
+                response = client.post(url=http_request.url, data=http_request.data, headers=http_request.headers,
+                                       timeout=timeout, proxies=proxies)
+            elif http_request.files:
+                response = client.post(url=http_request.url, files=http_request.files,
+                                       headers=http_request.headers, timeout=timeout, proxies=proxies)
+                for key, val in http_request.files.items():
+                    if hasattr(val[1], 'close'):
+                        val[1].close()
+        elif http_request.method == HttpMethod.GET:
+            response = client.get(url=http_request.url, allow_redirects=True, headers=http_request.headers,
+                                  timeout=timeout, proxies=proxies, stream=http_request.stream)
+        elif http_request.method == HttpMethod.PUT:
+            response = client.put(url=http_request.url, data=http_request.data, headers=http_request.headers,
+                                  timeout=timeout, proxies=proxies)
+        elif http_request.method == HttpMethod.DELETE:
+            response = client.delete(url=http_request.url, headers=http_request.headers, timeout=timeout,
+                                     proxies=proxies)
+        return response
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
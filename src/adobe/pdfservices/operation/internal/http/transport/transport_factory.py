@@ -0,0 +1,36 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+from adobe.pdfservices.operation.config.client_config import ClientConfig
+from adobe.pdfservices.operation.config.transport_type import TransportType
+from adobe.pdfservices.operation.internal.http.transport.http_transport import HttpTransport
+from adobe.pdfservices.operation.internal.http.transport.requests_transport import RequestsTransport
+from adobe.pdfservices.operation.internal.http.transport.urllib3_transport import Urllib3Transport
+
+
+class HttpTransportFactory:
+
+    @staticmethod
+    def get_transport(client_config: ClientConfig) -> HttpTransport:
+        if client_config.get_transport() is not None:
+            return client_config.get_transport()
+        transport_type = client_config.get_transport_type()
+        if transport_type == TransportType.REQUESTS:
+            return RequestsTransport(pooled=True,
+                                     pool_connections=client_config.get_pool_connections(),
+                                     pool_maxsize=client_config.get_pool_maxsize(),
+                                     keep_alive=client_config.is_keep_alive())
+        if transport_type == TransportType.URLLIB3:
+            return Urllib3Transport(pool_connections=client_config.get_pool_connections(),
+                                    pool_maxsize=client_config.get_pool_maxsize(),
+                                    keep_alive=client_config.is_keep_alive())
+        raise ValueError("Invalid transport type provided in client config")
@@ -0,0 +1,91 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import threading
+from urllib.parse import urlencode
+
+import urllib3
+
+from adobe.pdfservices.operation.config.proxy.proxy_server_config import ProxyServerConfig
+from adobe.pdfservices.operation.config.proxy.username_password_credentials import UsernamePasswordCredentials
+from adobe.pdfservices.operation.internal.http.http_method import HttpMethod
+from adobe.pdfservices.operation.internal.http.http_request import HttpRequest
+from adobe.pdfservices.operation.internal.http.request_header_const import DefaultHeaders
+from adobe.pdfservices.operation.internal.http.transport.http_response import HttpResponse
+from adobe.pdfservices.operation.internal.http.transport.http_transport import HttpTransport
+
+
+class Urllib3Transport(HttpTransport):
+    """
+    Transport talking to urllib3 connection pools directly, skipping the request preparation overhead of requests.
+    """
+
+    _FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
+    # Retries are owned by the SDK retry policy; urllib3 only follows redirects, like requests does
+    _NO_RETRIES = urllib3.Retry(total=None, connect=0, read=False, status=0, redirect=30,
+                                respect_retry_after_header=False, raise_on_status=False)
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, keep_alive: bool = True):
+        self._pool_kwargs = {"num_pools": pool_connections, "maxsize": pool_maxsize}
+        self._headers = {} if keep_alive else {DefaultHeaders.CONNECTION_HEADER_NAME: "close"}
+        self._pool_manager = urllib3.PoolManager(headers=self._headers, **self._pool_kwargs)
+        self._proxy_managers = {}
+        self._lock = threading.Lock()
+
+    def execute(self, http_request: HttpRequest):
+        headers = dict(http_request.headers)
+        body = None
+        fields = None
+        if http_request.method in (HttpMethod.POST, HttpMethod.PUT):
+            body = http_request.data
+            if isinstance(body, dict):
+                body = urlencode(body)
+                headers.setdefault(DefaultHeaders.CONTENT_TYPE_HEADER_NAME, self._FORM_CONTENT_TYPE)
+            elif not body and http_request.files:
+                fields = {key: val for key, val in http_request.files.items()}
+        response = self._get_pool_manager(http_request.proxies).request(
+            http_request.method.value, http_request.url,
+            body=body, fields=fields, headers=headers,
+            timeout=urllib3.Timeout(connect=http_request.connect_timeout, read=http_request.read_timeout),
+            redirect=http_request.method == HttpMethod.GET,
+            retries=self._NO_RETRIES,
+            preload_content=not http_request.stream)
+        if fields:
+            for key, val in http_request.files.items():
+                if hasattr(val[1], 'close'):
+                    val[1].close()
+        if http_request.stream:
+            return HttpResponse(response.status, response.headers, raw=response)
+        return HttpResponse(response.status, response.headers, response.data)
+
+    def _get_pool_manager(self, proxies: ProxyServerConfig):
+        if proxies is None:
+            return self._pool_manager
+        proxy_url = "{scheme}://{host}:{port}".format(scheme=proxies.get_proxy_scheme().value,
+                                                      host=proxies.get_host(), port=proxies.get_port())
+        with self._lock:
+            if proxy_url not in self._proxy_managers:
+                proxy_headers = None
+                credentials = proxies.get_credentials()
+                if isinstance(credentials, UsernamePasswordCredentials):
+                    proxy_headers = urllib3.make_headers(proxy_basic_auth="{username}:{password}".format(
+                        username=credentials.get_username(), password=credentials.get_password()))
+                self._proxy_managers[proxy_url] = urllib3.ProxyManager(proxy_url, headers=self._headers,
+                                                                       proxy_headers=proxy_headers,
+                                                                       **self._pool_kwargs)
+            return self._proxy_managers[proxy_url]
+
+    def close(self):
+        self._pool_manager.clear()
+        with self._lock:
+            for proxy_manager in self._proxy_managers.values():
+                proxy_manager.clear()
@@ -0,0 +1,161 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import concurrent.futures
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from adobe.pdfservices.operation.exception.exceptions import SdkException
+from adobe.pdfservices.operation.internal.pdf_services_helper import PDFServicesHelper
+from adobe.pdfservices.operation.job_poller import JobPoller
+from adobe.pdfservices.operation.pipeline import _PipelineStep
+
+
+class _Execution:
+
+    def __init__(self, future: Future, deadline):
+        self.future = future
+        self.deadline = deadline
+        self.current = None
+
+    def remaining(self):
+        return self.deadline - time.monotonic() if self.deadline is not None else None
+
+    def follow(self, inner: Future, on_result):
+        """
+        Makes inner the running step of this execution and calls on_result with its result once it is done.
+        """
+        self.current = inner
+        if self.future.cancelled():
+            inner.cancel()
+            return
+
+        def on_done(f: Future):
+            if f.cancelled():
+                self.future.cancel()
+            elif f.exception() is not None:
+                self.resolve(exception=f.exception())
+            else:
+                try:
+                    on_result(f.result())
+                except Exception as ex:
+                    self.resolve(exception=ex)
+
+        inner.add_done_callback(on_done)
+
+    def resolve(self, result=None, exception: Exception = None):
+        try:
+            if exception is not None:
+                self.future.set_exception(exception)
+            else:
+                self.future.set_result(result)
+        except concurrent.futures.InvalidStateError:
+            # the future was cancelled while the last step was running
+            pass
+
+    def cancel_current(self, future: Future):
+        if future.cancelled() and self.current is not None:
+            self.current.cancel()
+
+
+class JobExecutor:
+    """
+    Runs submit, polling and download of jobs and pipelines on a thread pool shared by a :samp:`PDFServices`
+    instance. Jobs waiting for their result are polled by a :samp:`JobPoller` and do not hold a worker thread.
+    """
+
+    def __init__(self, pdf_services, max_workers: int):
+        self.__context = pdf_services._get_execution_context()
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pdfservices-executor")
+        self.__poller = JobPoller(pdf_services, max_workers=max_workers)
+
+    def submit(self, pdf_services_job, notify_config_list, tag=None) -> Future:
+        return self.__executor.submit(PDFServicesHelper.process_job, self.__context, pdf_services_job,
+                                      notify_config_list, tag)
+
+    def execute(self, pdf_services_job, result_type, notify_config_list, download: bool, timeout,
+                tag=None) -> Future:
+        return self.run_pipeline([_PipelineStep(lambda _: pdf_services_job, result_type, {})], None,
+                                 notify_config_list, download, timeout, tag)
+
+    def poll(self, polling_url: str, result_type, timeout) -> Future:
+        return self.__poller.poll(polling_url, result_type, timeout=timeout)
+
+    def run_pipeline(self, steps: list, input_asset, notify_config_list, download: bool, timeout,
+                     tag=None, delete_intermediate_asset=None) -> Future:
+        """
+        Runs the jobs of the steps one after the other, each with the result asset of the previous one as input.
+        If delete_intermediate_asset is given, it is called with each intermediate result asset once the job
+        consuming it is done, or once the pipeline is done if that job did not run.
+        """
+        execution = _Execution(Future(), time.monotonic() + timeout if timeout is not None else None)
+        execution.future.add_done_callback(execution.cancel_current)
+
+        def run_step(index: int, asset):
+            step = steps[index]
+            is_last = index == len(steps) - 1
+            release_asset = None
+            if index > 0 and delete_intermediate_asset is not None:
+                release_asset = self.__once(lambda: delete_intermediate_asset(asset))
+                execution.future.add_done_callback(lambda f: release_asset())
+
+            def on_polled(pdf_services_response):
+                if is_last and not download:
+                    execution.resolve(pdf_services_response)
+                    return
+                result = pdf_services_response.get_result()
+                if not hasattr(result, 'get_asset'):
+                    raise SdkException("Only results with a single asset can be downloaded.")
+                self.__check_deadline(execution)
+                if not is_last:
+                    run_step(index + 1, result.get_asset())
+                    return
+                # the download is bounded by the time left for the execution as well
+                execution.follow(self.__executor.submit(PDFServicesHelper.get_content, self.__context,
+                                                        result.get_asset(), None, execution.remaining()),
+                                 execution.resolve)
+
+            def on_submitted(location):
+                self.__check_deadline(execution)
+                polled = self.__poller.poll(location, step.result_type, timeout=execution.remaining())
+                if release_asset is not None:
+                    polled.add_done_callback(lambda f: release_asset())
+                execution.follow(polled, on_polled)
+
+            execution.follow(self.submit(step.create_job(asset), notify_config_list, tag), on_submitted)
+
+        run_step(0, input_asset)
+        return execution.future
+
+    @staticmethod
+    def __once(func):
+        lock = threading.Lock()
+        called = []
+
+        def call_once():
+            with lock:
+                if called:
+                    return
+                called.append(True)
+            func()
+        return call_once
+
+    @staticmethod
+    def __check_deadline(execution: _Execution):
+        remaining = execution.remaining()
+        if remaining is not None and remaining <= 0:
+            raise SdkException("Timeout occurred while waiting for job result.")
+
+    def close(self):
+        self.__poller.close()
+        self.__executor.shutdown(cancel_futures=True)
@@ -0,0 +1,77 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import os
+import sqlite3
+import threading
+import time
+
+
+class BatchJournal:
+    """
+    SQLite journal of the progress of the files of a batch run, from which an interrupted run is resumed.
+
+    A file is journaled once its job is submitted, with the polling URL of the job, and again once its result has
+    been written or it has failed. Each update is committed, so a crashed run only redoes the files which were not
+    submitted yet.
+    """
+
+    SUBMITTED = "submitted"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS batch_files ("
+                                     "input_path TEXT PRIMARY KEY, "
+                                     "state TEXT NOT NULL, "
+                                     "polling_url TEXT, "
+                                     "output_path TEXT, "
+                                     "error TEXT, "
+                                     "updated_at REAL NOT NULL)")
+
+    def get_entries(self) -> dict:
+        """
+        Returns the journaled files, as a dict from input path to a dict of their state, polling URL and output path.
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT input_path, state, polling_url, output_path "
+                                            "FROM batch_files").fetchall()
+        return {input_path: {'state': state, 'polling_url': polling_url, 'output_path': output_path}
+                for input_path, state, polling_url, output_path in rows}
+
+    def set_submitted(self, input_path: str, polling_url: str):
+        self.__upsert(input_path, BatchJournal.SUBMITTED, polling_url=polling_url)
+
+    def set_done(self, input_path: str, output_path: str):
+        self.__upsert(input_path, BatchJournal.DONE, output_path=output_path)
+
+    def set_failed(self, input_path: str, error: str):
+        self.__upsert(input_path, BatchJournal.FAILED, error=error)
+
+    def __upsert(self, input_path: str, state: str, polling_url: str = None, output_path: str = None,
+                 error: str = None):
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO batch_files "
+                                     "(input_path, state, polling_url, output_path, error, updated_at) "
+                                     "VALUES (?, ?, ?, ?, ?, ?)",
+                                     (input_path, state, polling_url, output_path, error, time.time()))
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
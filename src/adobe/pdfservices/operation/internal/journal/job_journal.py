@@ -0,0 +1,75 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import os
+import sqlite3
+import threading
+import time
+
+
+class JobJournal:
+    """
+    SQLite journal of the submitted jobs which are not done yet, from which jobs are recovered after the process was
+    restarted.
+
+    A job is journaled when it is submitted and removed once its final status is known. The journal can be shared by
+    the processes and credentials of a node; entries are scoped by client id.
+    """
+
+    def __init__(self, path: str, client_id: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._client_id = client_id
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS jobs ("
+                                     "polling_url TEXT PRIMARY KEY, "
+                                     "client_id TEXT NOT NULL, "
+                                     "operation TEXT NOT NULL, "
+                                     "request_id TEXT, "
+                                     "tag TEXT, "
+                                     "submitted_at REAL NOT NULL)")
+
+    def add(self, polling_url: str, operation: str, request_id: str):
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO jobs "
+                                     "(polling_url, client_id, operation, request_id, submitted_at) "
+                                     "VALUES (?, ?, ?, ?, ?)",
+                                     (polling_url, self._client_id, operation, request_id, time.time()))
+
+    def set_tag(self, polling_url: str, tag: str):
+        with self._lock:
+            self._connection.execute("UPDATE jobs SET tag = ? WHERE polling_url = ?", (tag, polling_url))
+
+    def remove(self, polling_url: str):
+        with self._lock:
+            self._connection.execute("DELETE FROM jobs WHERE polling_url = ?", (polling_url,))
+
+    def get_entries(self) -> list:
+        """
+        Returns the journaled jobs of the client id, oldest first, as dicts of their polling URL, operation, request
+        id, tag and submission time.
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT polling_url, operation, request_id, tag, submitted_at FROM jobs "
+                                            "WHERE client_id = ? ORDER BY submitted_at",
+                                            (self._client_id,)).fetchall()
+        return [{'polling_url': polling_url, 'operation': operation, 'request_id': request_id, 'tag': tag,
+                 'submitted_at': submitted_at}
+                for polling_url, operation, request_id, tag, submitted_at in rows]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
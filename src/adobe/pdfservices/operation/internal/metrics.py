@@ -0,0 +1,46 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import threading
+from collections import defaultdict
+
+
+class Metrics:
+    """
+    Thread-safe named counters collected for an :samp:`ExecutionContext`.
+    """
+
+    RETRIES = "http.retries"
+    RETRIES_EXHAUSTED = "http.retries_exhausted"
+    RATE_LIMITED = "http.rate_limited"
+    UPLOAD_CACHE_HITS = "upload_cache.hits"
+    UPLOAD_CACHE_MISSES = "upload_cache.misses"
+    RESULT_CACHE_HITS = "result_cache.hits"
+    RESULT_CACHE_MISSES = "result_cache.misses"
+    ASSETS_DELETED = "assets.deleted"
+    ASSET_DELETIONS_FAILED = "assets.deletions_failed"
+
+    def __init__(self):
+        self._counters = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: int = 1):
+        with self._lock:
+            self._counters[name] += value
+
+    def get(self, name: str) -> int:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self._counters)
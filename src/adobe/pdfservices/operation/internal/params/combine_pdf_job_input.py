@@ -10,8 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
-
 from adobe.pdfservices.operation.internal.util.json_hint_encoder import JSONHintEncoder
 from adobe.pdfservices.operation.io.asset import Asset
 from adobe.pdfservices.operation.io.cloud_asset import CloudAsset
@@ -43,6 +41,4 @@ class CombinePDFJobInput:
         return self.__page_ranges
 
     def to_json(self):
-        rand = json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
-        print(rand)
-        return rand
+        return JSONHintEncoder.to_json(self)
@@ -11,8 +11,11 @@
 # from Adobe.
 
 import concurrent
+import io
 import json
 import logging
+import os
+import tempfile
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
@@ -26,13 +29,20 @@ from adobe.pdfservices.operation.internal.api.dto.request.pdf_services_api.pdf_s
 from adobe.pdfservices.operation.internal.api.dto.response.pdf_services_api.job_error_response import JobErrorResponse
 from adobe.pdfservices.operation.internal.api.pdf_services_api import PDFServicesAPI
 from adobe.pdfservices.operation.internal.api.storage_api import StorageApi
+from adobe.pdfservices.operation.internal.cache.result_cache import ResultCache
 from adobe.pdfservices.operation.internal.constants.request_key import RequestKey
+from adobe.pdfservices.operation.internal.constants.service_constants import ServiceConstants
 from adobe.pdfservices.operation.internal.exceptions import OperationException
 from adobe.pdfservices.operation.internal.execution_context import ExecutionContext
 from adobe.pdfservices.operation.internal.http import http_client
 from adobe.pdfservices.operation.internal.http.http_method import HttpMethod
 from adobe.pdfservices.operation.internal.http.http_request import HttpRequest
+from adobe.pdfservices.operation.internal.http.request_header_const import DefaultHeaders
+from adobe.pdfservices.operation.internal.http.retry_policy import RetryPolicy
+from adobe.pdfservices.operation.internal.http.transport.http_response import HttpResponse
 from adobe.pdfservices.operation.internal.util.asset_upload_util import AssetUploadUtil
+from adobe.pdfservices.operation.internal.util.job_asset_util import JobAssetUtil
+from adobe.pdfservices.operation.internal.util.upload_stream_util import UploadStreamUtil
 from adobe.pdfservices.operation.internal.util.validation_util import ValidationUtil
 from adobe.pdfservices.operation.io.asset import Asset
 from adobe.pdfservices.operation.io.cloud_asset import CloudAsset
@@ -40,99 +50,191 @@ from adobe.pdfservices.operation.io.stream_asset import StreamAsset
 from adobe.pdfservices.operation.pdf_services_job_status import PDFServicesJobStatus
 from adobe.pdfservices.operation.pdf_services_job_status_response import PDFServicesJobStatusResponse
 from adobe.pdfservices.operation.pdf_services_response import PDFServicesResponse
-from adobe.pdfservices.operation.pdfjobs.result.autotag_pdf_result import AutotagPDFResult
-from adobe.pdfservices.operation.pdfjobs.result.combine_pdf_result import CombinePDFResult
-from adobe.pdfservices.operation.pdfjobs.result.compress_pdf_result import CompressPDFResult
-from adobe.pdfservices.operation.pdfjobs.result.create_pdf_result import CreatePDFResult
-from adobe.pdfservices.operation.pdfjobs.result.delete_pages_result import DeletePagesResult
-from adobe.pdfservices.operation.pdfjobs.result.document_merge_result import DocumentMergePDFResult
-from adobe.pdfservices.operation.pdfjobs.result.eseal_pdf_result import ESealPDFResult
-from adobe.pdfservices.operation.pdfjobs.result.export_pdf_result import ExportPDFResult
-from adobe.pdfservices.operation.pdfjobs.result.export_pdf_form_data_result import ExportPDFFormDataResult
-from adobe.pdfservices.operation.pdfjobs.result.export_pdf_to_images_result import ExportPDFtoImagesResult
-from adobe.pdfservices.operation.pdfjobs.result.import_pdf_form_data_result import ImportPDFFormDataResult
-from adobe.pdfservices.operation.pdfjobs.result.extract_pdf_result import ExtractPDFResult
-from adobe.pdfservices.operation.pdfjobs.result.html_to_pdf_result import HTMLtoPDFResult
-from adobe.pdfservices.operation.pdfjobs.result.insert_pages_result import InsertPagesResult
-from adobe.pdfservices.operation.pdfjobs.result.linearize_pdf_result import LinearizePDFResult
-from adobe.pdfservices.operation.pdfjobs.result.ocr_pdf_result import OCRPDFResult
-from adobe.pdfservices.operation.pdfjobs.result.pdf_accessibility_checker_result import PDFAccessibilityCheckerResult
-from adobe.pdfservices.operation.pdfjobs.result.pdf_properties_result import PDFPropertiesResult
-from adobe.pdfservices.operation.pdfjobs.result.protect_pdf_result import ProtectPDFResult
-from adobe.pdfservices.operation.pdfjobs.result.remove_protection_result import RemoveProtectionResult
-from adobe.pdfservices.operation.pdfjobs.result.reorder_pages_result import ReorderPagesResult
-from adobe.pdfservices.operation.pdfjobs.result.replace_page_result import ReplacePagesResult
-from adobe.pdfservices.operation.pdfjobs.result.rotate_pages_result import RotatePagesResult
-from adobe.pdfservices.operation.pdfjobs.result.split_pdf_result import SplitPDFResult
-from adobe.pdfservices.operation.pdfjobs.result.pdf_watermark_result import PDFWatermarkResult
+from adobe.pdfservices.operation.pdfjobs import result as job_results
+from adobe.pdfservices.operation.upload_assets_result import UploadAssetsResult
 
 
 class PDFServicesHelper:
     _logger = logging.getLogger(__name__)
+    __registered_result_types = {}
 
     @classmethod
     def upload(cls, context: ExecutionContext, input_stream, media_type: str) -> Asset:
+        return cls.upload_stream_asset(context, StreamAsset(input_stream, media_type))
+
+    @classmethod
+    def upload_stream_asset(cls, context: ExecutionContext, stream_asset: StreamAsset) -> Asset:
         cls._logger.info("Started uploading asset")
         ValidationUtil.validate_execution_context(context)
+        media_type = stream_asset.get_mime_type()
         # Generating request id
         x_request_id = str(uuid.uuid1())
         cls._logger.debug(f"Uploading asset with request id {x_request_id}")
 
-        get_upload_uri_response = StorageApi.get_upload_uri(context, media_type, x_request_id)
-        content = json.loads(get_upload_uri_response.content)
-        asset_id = content.get('assetID')
-        StorageApi.upload_to_cloud(context, content.get('uploadUri'), input_stream, media_type)
+        with UploadStreamUtil.open_upload_body(stream_asset) as (upload_body, content_length):
+            content_digest = None
+            if context.upload_cache is not None or context.result_cache is not None:
+                content_digest = UploadStreamUtil.get_content_digest(upload_body)
+
+            asset_id = None
+            cache_key = None
+            if context.upload_cache is not None and content_digest is not None:
+                cache_key = context.upload_cache.get_key(content_digest, media_type)
+                asset_id = context.upload_cache.get(cache_key)
+                if asset_id is not None:
+                    cls._logger.info(f"Reusing uploaded asset {asset_id} from the upload cache")
+
+            if asset_id is None:
+                get_upload_uri_response = StorageApi.get_upload_uri(context, media_type, x_request_id)
+                content = json.loads(get_upload_uri_response.content)
+                asset_id = content.get('assetID')
+                StorageApi.upload_to_cloud(context, content.get('uploadUri'), upload_body, media_type,
+                                           content_length)
+                if cache_key is not None:
+                    context.upload_cache.put(cache_key, asset_id)
+
+            if context.result_cache is not None and content_digest is not None:
+                context.result_cache.register_input(asset_id, content_digest)
 
         cls._logger.info("Finished uploading asset")
         return CloudAsset(asset_id)
 
     @classmethod
-    def upload_assets(cls, context: ExecutionContext, stream_asset_list: []) -> []:
-        cls._logger.info("Started uploading asset")
-        ValidationUtil.validate_execution_context(context)
+    def upload_assets(cls, context: ExecutionContext, executor: ThreadPoolExecutor, stream_asset_list: [],
+                      timeout: float) -> []:
+        assets = [None] * len(stream_asset_list)
+        uploads = cls.iter_upload_assets(context, executor, stream_asset_list, timeout)
+        try:
+            for index, outcome in uploads:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                assets[index] = outcome
+        finally:
+            # stops the uploads which did not start yet if one failed
+            uploads.close()
+        return assets
 
-        assets = []
+    @classmethod
+    def try_upload_assets(cls, context: ExecutionContext, executor: ThreadPoolExecutor, stream_asset_list: [],
+                          timeout: float) -> UploadAssetsResult:
+        assets = [None] * len(stream_asset_list)
+        errors = {}
+        for index, outcome in cls.iter_upload_assets(context, executor, stream_asset_list, timeout):
+            if isinstance(outcome, Exception):
+                errors[index] = outcome
+            else:
+                assets[index] = outcome
+        return UploadAssetsResult(assets, errors)
 
-        # parallelize the uploads
-        callable_tasks = [AssetUploadUtil(context, stream_asset_list[i]) for i in range(len(stream_asset_list))]
+    @classmethod
+    def iter_upload_assets(cls, context: ExecutionContext, executor: ThreadPoolExecutor, stream_asset_list: [],
+                           timeout: float):
+        ValidationUtil.validate_execution_context(context)
+        cls._logger.info("Started uploading {count} assets".format(count=len(stream_asset_list)))
+        deadline = time.monotonic() + timeout if timeout is not None else None
         try:
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                futures = [executor.submit(task) for task in callable_tasks]
-        except Exception:
-            raise SdkException("Error occurred while uploading assets.")
+            futures = {executor.submit(AssetUploadUtil(context, stream_asset)): index
+                       for index, stream_asset in enumerate(stream_asset_list)}
+        except RuntimeError:
+            raise SdkException("Error occurred while uploading assets, PDFServices is closed.")
+        return cls.__iter_completed_uploads(futures, deadline)
 
-        for future in futures:
+    @classmethod
+    def __iter_completed_uploads(cls, futures: dict, deadline: float):
+        pending = set(futures)
+        try:
             try:
-                assets.append(future.result(60 * 5))
+                for future in concurrent.futures.as_completed(
+                        futures, None if deadline is None else max(deadline - time.monotonic(), 0)):
+                    pending.discard(future)
+                    yield futures[future], cls.__get_upload_outcome(future)
             except concurrent.futures.TimeoutError:
-                raise SdkException("Timeout occurred while waiting for future result.")
-            except concurrent.futures.CancelledError:
-                raise SdkException("Future was cancelled.")
-            except Exception as ex:
-                if isinstance(ex.__cause__, (ServiceApiException, SdkException, ServiceUsageException)):
-                    raise ex.__cause__
-                elif isinstance(ex.__cause__, OperationException):
-                    oe = ex.__cause__
-                    raise ServiceApiException(oe.error_message, oe.request_tracking_id, oe.status_code,
-                                              oe.error_code)
-                else:
-                    raise SdkException("Error occurred while uploading.")
-            finally:
-                executor.shutdown(wait=False)
+                for future in pending:
+                    future.cancel()
+                for future in sorted(pending, key=futures.get):
+                    yield futures[future], SdkException("Timeout occurred while uploading the asset.")
+                pending.clear()
+            cls._logger.info("Finished uploading assets")
+        finally:
+            # the iteration was stopped early, the uploads which did not start yet are not needed anymore
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def __get_upload_outcome(future: concurrent.futures.Future):
+        try:
+            return future.result()
+        except concurrent.futures.CancelledError:
+            return SdkException("Upload of the asset was cancelled.")
+        except Exception as ex:
+            errors = (ServiceApiException, SdkException, ServiceUsageException)
+            error = ex if isinstance(ex, errors + (OperationException,)) else ex.__cause__
+            if isinstance(error, errors):
+                return error
+            if isinstance(error, OperationException):
+                return ServiceApiException(error.error_message, error.request_tracking_id, error.status_code,
+                                           error.error_code)
+            return SdkException("Error occurred while uploading.")
 
-        executor.shutdown()
-        # end of parallelize
+    @classmethod
+    def process_job(cls, context: ExecutionContext, pdf_services_job, notify_config_list: List, tag: str) -> str:
+        if context.result_cache is not None:
+            cls.__upload_cached_assets(context, pdf_services_job)
+        location = pdf_services_job._process(context, notify_config_list)
+        if tag is not None and context.job_journal is not None:
+            context.job_journal.set_tag(location, tag)
+        return location
 
-        cls._logger.info("Finished uploading asset")
-        return assets
+    @classmethod
+    def __upload_cached_assets(cls, context: ExecutionContext, pdf_services_job):
+        # result assets served from the result cache are local only, they are uploaded to be used as job input
+        for asset in JobAssetUtil.get_cloud_assets(pdf_services_job):
+            if asset.get_asset_id() is None and ResultCache.is_cached_uri(asset.get_download_uri()):
+                file_path, media_type = context.result_cache.get_content_file(asset.get_download_uri())
+                asset.asset_id = cls.upload_stream_asset(context,
+                                                         StreamAsset.from_file(file_path, media_type)).get_asset_id()
 
     @classmethod
     def submit_job(cls, context: ExecutionContext, platform_api_request: PDFServicesAPIRequest, operation_endpoint: str,
                    x_request_id: str, operation_header_info: str):
         cls._logger.info(f"Started submitting {operation_header_info} job")
         cls._logger.debug(f"Submitting {operation_header_info} job with request id {x_request_id}")
-        return PDFServicesAPI.submit_job(context, platform_api_request, operation_endpoint, x_request_id,
-                                         operation_header_info)
+        cache_key = None
+        if context.result_cache is not None:
+            cache_key = context.result_cache.get_key(platform_api_request, operation_header_info)
+            location = context.result_cache.get_location(cache_key) if cache_key is not None else None
+            if location is not None:
+                cls._logger.info(f"Reusing {operation_header_info} job result from the result cache")
+                return HttpResponse(HTTPStatus.CREATED, {'location': location})
+
+        response = PDFServicesAPI.submit_job(context, platform_api_request, operation_endpoint, x_request_id,
+                                             operation_header_info)
+        if cache_key is not None:
+            context.result_cache.track(response.headers.get('location'), cache_key)
+        if context.job_journal is not None:
+            context.job_journal.add(response.headers.get('location'), operation_header_info, x_request_id)
+        return response
+
+    @classmethod
+    def get_result_type(cls, operation_name: str):
+        """
+        Returns the result class of the jobs of an operation, given by its :samp:`ServiceConstants` name or the name
+        it was registered with.
+        """
+        result_type = cls.__registered_result_types.get(operation_name)
+        if result_type is not None:
+            return result_type
+        result_type_name = cls.__get_result_type_names_by_operation().get(operation_name)
+        return getattr(job_results, result_type_name) if result_type_name is not None else None
+
+    @classmethod
+    def register_result_type(cls, operation_name: str, result_type):
+        """
+        Registers the result class of the jobs of an operation which is not built into the SDK, so that their
+        journaled jobs can be recovered. How results are created from the job status is declared by the result class
+        itself, by overriding :samp:`PDFServicesJobResult._from_job_status`.
+        """
+        cls.__registered_result_types[operation_name] = result_type
 
     @classmethod
     def get_job_result(cls, context: ExecutionContext, location: str, result_type) -> PDFServicesResponse:
@@ -141,7 +243,7 @@ class PDFServicesHelper:
         ValidationUtil.validate_execution_context(context)
         pdf_services_response = None
         while pdf_services_response is None or pdf_services_response.get_status() == PDFServicesJobStatus.IN_PROGRESS.get_value():
-            pdf_services_response = cls.__poll_job(context, location, result_type)
+            pdf_services_response = cls.poll_job(context, location, result_type)
             retry_after = pdf_services_response.get_retry_interval()
 
             try:
@@ -154,17 +256,27 @@ class PDFServicesHelper:
         return pdf_services_response
 
     @classmethod
-    def __poll_job(cls, context: ExecutionContext, location: str, result_type) -> PDFServicesResponse:
+    def poll_job(cls, context: ExecutionContext, location: str, result_type) -> PDFServicesResponse:
         ValidationUtil.validate_execution_context(context)
         # generating x-request-id
         x_request_id = str(uuid.uuid4())
         cls._logger.debug(f"Started polling for status with request id {x_request_id}")
 
         try:
-            pdf_services_response = PDFServicesAPI.status_poll(context, location, x_request_id)
-            response_content_json = pdf_services_response.content
-            response_headers = pdf_services_response.headers
-            response_content = json.loads(response_content_json)
+            if context.result_cache is not None and ResultCache.is_cached_location(location):
+                response_content = context.result_cache.load(location)
+                response_headers = {}
+            else:
+                pdf_services_response = PDFServicesAPI.status_poll(context, location, x_request_id)
+                response_content_json = pdf_services_response.content
+                response_headers = pdf_services_response.headers
+                response_content = json.loads(response_content_json)
+                if context.job_journal is not None and \
+                        response_content.get('status') != PDFServicesJobStatus.IN_PROGRESS.get_value():
+                    context.job_journal.remove(location)
+                if context.result_cache is not None and \
+                        response_content.get('status') != PDFServicesJobStatus.IN_PROGRESS.get_value():
+                    response_content = cls.__cache_result(context, location, response_content)
             response: PDFServicesResponse
 
             if response_content.get('status') == PDFServicesJobStatus.IN_PROGRESS.get_value():
@@ -173,103 +285,22 @@ class PDFServicesHelper:
                                            result=None)
 
             if response_content.get('status') == PDFServicesJobStatus.DONE.get_value():
-                if result_type in cls.__get_single_asset_result_classes():
-                    response = PDFServicesResponse(status=response_content.get('status'),
-                                                   headers=response_headers,
-                                                   result=result_type(
-                                                       CloudAsset(response_content.get('asset').get('assetID'),
-                                                                  response_content.get('asset').get('downloadUri')))
-                                                   )
-
-                elif result_type == AutotagPDFResult:
-                    response = PDFServicesResponse(status=response_content.get('status'),
-                                                   headers=response_headers,
-                                                   result=result_type(
-                                                       CloudAsset(response_content.get('tagged-pdf').get('assetID'),
-                                                                  response_content.get('tagged-pdf').get(
-                                                                      'downloadUri')) if response_content.get(
-                                                           'tagged-pdf') else None,
-                                                       CloudAsset(response_content.get('report').get('assetID'),
-                                                                  response_content.get('report').get(
-                                                                      'downloadUri')) if response_content.get(
-                                                           'report') else None,
-                                                       CloudAsset(response_content.get('resource').get('assetID'),
-                                                                  response_content.get('resource').get(
-                                                                      'downloadUri')) if response_content.get(
-                                                           'resource') else None,
-                                                   )
-                                                   )
-
-                elif result_type == ExtractPDFResult:
-                    response = PDFServicesResponse(status=response_content.get('status'),
-                                                   headers=response_headers,
-                                                   result=result_type(
-                                                       CloudAsset(response_content.get('content').get('assetID'),
-                                                                  response_content.get('content').get(
-                                                                      'downloadUri')) if response_content.get(
-                                                           'content') else None,
-                                                       CloudAsset(response_content.get('resource').get('assetID'),
-                                                                  response_content.get('resource').get(
-                                                                      'downloadUri')) if response_content.get(
-                                                           'resource') else None,
-                                                       PDFServicesHelper.__fetch_extract_content_json(
-                                                           context,
-                                                           response_content.get('content').get('downloadUri')).
-                                                       content if response_content.get('content') else None
-                                                   ))
-
-                elif result_type == ExportPDFtoImagesResult:
-                    response = PDFServicesResponse(status=response_content.get('status'),
-                                                   headers=response_headers,
-                                                   result=result_type(
-                                                       [CloudAsset(asset.get('assetID'), asset.get('downloadUri')) for
-                                                        asset
-                                                        in
-                                                        response_content.get('assetList')]
-                                                       if response_content.get('assetList') else None
-                                                   ))
-
-                elif result_type == SplitPDFResult:
-                    response = PDFServicesResponse(status=response_content.get('status'),
-                                                   headers=response_headers,
-                                                   result=result_type(
-                                                       [CloudAsset(asset.get('assetID'), asset.get('downloadUri')) for
-                                                        asset
-                                                        in
-                                                        response_content.get('assetList')]
-                                                       if response_content.get('assetList') else None,
-                                                       CloudAsset(response_content.get('asset').get('assetID'),
-                                                                  response_content.get('asset').get(
-                                                                      'downloadUri')) if response_content.get(
-                                                           'asset') else None
-                                                   ))
-
-                elif result_type == PDFPropertiesResult:
-                    response = PDFServicesResponse(status=response_content.get('status'),
-                                                   headers=response_headers,
-                                                   result=result_type(response_content.get('metadata')))
-
-                elif result_type == PDFAccessibilityCheckerResult:
-                    response = PDFServicesResponse(status=response_content.get('status'),
-                                                   headers=response_headers,
-                                                   result=result_type(
-                                                       CloudAsset(response_content.get('asset').get('assetID'),
-                                                                  response_content.get('asset').get(
-                                                                      'downloadUri')) if response_content.get(
-                                                           'asset') else None,
-                                                       CloudAsset(response_content.get('report').get('assetID'),
-                                                                  response_content.get('report').get(
-                                                                      'downloadUri')) if response_content.get(
-                                                           'report') else None
-                                                   )
-                                                   )
-
-                else:
-                    raise SdkException(message="No result class found.")
+                # each result class declares how it is created from the job status
+                from_job_status = getattr(result_type, '_from_job_status', None) \
+                    if isinstance(result_type, type) else None
+                if from_job_status is None:
+                    raise SdkException(message="No result class found, {result_type} is not a PDFServicesJobResult "
+                                               "class.".format(result_type=result_type))
+                response = PDFServicesResponse(status=response_content.get('status'),
+                                               headers=response_headers,
+                                               result=from_job_status(context, response_content))
 
         except (AttributeError, TypeError) as ex:
             raise SdkException("Error occurred while polling")
         except OperationException as oe:
+            if context.job_journal is not None and oe.status_code == HTTPStatus.NOT_FOUND:
+                # the job expired, it can not be recovered anymore
+                context.job_journal.remove(location)
             raise ServiceApiException(oe.message, oe.request_tracking_id, oe.status_code, oe.error_code)
 
         if response_content.get('status') == PDFServicesJobStatus.FAILED.get_value():
@@ -282,11 +313,21 @@ class PDFServicesHelper:
         cls._logger.info("Finished polling for status")
         return response
 
+    @classmethod
+    def __cache_result(cls, context: ExecutionContext, location: str, response_content: dict) -> dict:
+        if response_content.get('status') != PDFServicesJobStatus.DONE.get_value():
+            context.result_cache.untrack(location)
+            return response_content
+        return context.result_cache.store(location, response_content,
+                                          lambda uri: cls.__download_uri(context, uri, stream=True))
+
     @classmethod
     def get_job_status(cls, context: ExecutionContext, location: str):
         cls._logger.info("Started getting job status")
 
         ValidationUtil.validate_execution_context(context)
+        if context.result_cache is not None and ResultCache.is_cached_location(location):
+            return PDFServicesJobStatusResponse(status=PDFServicesJobStatus.DONE.get_value(), headers={})
 
         x_request_id = str(uuid.uuid4())
         pdf_services_response = PDFServicesAPI.status_poll(context, location, x_request_id)
@@ -301,29 +342,135 @@ class PDFServicesHelper:
 
     # ADD TRY-EXCEPT BLOCK TO THIS AND ALL OTHER METHODS
     @classmethod
-    def get_content(cls, context: ExecutionContext, asset: Asset) -> StreamAsset:
+    def get_content(cls, context: ExecutionContext, asset: Asset, spool_threshold: int = None,
+                    timeout: float = None) -> StreamAsset:
         cls._logger.info("Started getting content")
+        if spool_threshold is None and timeout is None:
+            response = cls.__download(context, asset, stream=False)
+            cls._logger.info("Finished getting content")
+            return StreamAsset(response.content, response.headers.get('content-type'))
+
+        # keep results up to the threshold in memory, roll larger ones over to a temporary file
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        spooled_file = tempfile.SpooledTemporaryFile(max_size=spool_threshold) if spool_threshold is not None \
+            else io.BytesIO()
+        try:
+            response = cls.__download(context, asset, stream=True, timeout=timeout)
+            try:
+                for chunk in response.iter_content(chunk_size=ServiceConstants.DOWNLOAD_CHUNK_SIZE):
+                    if deadline is not None and time.monotonic() > deadline:
+                        raise SdkException("Timeout occurred while downloading content.")
+                    spooled_file.write(chunk)
+            finally:
+                response.close()
+        except SdkException:
+            spooled_file.close()
+            raise
+        except Exception:
+            spooled_file.close()
+            raise SdkException("Error occurred while downloading content.")
+        cls._logger.info("Finished getting content")
+        if spool_threshold is None:
+            return StreamAsset(spooled_file.getvalue(), response.headers.get('content-type'))
+        spooled_file.seek(0)
+        return StreamAsset(spooled_file, response.headers.get('content-type'))
+
+    @classmethod
+    def get_content_to_path(cls, context: ExecutionContext, asset: Asset, file_path: str, chunk_size: int):
+        cls._logger.info("Started getting content to file")
+        directory = os.path.dirname(os.path.abspath(file_path))
+        response = cls.__download(context, asset, stream=True)
+        # write to a temporary file first so that a failed download never leaves a truncated result behind
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".pdfservices-", suffix=".part")
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    file.write(chunk)
+            os.replace(temp_path, file_path)
+        except Exception:
+            os.remove(temp_path)
+            raise SdkException("Error occurred while downloading content to {file_path}.".format(file_path=file_path))
+        finally:
+            response.close()
+        cls._logger.info("Finished getting content to file")
+
+    @classmethod
+    def get_content_to_shared_memory(cls, context: ExecutionContext, asset: Asset, chunk_size: int):
+        # imported on first use, multiprocessing is only needed with a ResultProcessor
+        from adobe.pdfservices.operation.internal.process.shared_content import SharedContent
+        response = cls.__download(context, asset, stream=True)
+        try:
+            content_length = response.headers.get(DefaultHeaders.CONTENT_LENGTH_HEADER_NAME)
+            if content_length is None:
+                # the size is needed to allocate the segment, without it the content is read into memory first
+                chunks = [response.content]
+                content_length = len(chunks[0])
+            else:
+                chunks = response.iter_content(chunk_size=chunk_size)
+            shared_content = SharedContent(int(content_length), response.headers.get('content-type'))
+            try:
+                buffer = shared_content.get_buffer()
+                offset = 0
+                for chunk in chunks:
+                    if offset + len(chunk) > shared_content.get_size():
+                        raise SdkException("Content is longer than its Content-Length header.")
+                    buffer[offset:offset + len(chunk)] = chunk
+                    offset += len(chunk)
+                shared_content.set_size(offset)
+            except Exception as ex:
+                shared_content.release()
+                if isinstance(ex, SdkException):
+                    raise
+                raise SdkException("Error occurred while downloading content.")
+        finally:
+            response.close()
+        return shared_content
+
+    @classmethod
+    def iter_content(cls, context: ExecutionContext, asset: Asset, chunk_size: int):
+        response = cls.__download(context, asset, stream=True)
+        try:
+            yield from response.iter_content(chunk_size=chunk_size)
+        finally:
+            response.close()
+
+    @classmethod
+    def __download(cls, context: ExecutionContext, asset: Asset, stream: bool, timeout: float = None):
         ValidationUtil.validate_execution_context(context)
         asset.__class__ = CloudAsset
-        uri = asset.get_download_uri()
-
         cls._logger.debug(f"Getting content for asset id {asset.get_asset_id()}")
+        return cls.__download_uri(context, asset.get_download_uri(), stream, timeout)
+
+    @classmethod
+    def __download_uri(cls, context: ExecutionContext, uri: str, stream: bool, timeout: float = None):
+        if context.result_cache is not None and ResultCache.is_cached_uri(uri):
+            return context.result_cache.open_content(uri)
+
+        connect_timeout = context.client_config.get_connect_timeout()
+        read_timeout = context.client_config.get_read_timeout()
+        if timeout is not None:
+            # the socket waits are capped by the time left for the download
+            timeout = max(timeout, 0.001)
+            connect_timeout = min(connect_timeout, timeout) if connect_timeout is not None else timeout
+            read_timeout = min(read_timeout, timeout) if read_timeout is not None else timeout
         start_time = datetime.now()
         http_request = HttpRequest(http_method=HttpMethod.GET,
                                    request_key=RequestKey.DOWNLOAD,
                                    headers={},
                                    url=uri,
-                                   connect_timeout=context.client_config.get_connect_timeout(),
-                                   read_timeout=context.client_config.get_read_timeout(),
-                                   proxies=context.client_config.get_proxy_server_config())
+                                   connect_timeout=connect_timeout,
+                                   read_timeout=read_timeout,
+                                   proxies=context.client_config.get_proxy_server_config(),
+                                   transport=context.transport,
+                                   retry_policy=context.retry_policy,
+                                   rate_limiter=context.rate_limiter,
+                                   stream=stream)
 
         response = http_client.process_request(http_request=http_request,
                                                success_status_codes=[HTTPStatus.OK, HTTPStatus.ACCEPTED],
                                                error_response_handler=StorageApi.handle_error_response)
-        logging.debug(f'Upload Operation Latency(ms): {(datetime.now() - start_time).microseconds / 1000}')
-
-        cls._logger.info("Finished getting content")
-        return StreamAsset(response.content, response.headers.get('content-type'))
+        logging.debug(f'Download Operation Latency(ms): {(datetime.now() - start_time).microseconds / 1000}')
+        return response
 
     @classmethod
     def refresh_download_uri(cls, context: ExecutionContext, asset: Asset) -> CloudAsset:
@@ -332,6 +479,9 @@ class PDFServicesHelper:
 
         if not isinstance(asset, CloudAsset):
             raise SdkException("Only internal storage is supported for refreshing download URI.")
+        if asset.get_asset_id() is None and ResultCache.is_cached_uri(asset.get_download_uri()):
+            # served from the result cache, its URI does not expire
+            return asset
 
         # generating x-request-id
         x_request_id = str(uuid.uuid1())
@@ -352,7 +502,7 @@ class PDFServicesHelper:
         return CloudAsset(asset_id, json.loads(get_download_uri_response.content).get('downloadUri'))
 
     @classmethod
-    def delete_asset(cls, context: ExecutionContext, asset: Asset):
+    def delete_asset(cls, context: ExecutionContext, asset: Asset, retry_policy: RetryPolicy = None):
         cls._logger.info("Started deleting asset")
 
         ValidationUtil.validate_execution_context(context)
@@ -362,22 +512,54 @@ class PDFServicesHelper:
         # generating x-request-id
         x_request_id = str(uuid.uuid4())
         asset_id = asset.get_asset_id()
+        if asset_id is None and ResultCache.is_cached_uri(asset.get_download_uri()):
+            # served from the result cache, not stored by the service
+            cls._logger.info("Skipped deleting asset from the result cache")
+            return
 
         cls._logger.debug(f"Deleting asset with asset id {asset_id} and request id {x_request_id}")
 
-        PDFServicesAPI.delete_asset(context, asset_id, x_request_id)
+        PDFServicesAPI.delete_asset(context, asset_id, x_request_id, retry_policy)
+        if context.upload_cache is not None:
+            context.upload_cache.invalidate(asset_id)
 
         cls._logger.info("Finished deleting asset")
 
     @classmethod
-    def __get_single_asset_result_classes(cls) -> List:
-        return [LinearizePDFResult, DocumentMergePDFResult, DeletePagesResult,
-                RotatePagesResult, ESealPDFResult, CompressPDFResult,
-                CombinePDFResult, ExportPDFResult, ExportPDFFormDataResult, ImportPDFFormDataResult, OCRPDFResult, ProtectPDFResult,
-                InsertPagesResult, ReplacePagesResult, ReorderPagesResult,
-                CreatePDFResult, HTMLtoPDFResult, RemoveProtectionResult, PDFWatermarkResult]
+    def __get_result_type_names_by_operation(cls) -> dict:
+        return {ServiceConstants.AUTOTAG_OPERATION_NAME: 'AutotagPDFResult',
+                ServiceConstants.COMBINE_PDF_NAME: 'CombinePDFResult',
+                ServiceConstants.COMPRESS_PDF_OPERATION_NAME: 'CompressPDFResult',
+                ServiceConstants.CREATE_OPERATION_NAME: 'CreatePDFResult',
+                ServiceConstants.DELETE_PAGES_OPERATION_NAME: 'DeletePagesResult',
+                ServiceConstants.DOCUMENT_MERGE_OPERATION_NAME: 'DocumentMergePDFResult',
+                ServiceConstants.ESEAL_PDF_NAME: 'ESealPDFResult',
+                ServiceConstants.EXPORT_PDF_FORM_DATA_OPERATION_NAME: 'ExportPDFFormDataResult',
+                ServiceConstants.EXPORT_PDF_OPERATION_NAME: 'ExportPDFResult',
+                ServiceConstants.PDF_TO_IMAGES_OPERATION_NAME: 'ExportPDFtoImagesResult',
+                ServiceConstants.EXTRACT_OPERATION_NAME: 'ExtractPDFResult',
+                ServiceConstants.HTML_TO_PDF_OPERATION_NAME: 'HTMLtoPDFResult',
+                ServiceConstants.IMPORT_PDF_FORM_DATA_OPERATION_NAME: 'ImportPDFFormDataResult',
+                ServiceConstants.INSERT_PAGES_OPERATION_NAME: 'InsertPagesResult',
+                ServiceConstants.LINEARIZE_PDF_OPERATION_NAME: 'LinearizePDFResult',
+                ServiceConstants.OCR_PDF_OPERATION_NAME: 'OCRPDFResult',
+                ServiceConstants.PDF_ACCESSIBILITY_CHECKER_OPERATION_NAME: 'PDFAccessibilityCheckerResult',
+                ServiceConstants.PDF_PROPERTIES_OPERATION_NAME: 'PDFPropertiesResult',
+                ServiceConstants.PDF_WATERMARK_OPERATION_NAME: 'PDFWatermarkResult',
+                ServiceConstants.PROTECT_PDF_NAME: 'ProtectPDFResult',
+                ServiceConstants.REMOVE_PROTECTION_OPERATION_NAME: 'RemoveProtectionResult',
+                ServiceConstants.REORDER_PAGES_OPERATION_NAME: 'ReorderPagesResult',
+                ServiceConstants.REPLACE_PAGES_OPERATION_NAME: 'ReplacePagesResult',
+                ServiceConstants.ROTATE_PAGES_OPERATION_NAME: 'RotatePagesResult',
+                ServiceConstants.SPLIT_PDF_OPERATION_NAME: 'SplitPDFResult'}
 
     @classmethod
-    def __fetch_extract_content_json(cls, context: ExecutionContext, download_uri: str):
+    def get_extract_content_json(cls, context: ExecutionContext, download_uri: str) -> bytes:
+        if context.result_cache is not None and ResultCache.is_cached_uri(download_uri):
+            response = context.result_cache.open_content(download_uri)
+            try:
+                return response.content
+            finally:
+                response.close()
         x_request_id = str(uuid.uuid1())
-        return PDFServicesAPI.get_response(context, download_uri, x_request_id)
+        return PDFServicesAPI.get_response(context, download_uri, x_request_id).content
@@ -0,0 +1,63 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+from multiprocessing import shared_memory
+
+
+class SharedContent:
+    """
+    Content of an asset held in a shared memory segment, so that it is handed to worker processes by name instead of
+    being pickled and copied through a pipe. The segment is owned by the process which allocated it and is freed by
+    :meth:`release`.
+    """
+
+    def __init__(self, size: int, mime_type: str):
+        # a segment can not be empty, empty content still gets a single byte which is never exposed
+        self._shared_memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self._size = size
+        self._mime_type = mime_type
+
+    def get_name(self) -> str:
+        return self._shared_memory.name
+
+    def get_size(self) -> int:
+        return self._size
+
+    def get_mime_type(self) -> str:
+        return self._mime_type
+
+    def get_buffer(self) -> memoryview:
+        return self._shared_memory.buf
+
+    def set_size(self, size: int):
+        self._size = size
+
+    def release(self):
+        self._shared_memory.close()
+        self._shared_memory.unlink()
+
+
+def process_shared_content(post_processor, name: str, size: int, mime_type: str, args: tuple):
+    """
+    Runs in a worker process: attaches to the segment and calls the post-processor with a read-only view of the
+    content, its mime type and the extra arguments.
+    """
+    segment = shared_memory.SharedMemory(name=name)
+    content = segment.buf[:size].toreadonly()
+    try:
+        return post_processor(content, mime_type, *args)
+    finally:
+        try:
+            content.release()
+            segment.close()
+        except BufferError:
+            # the post-processor kept a view on the content, the mapping is then dropped when the worker exits
+            pass
@@ -22,5 +22,4 @@ class AssetUploadUtil:
 
     def __call__(self):
         from adobe.pdfservices.operation.internal.pdf_services_helper import PDFServicesHelper
-        return PDFServicesHelper.upload(self.__context, self.__stream_asset.get_input_stream(),
-                                        self.__stream_asset.get_mime_type())
+        return PDFServicesHelper.upload_stream_asset(self.__context, self.__stream_asset)
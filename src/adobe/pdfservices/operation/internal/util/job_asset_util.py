@@ -0,0 +1,41 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+from adobe.pdfservices.operation.io.cloud_asset import CloudAsset
+
+
+class JobAssetUtil:
+    """
+    Finds the cloud assets referenced by jobs, their params and results.
+    """
+    _PACKAGE = "adobe.pdfservices"
+
+    @classmethod
+    def get_cloud_assets(cls, obj) -> list:
+        assets = []
+        cls.__collect(obj, assets, set())
+        return assets
+
+    @classmethod
+    def __collect(cls, obj, assets: list, visited: set):
+        if isinstance(obj, CloudAsset):
+            assets.append(obj)
+        elif isinstance(obj, (list, tuple, set)):
+            for item in obj:
+                cls.__collect(item, assets, visited)
+        elif isinstance(obj, dict):
+            for item in obj.values():
+                cls.__collect(item, assets, visited)
+        elif hasattr(obj, '__dict__') and type(obj).__module__.startswith(cls._PACKAGE) and id(obj) not in visited:
+            visited.add(id(obj))
+            for item in vars(obj).values():
+                cls.__collect(item, assets, visited)
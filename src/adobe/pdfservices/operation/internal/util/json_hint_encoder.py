@@ -14,69 +14,108 @@ import json
 
 
 class JSONHintEncoder(json.JSONEncoder):
+    """
+    Encodes objects declaring a :samp:`json_hint`, which maps attribute names to JSON names, as JSON objects, leaving
+    out attributes which are None.
+
+    The fields of each class are resolved once from its :samp:`json_hint` and cached; :meth:`default` then only builds
+    a shallow dict, and nested hinted objects, lists and dicts are encoded by the same single pass of the encoder.
+    """
+    __fields_by_class = {}
+
     def default(self, obj):
-        if hasattr(obj, 'json_hint'):
-            dict_to_return = {}
-            for fieldObj in obj.json_hint:
-                field = fieldObj
-                dict_field = obj.json_hint[field]
-                if isinstance(dict_field, dict):
-                    dict_field = dict_field['name']
-                field_val = getattr(obj, field, None)
-                if isinstance(field_val, str):
-                    dict_to_return[dict_field] = field_val
-                elif isinstance(field_val, list):
-                    result = []
-                    for list_element in field_val:
-                        if isinstance(field_val, str):
-                            result.append(list_element)
-                        else:
-                            result.append(json.loads(json.dumps(list_element, cls=JSONHintEncoder)))
-                    dict_to_return[dict_field] = result
-                else:
-                    if field_val is not None:
-                        dict_to_return[dict_field] = json.loads(json.dumps(field_val, cls=JSONHintEncoder))
-            return dict_to_return
-        return json.JSONEncoder.default(self, obj)
+        fields = JSONHintEncoder.get_fields(type(obj))
+        if fields is None:
+            return json.JSONEncoder.default(self, obj)
+        return {name: value for attr, name in fields if (value := getattr(obj, attr, None)) is not None}
+
+    @staticmethod
+    def get_fields(obj_class):
+        """
+        :return: Pairs of attribute name and JSON name of the class, or None if it does not declare a
+            :samp:`json_hint`.
+        """
+        try:
+            return JSONHintEncoder.__fields_by_class[obj_class]
+        except KeyError:
+            pass
+        json_hint = getattr(obj_class, 'json_hint', None)
+        fields = None
+        if json_hint is not None:
+            fields = tuple((attr, hint['name'] if isinstance(hint, dict) else hint) for attr, hint in json_hint.items())
+        JSONHintEncoder.__fields_by_class[obj_class] = fields
+        return fields
+
+    @staticmethod
+    def to_json(obj):
+        """
+        :return: Compact JSON of the object, as sent to PDF Services API.
+        """
+        return _compact_encoder.encode(obj)
+
+
+_compact_encoder = JSONHintEncoder(separators=(',', ':'))
 
 
 class JSONHintDecoder:
+    """
+    Decodes JSON objects into instances of classes declaring a :samp:`json_hint`. A hint value is either the JSON name
+    of the attribute, or a dict with its :samp:`name` and the hinted :samp:`type` into which a JSON object value, or
+    the JSON objects of a list value, are decoded.
+
+    The reverse map of each class is resolved once and cached, and the class being decoded is passed down the
+    traversal instead of being shared state, so decoding is reentrant and can run concurrently from several threads.
+    Instances are created without calling their constructor, and their :samp:`post_process` method, if any, is called
+    once their attributes are set.
+    """
+    __reverse_maps = {}
 
     @staticmethod
-    def rev(dct):
-        result = {}
-        for key, val in dct.items():
-            cls_type = str
-            rev_key = val
-            if isinstance(val, dict):
-                cls_type = val['type']
-                rev_key = val['name']
-            result[rev_key] = [key, cls_type]
-        return result
+    def from_json(json_str, obj_class):
+        """
+        :return: Instance of the class decoded from the JSON string.
+        """
+        return JSONHintDecoder.as_class(json.loads(json_str), obj_class)
 
     @staticmethod
-    def as_class(dct):
-        reverse_map = JSONHintDecoder.rev(getattr(JSONHintDecoder.current_class, 'json_hint'))
-        obj = JSONHintDecoder.current_class()
+    def as_class(dct, obj_class):
+        """
+        :return: Instance of the class decoded from the dict parsed from a JSON object.
+        """
+        reverse_map = JSONHintDecoder.get_reverse_map(obj_class)
+        obj = obj_class.__new__(obj_class)
         for key, val in dct.items():
-            if key in reverse_map:
-                child_class = reverse_map[key][1]
-                class_attr = reverse_map[key][0]
+            field = reverse_map.get(key)
+            if field is None:
+                continue
+            class_attr, child_class = field
+            if child_class is not None:
                 if isinstance(val, dict):
-                    JSONHintDecoder.current_class = child_class
-                    setattr(obj, class_attr, JSONHintDecoder.as_class(val))
-                else:
-                    if isinstance(val, (int, str, bool)):
-                        setattr(obj, class_attr, val)
-                    else:
-                        result = []
-                        for lobj in val:
-                            if not isinstance(lobj, dict):
-                                result.append(lobj)
-                            else:
-                                JSONHintDecoder.current_class = child_class
-                                result.append(JSONHintDecoder.as_class(lobj))
-                        setattr(obj, class_attr, result)
-        if hasattr(obj, 'post_process'):
-            getattr(obj, 'post_process')()
+                    val = JSONHintDecoder.as_class(val, child_class)
+                elif isinstance(val, list):
+                    val = [JSONHintDecoder.as_class(elem, child_class) if isinstance(elem, dict) else elem
+                           for elem in val]
+            setattr(obj, class_attr, val)
+        post_process = getattr(obj, 'post_process', None)
+        if post_process is not None:
+            post_process()
         return obj
+
+    @staticmethod
+    def get_reverse_map(obj_class):
+        """
+        :return: Dict from JSON name to the attribute name and the hinted class of its value, or None if the value
+            is kept as parsed.
+        """
+        try:
+            return JSONHintDecoder.__reverse_maps[obj_class]
+        except KeyError:
+            pass
+        reverse_map = {}
+        for attr, hint in obj_class.json_hint.items():
+            if isinstance(hint, dict):
+                reverse_map[hint['name']] = (attr, hint.get('type'))
+            else:
+                reverse_map[hint] = (attr, None)
+        JSONHintDecoder.__reverse_maps[obj_class] = reverse_map
+        return reverse_map
@@ -0,0 +1,127 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import hashlib
+import io
+import os
+import tempfile
+from contextlib import contextmanager
+from functools import partial
+
+from adobe.pdfservices.operation.io.stream_asset import StreamAsset
+
+# Iterables of unknown length are kept in memory up to this size before spooling to disk
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+_DIGEST_CHUNK_SIZE = 1024 * 1024
+
+
+class _ChunkReader(io.RawIOBase):
+    """ File-like view over an iterable of bytes chunks with a known total length """
+
+    def __init__(self, chunks, length: int):
+        self._chunks = iter(chunks)
+        self._length = length
+        self._buffer = b''
+
+    def __len__(self):
+        return self._length
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class UploadStreamUtil:
+
+    @staticmethod
+    @contextmanager
+    def open_upload_body(stream_asset: StreamAsset):
+        """
+        Yields the request body for the stream asset and its length in bytes. File-like sources are streamed as they
+        are, files are opened for the duration of the upload only.
+        """
+        if stream_asset.get_file_path() is not None:
+            with open(stream_asset.get_file_path(), 'rb') as file:
+                yield file, UploadStreamUtil.__remaining_length(file)
+            return
+
+        input_stream = stream_asset.get_input_stream()
+        if isinstance(input_stream, (bytes, bytearray, memoryview)):
+            yield input_stream, len(input_stream)
+        elif isinstance(input_stream, str):
+            yield input_stream, len(input_stream.encode('utf-8'))
+        elif hasattr(input_stream, 'read') and hasattr(input_stream, 'seek') and hasattr(input_stream, 'tell'):
+            yield input_stream, UploadStreamUtil.__remaining_length(input_stream)
+        elif stream_asset.get_content_length() is not None:
+            yield _ChunkReader(UploadStreamUtil.__iter_chunks(input_stream), stream_asset.get_content_length()), \
+                stream_asset.get_content_length()
+        else:
+            # the length of a presigned upload must be known up front, spool chunks to find it out
+            with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as spooled_file:
+                for chunk in UploadStreamUtil.__iter_chunks(input_stream):
+                    spooled_file.write(chunk)
+                length = spooled_file.tell()
+                spooled_file.seek(0)
+                yield spooled_file, length
+
+    @staticmethod
+    def get_content_digest(upload_body):
+        """
+        Returns the SHA-256 hex digest of an upload body yielded by :samp:`open_upload_body`, or None if it can only
+        be read once. Streams are read to the end and rewound to their position.
+        """
+        digest = hashlib.sha256()
+        if isinstance(upload_body, (bytes, bytearray, memoryview)):
+            digest.update(upload_body)
+        elif isinstance(upload_body, str):
+            digest.update(upload_body.encode('utf-8'))
+        elif hasattr(upload_body, 'read') and hasattr(upload_body, 'seek') and hasattr(upload_body, 'tell') \
+                and (not hasattr(upload_body, 'seekable') or upload_body.seekable()):
+            position = upload_body.tell()
+            chunk = upload_body.read(_DIGEST_CHUNK_SIZE)
+            while chunk:
+                digest.update(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+                chunk = upload_body.read(_DIGEST_CHUNK_SIZE)
+            upload_body.seek(position)
+        else:
+            return None
+        return digest.hexdigest()
+
+    @staticmethod
+    def __iter_chunks(input_stream):
+        if hasattr(input_stream, 'read'):
+            return iter(partial(input_stream.read, _CHUNK_SIZE), b'')
+        return input_stream
+
+    @staticmethod
+    def __remaining_length(file) -> int:
+        position = file.tell()
+        file.seek(0, os.SEEK_END)
+        end = file.tell()
+        file.seek(position)
+        return end - position
@@ -10,8 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
-
 from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
 from adobe.pdfservices.operation.internal.util.json_hint_encoder import JSONHintEncoder
 from adobe.pdfservices.operation.io.asset import Asset
@@ -65,4 +63,4 @@ class ExternalAsset(Asset):
         :return: representation of ExternalAsset as a JSON string, used internally by the SDK.
         :rtype: str
         """
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
@@ -10,25 +10,51 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
+
 class StreamAsset:
     """
     This class encapsulates input stream and the media type of
     :class:`Asset<adobe.pdfservices.operation.io.asset.Asset>`.
+
+    The input stream can be bytes, a binary file object, an :samp:`mmap` or an iterable of bytes chunks; the latter
+    three are streamed while uploading without being read into memory first. Use :meth:`from_file` to upload a file
+    which is only opened when its upload starts.
     """
-    def __init__(self, input_stream, mime_type):
+    def __init__(self, input_stream, mime_type, *, content_length: int = None):
         """
         Constructs an instance of :samp:`StreamAsset`.
 
         :param input_stream: input stream of the asset; can not be None.
         :param mime_type: mime type of the input stream; can not be None.
         :type mime_type: str
+        :param content_length: number of bytes produced by an iterable input stream. If not provided, the chunks are
+            spooled to a temporary file before uploading to determine it. (Optional, use key-value)
+        :type content_length: int
         """
         self.input_stream = input_stream
         self.mime_type = mime_type
+        self.content_length = content_length
+        self.file_path = None
+
+    @classmethod
+    def from_file(cls, file_path: str, mime_type: str):
+        """
+        Creates a :samp:`StreamAsset` for a file, which is opened lazily and streamed when uploaded.
+
+        :param file_path: path of the file; can not be None.
+        :type file_path: str
+        :param mime_type: mime type of the file; can not be None.
+        :type mime_type: str
+        :return: A new instance of StreamAsset.
+        :rtype: StreamAsset
+        """
+        stream_asset = cls(None, mime_type)
+        stream_asset.file_path = file_path
+        return stream_asset
 
     def get_input_stream(self):
         """
-        :return: the input stream of the asset.
+        :return: the input stream of the asset, None if it was created from a file path.
         """
         return self.input_stream
 
@@ -38,3 +64,17 @@ class StreamAsset:
         :rtype: str
         """
         return self.mime_type
+
+    def get_content_length(self):
+        """
+        :return: the number of bytes produced by an iterable input stream, if provided.
+        :rtype: int
+        """
+        return self.content_length
+
+    def get_file_path(self):
+        """
+        :return: the path of the file backing the asset, if it was created from a file path.
+        :rtype: str
+        """
+        return self.file_path
@@ -0,0 +1,217 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import concurrent.futures
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Callable, Iterator, Union
+
+from adobe.pdfservices.operation.exception.exceptions import SdkException
+from adobe.pdfservices.operation.internal.constants.custom_error_messages import CustomErrorMessages
+from adobe.pdfservices.operation.internal.pdf_services_helper import PDFServicesHelper
+from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
+from adobe.pdfservices.operation.internal.util.object_util import ObjectUtil
+from adobe.pdfservices.operation.internal.util.string_util import StringUtil
+from adobe.pdfservices.operation.pdf_services import PDFServices
+from adobe.pdfservices.operation.pdf_services_job_status import PDFServicesJobStatus
+from adobe.pdfservices.operation.pdfjobs.result.pdf_services_job_result import PDFServicesJobResult
+
+
+class _PolledJob:
+
+    def __init__(self, polling_url: str, result_type, future: Future, deadline: Optional[float]):
+        self.polling_url = polling_url
+        self.result_type = result_type
+        self.future = future
+        self.deadline = deadline
+
+
+class JobPoller:
+    """
+    Tracks the results of many submitted
+    :class:`PDFServicesJob<adobe.pdfservices.operation.pdf_services_job.PDFServicesJob>` from a single scheduler
+    thread.
+
+    Jobs are kept in a heap ordered by the time of their next status poll, and due polls are issued from a small pool
+    of worker threads. Each job is represented by a :class:`concurrent.futures.Future` which is resolved with the
+    :class:`PDFServicesResponse<adobe.pdfservices.operation.pdf_services_response.PDFServicesResponse>` once the job
+    is no longer in progress, so the number of threads does not depend on the number of jobs being tracked.
+    """
+
+    @enforce_types
+    def __init__(self, pdf_services: PDFServices, *, max_workers: int = 4):
+        """
+        Constructs a new :samp:`JobPoller` polling with the credentials and configuration of the given PDFServices.
+
+        :param pdf_services: PDFServices instance used to poll the jobs; can not be None.
+        :type pdf_services: PDFServices
+        :param max_workers: Maximum number of status polls issued concurrently. Default value is 4.
+            (Optional, use key-value)
+        :type max_workers: int
+        """
+        if max_workers <= 0:
+            raise ValueError("Max workers must be greater than 0")
+        self.__context = pdf_services._get_execution_context()
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pdfservices-poller")
+        self.__heap = []
+        self.__futures = set()
+        self.__sequence = itertools.count()
+        self.__condition = threading.Condition()
+        self.__scheduler = None
+        self.__closed = False
+        self._logger = logging.getLogger(__name__)
+
+    @enforce_types
+    def poll(self, polling_url: str, result_type: PDFServicesJobResult.__class__, *,
+             callback: Optional[Callable] = None, timeout: Optional[Union[int, float]] = None) -> Future:
+        """
+        Starts tracking a submitted job.
+
+        :param polling_url: polling URL returned when submitting the job; can not be None.
+        :type polling_url: str
+        :param result_type: result class for
+            :class:`PDFServicesJob<adobe.pdfservices.operation.pdf_services_job.PDFServicesJob>`, it will be an
+            implementation of PDFServicesJobResult; can not be None.
+        :type result_type: PDFServicesJobResult.__class__
+        :param callback: Called with the future once the job is done, has failed or was cancelled.
+            (Optional, use key-value)
+        :type callback: Callable
+        :param timeout: Maximum number of seconds to poll the job for, after which the future fails with an
+            SdkException. (Optional, use key-value)
+        :type timeout: float
+        :return: future resolved with the PDFServicesResponse of the job, or with the ServiceApiException or
+            SdkException raised while polling it. Cancelling the future stops polling the job.
+        :rtype: concurrent.futures.Future
+        """
+        if StringUtil.is_blank(polling_url):
+            raise SdkException(CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE_OR_EMPTY.format("Polling URL"))
+        ObjectUtil.require_not_null(result_type,
+                                    CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Result class object"))
+
+        now = time.monotonic()
+        deadline = now + timeout if timeout is not None else None
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        with self.__condition:
+            if self.__closed:
+                raise SdkException("Job poller is closed.")
+            self.__futures.add(future)
+            future.add_done_callback(self.__discard)
+            self.__schedule(_PolledJob(polling_url, result_type, future, deadline), now)
+            if self.__scheduler is None:
+                self.__scheduler = threading.Thread(target=self.__run, name="pdfservices-poller-scheduler",
+                                                    daemon=True)
+                self.__scheduler.start()
+        return future
+
+    def as_completed(self, timeout: Optional[float] = None) -> Iterator[Future]:
+        """
+        Yields the futures of the jobs currently tracked as they complete.
+
+        :param timeout: Maximum number of seconds to wait for all the jobs. (Optional)
+        :type timeout: float
+        :raises TimeoutError: If the jobs are not all done before the timeout.
+        :return: Iterator over the completed futures.
+        """
+        with self.__condition:
+            futures = list(self.__futures)
+        return concurrent.futures.as_completed(futures, timeout=timeout)
+
+    def get_pending_count(self) -> int:
+        """
+        :return: the number of jobs which are still being polled.
+        :rtype: int
+        """
+        with self.__condition:
+            return len(self.__futures)
+
+    def close(self):
+        """
+        Stops polling, cancels the futures of the jobs still in progress and releases the threads.
+        """
+        with self.__condition:
+            self.__closed = True
+            pending = list(self.__futures)
+            self.__heap.clear()
+            self.__condition.notify()
+        for future in pending:
+            future.cancel()
+        if self.__scheduler is not None:
+            self.__scheduler.join()
+        self.__executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __discard(self, future: Future):
+        with self.__condition:
+            self.__futures.discard(future)
+
+    def __schedule(self, job: _PolledJob, poll_time: float):
+        # callers hold the condition
+        if job.deadline is not None:
+            poll_time = min(poll_time, job.deadline)
+        heapq.heappush(self.__heap, (poll_time, next(self.__sequence), job))
+        if self.__heap[0][2] is job:
+            self.__condition.notify()
+
+    def __run(self):
+        with self.__condition:
+            while not self.__closed:
+                if not self.__heap:
+                    self.__condition.wait()
+                    continue
+                delay = self.__heap[0][0] - time.monotonic()
+                if delay > 0:
+                    self.__condition.wait(delay)
+                    continue
+                job = heapq.heappop(self.__heap)[2]
+                if not job.future.cancelled():
+                    self.__executor.submit(self.__poll, job)
+
+    def __poll(self, job: _PolledJob):
+        if job.future.cancelled():
+            return
+        if job.deadline is not None and time.monotonic() >= job.deadline:
+            self.__resolve(job.future, exception=SdkException("Timeout occurred while waiting for job result."))
+            return
+        try:
+            response = PDFServicesHelper.poll_job(self.__context, job.polling_url, job.result_type)
+            if response.get_status() == PDFServicesJobStatus.IN_PROGRESS.get_value():
+                retry_after = response.get_retry_interval()
+                self._logger.debug(f"Retry polling for job result after {retry_after} seconds")
+                with self.__condition:
+                    if not self.__closed:
+                        self.__schedule(job, time.monotonic() + retry_after)
+                return
+            self.__resolve(job.future, response)
+        except Exception as ex:
+            self.__resolve(job.future, exception=ex)
+
+    @staticmethod
+    def __resolve(future: Future, result=None, exception: Exception = None):
+        try:
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+        except concurrent.futures.InvalidStateError:
+            # the future was cancelled while the last poll was running
+            pass
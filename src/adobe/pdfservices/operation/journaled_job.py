@@ -0,0 +1,76 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+from datetime import datetime
+
+
+class JournaledJob:
+    """
+    A submitted :class:`PDFServicesJob<adobe.pdfservices.operation.pdf_services_job.PDFServicesJob>` read from the
+    job journal, whose result was not retrieved yet.
+    """
+
+    def __init__(self, polling_url: str, result_type, request_id: str, tag: str, submitted_at: datetime):
+        """
+        Constructs a new :samp:`JournaledJob`.
+
+        :param polling_url: polling URL of the job.
+        :type polling_url: str
+        :param result_type: result class of the job.
+        :type result_type: PDFServicesJobResult.__class__
+        :param request_id: request id with which the job was submitted.
+        :type request_id: str
+        :param tag: tag given when submitting the job, if any.
+        :type tag: str
+        :param submitted_at: time at which the job was submitted.
+        :type submitted_at: datetime
+        """
+        self.__polling_url = polling_url
+        self.__result_type = result_type
+        self.__request_id = request_id
+        self.__tag = tag
+        self.__submitted_at = submitted_at
+
+    def get_polling_url(self):
+        """
+        :return: polling URL of the job.
+        :rtype: str
+        """
+        return self.__polling_url
+
+    def get_result_type(self):
+        """
+        :return: result class of the job.
+        :rtype: PDFServicesJobResult.__class__
+        """
+        return self.__result_type
+
+    def get_request_id(self):
+        """
+        :return: request id with which the job was submitted.
+        :rtype: str
+        """
+        return self.__request_id
+
+    def get_tag(self):
+        """
+        :return: tag given when submitting the job, if any.
+        :rtype: str
+        """
+        return self.__tag
+
+    def get_submitted_at(self):
+        """
+        :return: time at which the job was submitted.
+        :rtype: datetime
+        """
+        return self.__submitted_at
@@ -10,12 +10,17 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-from typing import List, Any, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Any, Optional, Iterator, Union, Iterable
 
 from adobe.pdfservices.operation.auth.credentials import Credentials
 from adobe.pdfservices.operation.config.client_config import ClientConfig
 from adobe.pdfservices.operation.exception.exceptions import SdkException
+from adobe.pdfservices.operation.internal.cleanup.asset_deleter import AssetDeleter
 from adobe.pdfservices.operation.internal.constants.custom_error_messages import CustomErrorMessages
+from adobe.pdfservices.operation.internal.constants.service_constants import ServiceConstants
 from adobe.pdfservices.operation.internal.execution_context import ExecutionContext
 from adobe.pdfservices.operation.internal.pdf_services_helper import PDFServicesHelper
 from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
@@ -23,10 +28,13 @@ from adobe.pdfservices.operation.internal.util.object_util import ObjectUtil
 from adobe.pdfservices.operation.internal.util.string_util import StringUtil
 from adobe.pdfservices.operation.io.asset import Asset
 from adobe.pdfservices.operation.io.stream_asset import StreamAsset
+from adobe.pdfservices.operation.journaled_job import JournaledJob
 from adobe.pdfservices.operation.pdf_services_job import PDFServicesJob
 from adobe.pdfservices.operation.pdf_services_job_status_response import PDFServicesJobStatusResponse
 from adobe.pdfservices.operation.pdf_services_response import PDFServicesResponse
 from adobe.pdfservices.operation.pdfjobs.result.pdf_services_job_result import PDFServicesJobResult
+from adobe.pdfservices.operation.pipeline import Pipeline
+from adobe.pdfservices.operation.upload_assets_result import UploadAssetsResult
 
 
 class PDFServices:
@@ -53,19 +61,68 @@ class PDFServices:
         :type client_config: ClientConfig
         """
         self.__executionContext: ExecutionContext = ExecutionContext(credentials, client_config)
+        self.__job_executor = None
+        self.__upload_executor = None
+        self.__asset_deleter = None
+        self.__job_executor_lock = threading.Lock()
+
+    def close(self):
+        """
+        Cancels the jobs still running with :samp:`execute` and the uploads not started yet, waits for the assets
+        queued for deletion, and releases the worker threads and the pooled HTTP connections held by this
+        :samp:`PDFServices` instance.
+        """
+        with self.__job_executor_lock:
+            job_executor, self.__job_executor = self.__job_executor, None
+            upload_executor, self.__upload_executor = self.__upload_executor, None
+            asset_deleter, self.__asset_deleter = self.__asset_deleter, None
+        if job_executor is not None:
+            job_executor.close()
+        if upload_executor is not None:
+            upload_executor.shutdown(cancel_futures=True)
+        if asset_deleter is not None:
+            asset_deleter.close()
+        self.__executionContext.close()
+
+    def get_metrics(self) -> dict:
+        """
+        Returns a snapshot of the counters collected by this :samp:`PDFServices` instance, e.g. the number of
+        retried requests under :samp:`http.retries`, broken down by request type and by failure reason.
+
+        :return: counter names mapped to their values.
+        :rtype: dict
+        """
+        return self.__executionContext.metrics.snapshot()
+
+    def _get_execution_context(self) -> ExecutionContext:
+        return self.__executionContext
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     @enforce_types
-    def submit(self, pdf_services_job: PDFServicesJob, *, notify_config_list: Optional[List] = None) -> str:
+    def submit(self, pdf_services_job: PDFServicesJob, *, notify_config_list: Optional[List] = None,
+               tag: Optional[str] = None) -> str:
         """
         Creates the :class:`PDFServicesJob<adobe.pdfservices.operation.pdf_services_job.PDFServicesJob>`
         and returns the polling URL.
 
+        If a result cache is configured with :samp:`ClientConfig` and the same job was run before, the job is not
+        submitted and the returned polling URL refers to the cached result, which :samp:`get_job_result` and
+        :samp:`get_content` serve without calling the service.
+
         :param pdf_services_job: PDFServicesJob} to be submitted; can not be None.
         :type pdf_services_job: PDFServicesJob
         :param notify_config_list: List of
             :class:`NotifierConfig<adobe.pdfservices.operation.config.notifier.notifier_config.NotifierConfig>`
             to be used for notification. (Optional, use key-value)
         :type notify_config_list: list
+        :param tag: Tag recorded with the job in the job journal, to identify it when it is recovered.
+            (Optional, use key-value)
+        :type tag: str
         :raises ServiceApiException: If an error is encountered while submitting the job.
         :raises SdkException: Is thrown for client-side or network errors.
         :raises ServiceUsageException: If service usage limits have been reached or credentials quota has been
@@ -73,7 +130,163 @@ class PDFServices:
         :return: the polling URL.
         :rtype: str
         """
-        return pdf_services_job._process(self.__executionContext, notify_config_list)
+        return PDFServicesHelper.process_job(self.__executionContext, pdf_services_job, notify_config_list, tag)
+
+    @enforce_types
+    def submit_async(self, pdf_services_job: PDFServicesJob, *, notify_config_list: Optional[List] = None,
+                     tag: Optional[str] = None) -> Future:
+        """
+        Submits the :class:`PDFServicesJob<adobe.pdfservices.operation.pdf_services_job.PDFServicesJob>` on the
+        executor of this :samp:`PDFServices` instance.
+
+        :param pdf_services_job: PDFServicesJob to be submitted; can not be None.
+        :type pdf_services_job: PDFServicesJob
+        :param notify_config_list: List of
+            :class:`NotifierConfig<adobe.pdfservices.operation.config.notifier.notifier_config.NotifierConfig>`
+            to be used for notification. (Optional, use key-value)
+        :type notify_config_list: list
+        :param tag: Tag recorded with the job in the job journal. (Optional, use key-value)
+        :type tag: str
+        :return: future resolved with the polling URL.
+        :rtype: concurrent.futures.Future
+        """
+        return self.__get_job_executor().submit(pdf_services_job, notify_config_list, tag)
+
+    @enforce_types
+    def execute(self, pdf_services_job: PDFServicesJob, result_type: PDFServicesJobResult.__class__, *,
+                notify_config_list: Optional[List] = None, download: bool = False,
+                timeout: Optional[Union[int, float]] = None, tag: Optional[str] = None) -> Future:
+        """
+        Submits the :class:`PDFServicesJob<adobe.pdfservices.operation.pdf_services_job.PDFServicesJob>`, waits for
+        its result and optionally downloads it, in the background. Jobs are submitted and downloaded on an executor
+        with :samp:`max_workers` threads from the client configuration, and polled by a shared
+        :class:`JobPoller<adobe.pdfservices.operation.job_poller.JobPoller>` without holding a thread, so many jobs
+        can be overlapped. The returned futures can be used with :samp:`concurrent.futures.wait` and
+        :samp:`concurrent.futures.as_completed`.
+
+        :param pdf_services_job: PDFServicesJob to be executed; can not be None.
+        :type pdf_services_job: PDFServicesJob
+        :param result_type: result class for
+            :class:`PDFServicesJob<adobe.pdfservices.operation.pdf_services_job.PDFServicesJob>`, it will be an
+            implementation of PDFServicesJobResult; can not be None.
+        :type result_type: PDFServicesJobResult.__class__
+        :param notify_config_list: List of
+            :class:`NotifierConfig<adobe.pdfservices.operation.config.notifier.notifier_config.NotifierConfig>`
+            to be used for notification. (Optional, use key-value)
+        :type notify_config_list: list
+        :param download: Whether to also download the asset of the result. Default value is False.
+            (Optional, use key-value)
+        :type download: bool
+        :param timeout: Maximum number of seconds for the whole execution, after which the future fails with an
+            SdkException. (Optional, use key-value)
+        :type timeout: float
+        :param tag: Tag recorded with the job in the job journal. (Optional, use key-value)
+        :type tag: str
+        :return: future resolved with the PDFServicesResponse of the job, or with the StreamAsset of its result if
+            download is True. Cancelling the future stops polling the job.
+        :rtype: concurrent.futures.Future
+        """
+        ObjectUtil.require_not_null(result_type,
+                                    CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Result class object"))
+        if timeout is not None and timeout <= 0:
+            raise ValueError("Timeout must be greater than 0")
+        return self.__get_job_executor().execute(pdf_services_job, result_type, notify_config_list, download,
+                                                 timeout, tag)
+
+    def get_journaled_jobs(self) -> List[JournaledJob]:
+        """
+        Returns the jobs submitted with the credentials of this instance whose result was not retrieved, as recorded
+        in the job journal configured with :samp:`ClientConfig`, including jobs submitted by processes which
+        stopped since.
+
+        :raises SdkException: If no job journal is configured.
+        :return: the journaled jobs, oldest first.
+        :rtype: list
+        """
+        job_journal = self.__executionContext.job_journal
+        if job_journal is None:
+            raise SdkException("Job journal is not configured.")
+        return [JournaledJob(entry['polling_url'], PDFServicesHelper.get_result_type(entry['operation']),
+                             entry['request_id'], entry['tag'], datetime.fromtimestamp(entry['submitted_at']))
+                for entry in job_journal.get_entries()]
+
+    @enforce_types
+    def recover_jobs(self, *, timeout: Optional[Union[int, float]] = None) -> dict:
+        """
+        Reattaches to the jobs of the job journal, typically on startup after the process which submitted them was
+        stopped, and gets their results as :samp:`get_job_result` would, without submitting them again. The jobs
+        are polled in the background by the poller shared with :samp:`execute`, and are removed from the journal
+        once their result is known.
+
+        :param timeout: Maximum number of seconds to poll each job for, after which its future fails with an
+            SdkException. (Optional, use key-value)
+        :type timeout: float
+        :raises SdkException: If no job journal is configured. The future of a job whose operation has no known
+            result class fails with an SdkException.
+        :return: dict from each :class:`JournaledJob<adobe.pdfservices.operation.journaled_job.JournaledJob>` to a
+            future resolved with its PDFServicesResponse.
+        :rtype: dict
+        """
+        if timeout is not None and timeout <= 0:
+            raise ValueError("Timeout must be greater than 0")
+        recovered = {}
+        for journaled_job in self.get_journaled_jobs():
+            if journaled_job.get_result_type() is None:
+                # submitted for an operation whose result class is not known to this process, it is kept in the
+                # journal so that it can be recovered once the result class is registered
+                future = Future()
+                future.set_exception(SdkException("No result class is registered for the operation of the job "
+                                                  "{polling_url}.".format(polling_url=journaled_job.get_polling_url())))
+            else:
+                future = self.__get_job_executor().poll(journaled_job.get_polling_url(),
+                                                        journaled_job.get_result_type(), timeout)
+            recovered[journaled_job] = future
+        return recovered
+
+    @enforce_types
+    def run_pipeline(self, pipeline: Pipeline, input_asset: Asset, *, download: bool = False,
+                     timeout: Optional[Union[int, float]] = None, delete_intermediate_assets: bool = False) -> Future:
+        """
+        Runs the jobs of the :class:`Pipeline<adobe.pdfservices.operation.pipeline.Pipeline>` one after the other
+        in the background, each with the result asset of the previous job as input asset. Intermediate results are
+        passed as :class:`CloudAsset<adobe.pdfservices.operation.io.cloud_asset.CloudAsset>` without being
+        downloaded. Jobs are run on the same executor and poller as :samp:`execute`, so many pipelines can be run
+        concurrently.
+
+        :param pipeline: Pipeline to be run; can not be None.
+        :type pipeline: Pipeline
+        :param input_asset: Input asset of the first job; can not be None.
+        :type input_asset: Asset
+        :param download: Whether to also download the result asset of the last job. Default value is False.
+            (Optional, use key-value)
+        :type download: bool
+        :param timeout: Maximum number of seconds for the whole pipeline, after which the future fails with an
+            SdkException. (Optional, use key-value)
+        :type timeout: float
+        :param delete_intermediate_assets: Whether to delete the result asset of each job but the last one in the
+            background, as soon as the job consuming it is done. Default value is False. (Optional, use key-value)
+        :type delete_intermediate_assets: bool
+        :return: future resolved with the PDFServicesResponse of the last job, or with the StreamAsset of its result
+            if download is True. It fails with the exception of the first job which failed. Cancelling the future
+            stops the pipeline.
+        :rtype: concurrent.futures.Future
+        """
+        ObjectUtil.require_not_null(pipeline, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Pipeline"))
+        ObjectUtil.require_not_null(input_asset, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Asset"))
+        if not pipeline.get_steps():
+            raise ValueError("Pipeline must have at least one step")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("Timeout must be greater than 0")
+        return self.__get_job_executor().run_pipeline(pipeline.get_steps(), input_asset, None, download, timeout,
+                                                      delete_intermediate_asset=self.__get_asset_deleter().enqueue
+                                                      if delete_intermediate_assets else None)
+
+    def __get_job_executor(self):
+        with self.__job_executor_lock:
+            if self.__job_executor is None:
+                from adobe.pdfservices.operation.internal.job_executor import JobExecutor
+                self.__job_executor = JobExecutor(self, self.__executionContext.client_config.get_max_workers())
+            return self.__job_executor
 
     @enforce_types
     def get_job_result(self, polling_url: str, result_type: PDFServicesJobResult.__class__) -> PDFServicesResponse:
@@ -123,8 +336,14 @@ class PDFServices:
         Upload content from input stream and returns an :class:`Asset<adobe.pdfservices.operation.io.asset.Asset>`
         to be used in PDF Services SDK.
 
+        The input stream can be bytes, a binary file object, an :samp:`mmap` or an iterable of bytes chunks. File
+        objects and mmaps are streamed from their current position without being read into memory.
+
         Method will not close the input stream, responsibility of closing the input stream lies with the client.
 
+        If an upload cache is configured with :samp:`ClientConfig`, the asset of content uploaded before with the same
+        mime type is returned instead of uploading it again.
+
         :param input_stream: input stream that is to be uploaded; can not be None.
         :param mime_type: mime type of the input stream; can not be None.
         :type mime_type: str
@@ -143,25 +362,123 @@ class PDFServices:
         return PDFServicesHelper.upload(self.__executionContext, input_stream, mime_type)
 
     @enforce_types
-    def upload_assets(self, upload_asset_list: List) -> []:
+    def upload_file(self, file_path: str, mime_type: str) -> Asset:
+        """
+        Upload content of a file and returns an :class:`Asset<adobe.pdfservices.operation.io.asset.Asset>`
+        to be used in PDF Services SDK. The file is streamed without being read into memory.
+
+        :param file_path: path of the file that is to be uploaded; can not be None.
+        :type file_path: str
+        :param mime_type: mime type of the file; can not be None.
+        :type mime_type: str
+        :raises ServiceApiException: If an error is encountered while submitting the job.
+        :raises SdkException: Is thrown for client-side or network errors.
+        :raises ServiceUsageException: If service usage limits have been reached or credentials quota has been
+            exhausted.
+        :return: asset containing the uploaded content
+        :rtype: Asset
+        """
+        if StringUtil.is_blank(file_path):
+            raise ValueError(CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE_OR_EMPTY.format("File path"))
+        if StringUtil.is_blank(mime_type):
+            raise ValueError(CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE_OR_EMPTY.format("Mime Type"))
+
+        return PDFServicesHelper.upload_stream_asset(self.__executionContext, StreamAsset.from_file(file_path,
+                                                                                                    mime_type))
+
+    @enforce_types
+    def upload_assets(self, upload_asset_list: List, *, timeout: Optional[Union[int, float]] = None) -> []:
         """
         Upload content from list of :class:`StreamAsset<adobe.pdfservices.operation.io.stream_asset.StreamAsset>` and
         returns a list of :class:`Asset<adobe.pdfservices.operation.io.asset.Asset>` to be used in PDF Services
         SDK.
 
+        The stream assets are uploaded concurrently by the upload executor of this :samp:`PDFServices`, sized by
+        :samp:`ClientConfig.max_upload_workers`. If an upload fails, the uploads which did not start yet are cancelled
+        and its error is raised; use :meth:`try_upload_assets` to keep the assets which were uploaded.
+
+        Stream Assets created with :meth:`StreamAsset.from_file` are opened only while being uploaded, so the
+        memory used does not depend on the number or size of the files.
+
         Method will not close the input stream of the Stream Asset, responsibility of closing the input stream lies
         with the client.
 
         :param upload_asset_list: :class:`StreamAsset<adobe.pdfservices.operation.io.stream_asset.StreamAsset>`
             list that is to be uploaded; can not be None.
         :type upload_asset_list: list
+        :param timeout: Maximum number of seconds to wait for all the uploads. Uploads are waited for until they
+            complete or fail if not provided. (Optional, use key-value)
+        :type timeout: float
         :raises ServiceApiException: If an error is encountered while submitting the job.
-        :raises SdkException: Is thrown for client-side or network errors.
+        :raises SdkException: Is thrown for client-side or network errors, or if the timeout expired.
         :return: returns a list of :class:`Asset<adobe.pdfservices.operation.io.asset.Asset>` to be used in PDF Services
             SDK.
         :rtype: list
         """
+        self.__validate_upload_asset_list(upload_asset_list, timeout)
+        return PDFServicesHelper.upload_assets(self.__executionContext, self.__get_upload_executor(),
+                                               upload_asset_list, timeout)
+
+    @enforce_types
+    def try_upload_assets(self, upload_asset_list: List, *,
+                          timeout: Optional[Union[int, float]] = None) -> UploadAssetsResult:
+        """
+        Uploads content from list of :class:`StreamAsset<adobe.pdfservices.operation.io.stream_asset.StreamAsset>`
+        like :meth:`upload_assets`, but without failing when some of the uploads fail, so that the assets which were
+        uploaded can still be used.
+
+        :param upload_asset_list: :class:`StreamAsset<adobe.pdfservices.operation.io.stream_asset.StreamAsset>`
+            list that is to be uploaded; can not be None.
+        :type upload_asset_list: list
+        :param timeout: Maximum number of seconds to wait for all the uploads; the uploads which did not complete by
+            then are reported as failed. Uploads are waited for until they complete or fail if not provided.
+            (Optional, use key-value)
+        :type timeout: float
+        :return: the uploaded assets and the errors of the uploads which failed, by index in the list.
+        :rtype: UploadAssetsResult
+        """
+        self.__validate_upload_asset_list(upload_asset_list, timeout)
+        return PDFServicesHelper.try_upload_assets(self.__executionContext, self.__get_upload_executor(),
+                                                   upload_asset_list, timeout)
+
+    @enforce_types
+    def iter_upload_assets(self, upload_asset_list: List, *,
+                           timeout: Optional[Union[int, float]] = None) -> Iterator[tuple]:
+        """
+        Starts uploading content from list of
+        :class:`StreamAsset<adobe.pdfservices.operation.io.stream_asset.StreamAsset>` and returns an iterator over the
+        uploads in the order in which they complete, so that jobs can be submitted for the uploaded assets while the
+        other uploads are still running.
+
+        Each upload is yielded as an :samp:`(index, outcome)` tuple, where index is the position of the stream asset
+        in the list and outcome is either the uploaded :class:`Asset<adobe.pdfservices.operation.io.asset.Asset>`, or
+        the :samp:`ServiceApiException` or :samp:`SdkException` with which it failed. Closing the iterator before it
+        is exhausted cancels the uploads which did not start yet.
+
+        .. code-block:: python
+
+            for index, outcome in pdf_services.iter_upload_assets(stream_assets):
+                if isinstance(outcome, Exception):
+                    print("Upload of {index} failed: {error}".format(index=index, error=outcome))
+                else:
+                    polling_urls[index] = pdf_services.submit(CompressPDFJob(outcome))
+
+        :param upload_asset_list: :class:`StreamAsset<adobe.pdfservices.operation.io.stream_asset.StreamAsset>`
+            list that is to be uploaded; can not be None.
+        :type upload_asset_list: list
+        :param timeout: Maximum number of seconds to wait for all the uploads; the uploads which did not complete by
+            then are yielded last with an :samp:`SdkException`. Uploads are waited for until they complete or fail if
+            not provided. (Optional, use key-value)
+        :type timeout: float
+        :return: an iterator of :samp:`(index, Asset or exception)` tuples.
+        :rtype: Iterator[tuple]
+        """
+        self.__validate_upload_asset_list(upload_asset_list, timeout)
+        return PDFServicesHelper.iter_upload_assets(self.__executionContext, self.__get_upload_executor(),
+                                                    upload_asset_list, timeout)
 
+    @staticmethod
+    def __validate_upload_asset_list(upload_asset_list: List, timeout: Optional[Union[int, float]]):
         ObjectUtil.require_not_null(upload_asset_list,
                                     CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Upload asset list"))
         if len(upload_asset_list) < 1:
@@ -169,21 +486,80 @@ class PDFServices:
         for stream_asset in upload_asset_list:
             if stream_asset is None or not isinstance(stream_asset, StreamAsset):
                 raise SdkException("Stream Asset List elements must be of the type StreamAsset.")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("Timeout must be greater than 0")
 
-        return PDFServicesHelper.upload_assets(self.__executionContext, upload_asset_list)
+    def __get_upload_executor(self) -> ThreadPoolExecutor:
+        with self.__job_executor_lock:
+            if self.__upload_executor is None:
+                self.__upload_executor = ThreadPoolExecutor(
+                    max_workers=self.__executionContext.client_config.get_max_upload_workers(),
+                    thread_name_prefix="pdfservices-upload")
+            return self.__upload_executor
 
     @enforce_types
-    def get_content(self, asset: Asset) -> StreamAsset:
+    def get_content(self, asset: Asset, *, spool_threshold: Optional[int] = None) -> StreamAsset:
         """
         :param asset: Asset to the content; can not be None.
         :type asset: Asset
+        :param spool_threshold: If provided, the content is streamed into a
+            :samp:`tempfile.SpooledTemporaryFile` which is kept in memory up to this many bytes and rolled over to
+            disk beyond it. The input stream of the returned StreamAsset is then that file object, which the caller
+            must close. (Optional, use key-value)
+        :type spool_threshold: int
         :raises ServiceApiException: If an error is encountered while submitting the job.
         :raises SdkException: Is thrown for client-side or network errors.
         :return: Returns the content of the asset.
         :rtype: StreamAsset
         """
         ObjectUtil.require_not_null(asset, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Asset"))
-        return PDFServicesHelper.get_content(self.__executionContext, asset)
+        if spool_threshold is not None and spool_threshold < 0:
+            raise ValueError("Spool threshold must not be negative")
+        return PDFServicesHelper.get_content(self.__executionContext, asset, spool_threshold)
+
+    @enforce_types
+    def get_content_to_path(self, asset: Asset, file_path: str, *,
+                            chunk_size: int = ServiceConstants.DOWNLOAD_CHUNK_SIZE):
+        """
+        Streams the content of the asset to a file, using memory bounded by the chunk size regardless of the size of
+        the content. The file is replaced atomically once the download has completed.
+
+        :param asset: Asset to the content; can not be None.
+        :type asset: Asset
+        :param file_path: Path of the file to write the content to; can not be None.
+        :type file_path: str
+        :param chunk_size: Number of bytes read from the network at a time. Default value is 65536.
+            (Optional, use key-value)
+        :type chunk_size: int
+        :raises ServiceApiException: If an error is encountered while submitting the job.
+        :raises SdkException: Is thrown for client-side or network errors.
+        """
+        ObjectUtil.require_not_null(asset, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Asset"))
+        if StringUtil.is_blank(file_path):
+            raise ValueError(CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE_OR_EMPTY.format("File path"))
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be greater than 0")
+        PDFServicesHelper.get_content_to_path(self.__executionContext, asset, file_path, chunk_size)
+
+    @enforce_types
+    def iter_content(self, asset: Asset, *, chunk_size: int = ServiceConstants.DOWNLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Returns an iterator over the content of the asset, streamed from the network in chunks. The download starts
+        when the iteration starts; the connection is released once the iterator is exhausted or closed.
+
+        :param asset: Asset to the content; can not be None.
+        :type asset: Asset
+        :param chunk_size: Maximum number of bytes in each chunk. Default value is 65536. (Optional, use key-value)
+        :type chunk_size: int
+        :raises ServiceApiException: If an error is encountered while submitting the job.
+        :raises SdkException: Is thrown for client-side or network errors.
+        :return: Iterator over the content chunks.
+        :rtype: Iterator[bytes]
+        """
+        ObjectUtil.require_not_null(asset, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Asset"))
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be greater than 0")
+        return PDFServicesHelper.iter_content(self.__executionContext, asset, chunk_size)
 
     @enforce_types
     def refresh_download_uri(self, asset: Asset) -> Asset:
@@ -201,7 +577,7 @@ class PDFServices:
     @enforce_types
     def delete_asset(self, asset: Asset):
         """
-        Deletes asset from PDF Services storage.
+        Deletes asset from PDF Services storage, and from the upload cache if one is configured.
 
         :param asset: Asset to be deleted; can not be None.
         :type asset: Asset
@@ -210,3 +586,65 @@ class PDFServices:
         """
         ObjectUtil.require_not_null(asset, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Asset"))
         PDFServicesHelper.delete_asset(self.__executionContext, asset)
+
+    @enforce_types
+    def delete_assets(self, assets: Iterable, *, timeout: Optional[Union[int, float]] = None) -> dict:
+        """
+        Deletes assets from PDF Services storage concurrently, with at most :samp:`ClientConfig.max_delete_workers`
+        deletions in progress, and waits for them. The assets are consumed lazily, so a generator can be passed for
+        a large number of assets.
+
+        Deletions are rate limited like the other requests, and retried on transient failures with the retry policy
+        of the client configuration, or with the default :samp:`RetryConfig` if none is configured. Assets which do
+        not exist anymore count as deleted.
+
+        :param assets: :class:`CloudAsset<adobe.pdfservices.operation.io.cloud_asset.CloudAsset>` iterable to be
+            deleted; can not be None.
+        :type assets: Iterable
+        :param timeout: Maximum number of seconds to wait for the deletions; the deletions which did not complete by
+            then are reported as failed. Deletions are waited for until they complete or fail if not provided.
+            (Optional, use key-value)
+        :type timeout: float
+        :raises SdkException: If an asset is not a CloudAsset.
+        :return: the :samp:`ServiceApiException` or :samp:`SdkException` of the deletions which failed, by asset id;
+            empty if all the assets were deleted.
+        :rtype: dict
+        """
+        ObjectUtil.require_not_null(assets, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Assets"))
+        if timeout is not None and timeout <= 0:
+            raise ValueError("Timeout must be greater than 0")
+        return self.__get_asset_deleter().delete_assets(assets, timeout)
+
+    @enforce_types
+    def delete_assets_in_background(self, assets: Iterable):
+        """
+        Queues assets to be deleted from PDF Services storage in the background, on the same executor as
+        :meth:`delete_assets`, and returns without waiting. Failed deletions are logged. The number of deletions
+        not done yet is returned by :meth:`get_pending_deletion_count`, and :meth:`close` waits for them.
+
+        :param assets: :class:`CloudAsset<adobe.pdfservices.operation.io.cloud_asset.CloudAsset>` iterable to be
+            deleted; can not be None.
+        :type assets: Iterable
+        :raises SdkException: If an asset is not a CloudAsset.
+        """
+        ObjectUtil.require_not_null(assets, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Assets"))
+        asset_deleter = self.__get_asset_deleter()
+        for asset in assets:
+            asset_deleter.enqueue(asset)
+
+    def get_pending_deletion_count(self) -> int:
+        """
+        :return: Number of assets queued by :meth:`delete_assets_in_background` or by pipelines deleting their
+            intermediate assets, whose deletion is not done yet.
+        :rtype: int
+        """
+        with self.__job_executor_lock:
+            asset_deleter = self.__asset_deleter
+        return asset_deleter.get_pending_count() if asset_deleter is not None else 0
+
+    def __get_asset_deleter(self) -> AssetDeleter:
+        with self.__job_executor_lock:
+            if self.__asset_deleter is None:
+                self.__asset_deleter = AssetDeleter(self.__executionContext,
+                                                    self.__executionContext.client_config.get_max_delete_workers())
+            return self.__asset_deleter
@@ -10,7 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
 import math
 
 from adobe.pdfservices.operation.exception.exceptions import SdkException
@@ -59,4 +58,4 @@ class PageLayout:
         """
         :return: JSON representation of this class, used internally by sdk.
         """
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
@@ -10,8 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
-
 from adobe.pdfservices.operation.internal.params.page_range import PageRange
 from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
 from adobe.pdfservices.operation.internal.util.json_hint_encoder import JSONHintEncoder
@@ -105,4 +103,4 @@ class PageRanges:
         """
         Used internally by this SDK, not intended to be called by clients.
         """
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
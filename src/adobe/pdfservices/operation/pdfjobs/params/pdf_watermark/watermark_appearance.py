@@ -9,7 +9,6 @@
 # Dissemination of this information or reproduction of this material
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
-import json
 from typing import Optional
 from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
 from adobe.pdfservices.operation.exception.exceptions import SdkException
@@ -62,4 +61,4 @@ class WatermarkAppearance:
         """
         Used internally by this SDK, not intended to be called by clients.
         """
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
\ No newline at end of file
+        return JSONHintEncoder.to_json(self)
\ No newline at end of file
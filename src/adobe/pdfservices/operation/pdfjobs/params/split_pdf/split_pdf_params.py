@@ -10,7 +10,6 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
-import json
 from typing import Optional
 
 from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
@@ -77,4 +76,4 @@ class SplitPDFParams(PDFServicesJobParams):
         return self.file_count
 
     def to_json(self):
-        return json.dumps(self, cls=JSONHintEncoder, indent=1, sort_keys=True)
+        return JSONHintEncoder.to_json(self)
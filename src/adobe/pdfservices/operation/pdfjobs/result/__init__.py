@@ -10,3 +10,55 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
+"""
+Results of the PDF Services jobs.
+
+The result classes can be imported from their modules, or from this package, in which case their module is only
+imported when the class is first accessed.
+"""
+
+import importlib
+
+_RESULT_CLASS_MODULES = {
+    'AutotagPDFResult': 'autotag_pdf_result',
+    'CombinePDFResult': 'combine_pdf_result',
+    'CompressPDFResult': 'compress_pdf_result',
+    'CreatePDFResult': 'create_pdf_result',
+    'DeletePagesResult': 'delete_pages_result',
+    'DocumentMergePDFResult': 'document_merge_result',
+    'ESealPDFResult': 'eseal_pdf_result',
+    'ExportPDFFormDataResult': 'export_pdf_form_data_result',
+    'ExportPDFResult': 'export_pdf_result',
+    'ExportPDFtoImagesResult': 'export_pdf_to_images_result',
+    'ExtractPDFResult': 'extract_pdf_result',
+    'HTMLtoPDFResult': 'html_to_pdf_result',
+    'ImportPDFFormDataResult': 'import_pdf_form_data_result',
+    'InsertPagesResult': 'insert_pages_result',
+    'LinearizePDFResult': 'linearize_pdf_result',
+    'OCRPDFResult': 'ocr_pdf_result',
+    'PDFAccessibilityCheckerResult': 'pdf_accessibility_checker_result',
+    'PDFPropertiesResult': 'pdf_properties_result',
+    'PDFServicesJobResult': 'pdf_services_job_result',
+    'PDFWatermarkResult': 'pdf_watermark_result',
+    'ProtectPDFResult': 'protect_pdf_result',
+    'RemoveProtectionResult': 'remove_protection_result',
+    'ReorderPagesResult': 'reorder_pages_result',
+    'ReplacePagesResult': 'replace_page_result',
+    'RotatePagesResult': 'rotate_pages_result',
+    'SplitPDFResult': 'split_pdf_result'
+}
+
+__all__ = list(_RESULT_CLASS_MODULES)
+
+
+def __getattr__(name):
+    module_name = _RESULT_CLASS_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError("module {module!r} has no attribute {name!r}".format(module=__name__, name=name))
+    result_class = getattr(importlib.import_module('.' + module_name, __name__), name)
+    globals()[name] = result_class
+    return result_class
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
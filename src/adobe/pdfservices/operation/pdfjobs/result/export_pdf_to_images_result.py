@@ -10,8 +10,13 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
+from typing import TYPE_CHECKING
+
 from adobe.pdfservices.operation.pdfjobs.result.pdf_services_job_result import PDFServicesJobResult
 
+if TYPE_CHECKING:
+    from adobe.pdfservices.operation.internal.execution_context import ExecutionContext
+
 
 class ExportPDFtoImagesResult(PDFServicesJobResult):
     """
@@ -34,3 +39,7 @@ class ExportPDFtoImagesResult(PDFServicesJobResult):
         :rtype: Asset
         """
         return self._assets
+
+    @classmethod
+    def _from_job_status(cls, execution_context: 'ExecutionContext', job_status: dict):
+        return cls(cls._get_assets(job_status, 'assetList'))
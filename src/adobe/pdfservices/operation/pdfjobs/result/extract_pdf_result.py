@@ -10,9 +10,14 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
+from typing import TYPE_CHECKING
+
 from adobe.pdfservices.operation.io.asset import Asset
 from adobe.pdfservices.operation.pdfjobs.result.pdf_services_job_result import PDFServicesJobResult
 
+if TYPE_CHECKING:
+    from adobe.pdfservices.operation.internal.execution_context import ExecutionContext
+
 
 class ExtractPDFResult(PDFServicesJobResult):
     """
@@ -58,3 +63,12 @@ class ExtractPDFResult(PDFServicesJobResult):
         :rtype: dict
         """
         return self._content_json
+
+    @classmethod
+    def _from_job_status(cls, execution_context: 'ExecutionContext', job_status: dict):
+        from adobe.pdfservices.operation.internal.pdf_services_helper import PDFServicesHelper
+
+        content = job_status.get('content')
+        content_json = PDFServicesHelper.get_extract_content_json(execution_context, content.get('downloadUri')) \
+            if content else None
+        return cls(cls._get_asset(job_status, 'content'), cls._get_asset(job_status, 'resource'), content_json)
@@ -10,9 +10,14 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
+from typing import TYPE_CHECKING
+
 from adobe.pdfservices.operation.io.asset import Asset
 from adobe.pdfservices.operation.pdfjobs.result.pdf_services_job_result import PDFServicesJobResult
 
+if TYPE_CHECKING:
+    from adobe.pdfservices.operation.internal.execution_context import ExecutionContext
+
 
 class PDFAccessibilityCheckerResult(PDFServicesJobResult):
     """
@@ -46,3 +51,7 @@ class PDFAccessibilityCheckerResult(PDFServicesJobResult):
         :rtype: Asset
         """
         return self.__report
+
+    @classmethod
+    def _from_job_status(cls, execution_context: 'ExecutionContext', job_status: dict):
+        return cls(cls._get_asset(job_status, 'asset'), cls._get_asset(job_status, 'report'))
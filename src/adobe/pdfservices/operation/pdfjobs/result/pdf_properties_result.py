@@ -10,8 +10,13 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
+from typing import TYPE_CHECKING
+
 from adobe.pdfservices.operation.pdfjobs.result.pdf_services_job_result import PDFServicesJobResult
 
+if TYPE_CHECKING:
+    from adobe.pdfservices.operation.internal.execution_context import ExecutionContext
+
 
 class PDFPropertiesResult(PDFServicesJobResult):
     """
@@ -34,3 +39,7 @@ class PDFPropertiesResult(PDFServicesJobResult):
         :rtype: string
         """
         return self._pdf_properties_dict
+
+    @classmethod
+    def _from_job_status(cls, execution_context: 'ExecutionContext', job_status: dict):
+        return cls(job_status.get('metadata'))
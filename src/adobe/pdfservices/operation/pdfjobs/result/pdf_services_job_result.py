@@ -11,6 +11,13 @@
 # from Adobe.
 
 import abc
+from typing import TYPE_CHECKING
+
+from adobe.pdfservices.operation.exception.exceptions import SdkException
+from adobe.pdfservices.operation.io.cloud_asset import CloudAsset
+
+if TYPE_CHECKING:
+    from adobe.pdfservices.operation.internal.execution_context import ExecutionContext
 
 
 class PDFServicesJobResult(abc.ABC):
@@ -21,4 +28,29 @@ class PDFServicesJobResult(abc.ABC):
     It will encapsulate the result of
     :class:`PDFServicesJob<adobe.pdfservices.operation.pdf_services_job.PDFServicesJob>`
     """
-    pass
+
+    @classmethod
+    def _from_job_status(cls, execution_context: 'ExecutionContext', job_status: dict):
+        """
+        Creates the result from the status of a finished job, as returned by PDF Services API. Results made of the
+        single :samp:`asset` of the status use this implementation, other results override it.
+
+        Used internally by this SDK, not intended to be called by clients.
+
+        :raises SdkException: If the class is abstract, so no result can be created from the job status.
+        """
+        if cls is PDFServicesJobResult or cls.__abstractmethods__:
+            raise SdkException("{result_type} is an abstract result class, the result class of the job must be given."
+                               .format(result_type=cls.__name__))
+        asset = job_status.get('asset')
+        return cls(CloudAsset(asset.get('assetID'), asset.get('downloadUri')))
+
+    @staticmethod
+    def _get_asset(job_status: dict, key: str):
+        asset = job_status.get(key)
+        return CloudAsset(asset.get('assetID'), asset.get('downloadUri')) if asset else None
+
+    @staticmethod
+    def _get_assets(job_status: dict, key: str):
+        assets = job_status.get(key)
+        return [CloudAsset(asset.get('assetID'), asset.get('downloadUri')) for asset in assets] if assets else None
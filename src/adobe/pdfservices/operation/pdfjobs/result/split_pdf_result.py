@@ -10,9 +10,14 @@
 # is strictly forbidden unless prior written permission is obtained
 # from Adobe.
 
+from typing import TYPE_CHECKING
+
 from adobe.pdfservices.operation.io.asset import Asset
 from adobe.pdfservices.operation.pdfjobs.result.pdf_services_job_result import PDFServicesJobResult
 
+if TYPE_CHECKING:
+    from adobe.pdfservices.operation.internal.execution_context import ExecutionContext
+
 
 class SplitPDFResult(PDFServicesJobResult):
     """
@@ -47,3 +52,7 @@ class SplitPDFResult(PDFServicesJobResult):
         :rtype: Asset
         """
         return self._asset
+
+    @classmethod
+    def _from_job_status(cls, execution_context: 'ExecutionContext', job_status: dict):
+        return cls(cls._get_assets(job_status, 'assetList'), cls._get_asset(job_status, 'asset'))
@@ -0,0 +1,90 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+from typing import Callable, List
+
+from adobe.pdfservices.operation.internal.constants.custom_error_messages import CustomErrorMessages
+from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
+from adobe.pdfservices.operation.internal.util.object_util import ObjectUtil
+from adobe.pdfservices.operation.pdfjobs.result.pdf_services_job_result import PDFServicesJobResult
+
+
+class _PipelineStep:
+
+    def __init__(self, job_factory: Callable, result_type, job_kwargs: dict):
+        self.job_factory = job_factory
+        self.result_type = result_type
+        self.job_kwargs = job_kwargs
+
+    def create_job(self, input_asset):
+        return self.job_factory(input_asset, **self.job_kwargs)
+
+
+class Pipeline:
+    """
+    Sequence of :class:`PDFServicesJob<adobe.pdfservices.operation.pdf_services_job.PDFServicesJob>` in which the
+    result asset of each job is the input asset of the next one.
+
+    Pipelines are run with :samp:`PDFServices.run_pipeline`. Intermediate results stay in PDF Services storage as
+    :class:`CloudAsset<adobe.pdfservices.operation.io.cloud_asset.CloudAsset>` and are never downloaded, and a
+    pipeline does not hold a thread while its jobs are in progress, so many pipelines can be run concurrently.
+
+    Sample usage.
+
+    .. code-block:: python
+
+        pipeline = Pipeline() \\
+            .add_step(OCRPDFJob, OCRPDFResult) \\
+            .add_step(CompressPDFJob, CompressPDFResult,
+                      compress_pdf_params=CompressPDFParams(compression_level=CompressionLevel.HIGH)) \\
+            .add_step(LinearizePDFJob, LinearizePDFResult) \\
+            .add_step(ProtectPDFJob, ProtectPDFResult, protect_pdf_params=protect_pdf_params)
+        input_asset = pdf_services.upload(input_stream=input_stream, mime_type=PDFServicesMediaType.PDF)
+        future = pdf_services.run_pipeline(pipeline, input_asset, download=True)
+        stream_asset: StreamAsset = future.result()
+    """
+
+    def __init__(self):
+        """
+        Constructs a new empty :samp:`Pipeline`.
+        """
+        self.__steps: List[_PipelineStep] = []
+
+    @enforce_types
+    def add_step(self, job_factory: Callable, result_type: PDFServicesJobResult.__class__, **job_kwargs) -> 'Pipeline':
+        """
+        Adds a job at the end of the pipeline.
+
+        :param job_factory: Job class, or callable creating the job, called with the input asset of the step as first
+            argument followed by the given keyword arguments; can not be None.
+        :type job_factory: Callable
+        :param result_type: result class of the job; can not be None. Except for the last step, it must have a single
+            result asset.
+        :type result_type: PDFServicesJobResult.__class__
+        :param job_kwargs: keyword arguments passed to the job factory, e.g. the job params.
+        :return: This pipeline instance.
+        :rtype: Pipeline
+        """
+        ObjectUtil.require_not_null(job_factory, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Job factory"))
+        ObjectUtil.require_not_null(result_type,
+                                    CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Result class object"))
+        if self.__steps and not hasattr(self.__steps[-1].result_type, 'get_asset'):
+            raise ValueError("Only jobs with a single result asset can be followed by another step.")
+        self.__steps.append(_PipelineStep(job_factory, result_type, job_kwargs))
+        return self
+
+    def get_steps(self) -> List:
+        """
+        :return: the steps of the pipeline.
+        :rtype: list
+        """
+        return list(self.__steps)
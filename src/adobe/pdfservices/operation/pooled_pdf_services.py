@@ -0,0 +1,463 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+
+import logging
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from typing import List, Any, Optional, Iterator, Union, Iterable
+
+from adobe.pdfservices.operation.auth.credentials import Credentials
+from adobe.pdfservices.operation.config.client_config import ClientConfig
+from adobe.pdfservices.operation.exception.exceptions import ServiceApiException, ServiceUsageException
+from adobe.pdfservices.operation.internal.cache.lru_cache import LRUCache
+from adobe.pdfservices.operation.internal.constants.custom_error_messages import CustomErrorMessages
+from adobe.pdfservices.operation.internal.constants.service_constants import ServiceConstants
+from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
+from adobe.pdfservices.operation.internal.util.job_asset_util import JobAssetUtil
+from adobe.pdfservices.operation.internal.util.object_util import ObjectUtil
+from adobe.pdfservices.operation.io.asset import Asset
+from adobe.pdfservices.operation.io.cloud_asset import CloudAsset
+from adobe.pdfservices.operation.io.stream_asset import StreamAsset
+from adobe.pdfservices.operation.journaled_job import JournaledJob
+from adobe.pdfservices.operation.pdf_services import PDFServices
+from adobe.pdfservices.operation.pdf_services_job import PDFServicesJob
+from adobe.pdfservices.operation.pdf_services_job_status_response import PDFServicesJobStatusResponse
+from adobe.pdfservices.operation.pdf_services_response import PDFServicesResponse
+from adobe.pdfservices.operation.pdfjobs.result.pdf_services_job_result import PDFServicesJobResult
+from adobe.pdfservices.operation.pipeline import Pipeline
+from adobe.pdfservices.operation.upload_assets_result import UploadAssetsResult
+
+
+class _PoolMember:
+
+    def __init__(self, pdf_services: PDFServices, weight: float):
+        self.pdf_services = pdf_services
+        self.weight = weight
+        self.drained_until = 0
+
+
+class PooledPDFServices:
+    """
+    Drop-in replacement for :class:`PDFServices<adobe.pdfservices.operation.pdf_services.PDFServices>` spreading the
+    work over several credentials, e.g. to get more throughput than the usage limits of a single integration allow.
+
+    New uploads and jobs without input assets go to a credential picked at random according to the weights. A
+    credential for which a :class:`ServiceUsageException<adobe.pdfservices.operation.exception.exceptions.ServiceUsageException>`
+    is raised is left out for a while. Assets are owned by the credential which uploaded or created them, so jobs are
+    submitted with the credential owning their input assets, and polling, downloading and deleting always use the
+    credential which created the job or asset. Assets which were not created through this instance, or whose owner is
+    no longer remembered, use the first credential, also when they are the input of a job.
+
+    :meth:`upload`, :meth:`upload_file` and :meth:`upload_assets` move on to another credential when the usage limit
+    of the picked one is reached or it responds with 429 or a server error, as long as the content can be read again,
+    i.e. it is bytes, a file path or a seekable stream. The owners of assets and jobs are remembered for as long as
+    the assets are retained by PDF Services, i.e. 24 hours, for at most 100000 of each.
+    """
+
+    @enforce_types
+    def __init__(self, credentials_list: List, *, weights: Optional[List] = None,
+                 client_config: Optional[ClientConfig] = None,
+                 drain_interval: Union[int, float] = ServiceConstants.CREDENTIAL_DRAIN_SECONDS):
+        """
+        Constructs a new :samp:`PooledPDFServices` instance with the given Credentials and ClientConfig.
+
+        :param credentials_list: Credentials to spread the work over; can not be None or empty.
+        :type credentials_list: list
+        :param weights: Relative share of the new work for each credential. Default is an equal share.
+            (Optional, use key-value)
+        :type weights: list
+        :param client_config: Client configuration used for all the credentials. (Optional, use key-value)
+        :type client_config: ClientConfig
+        :param drain_interval: Number of seconds a credential is left out after its usage limit was reached. Default
+            value is 60 seconds. (Optional, use key-value)
+        :type drain_interval: float
+        """
+        ObjectUtil.require_not_null(credentials_list,
+                                    CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Credentials list"))
+        if len(credentials_list) < 1:
+            raise ValueError("Credentials list is empty.")
+        if any(not isinstance(credentials, Credentials) for credentials in credentials_list):
+            raise ValueError("Credentials list elements must be of the type Credentials.")
+        if weights is None:
+            weights = [1] * len(credentials_list)
+        if len(weights) != len(credentials_list) or any(weight <= 0 for weight in weights):
+            raise ValueError("Weights must be greater than 0, one for each credentials.")
+        if drain_interval < 0:
+            raise ValueError("Drain interval must not be negative")
+
+        self.__members = [_PoolMember(PDFServices(credentials, client_config=client_config), weight)
+                          for credentials, weight in zip(credentials_list, weights)]
+        self.__drain_interval = drain_interval
+        self.__asset_owners = LRUCache(ServiceConstants.POOL_OWNER_MAX_ENTRIES)
+        self.__job_owners = LRUCache(ServiceConstants.POOL_OWNER_MAX_ENTRIES)
+        self._logger = logging.getLogger(__name__)
+
+    def close(self):
+        """
+        Releases the resources held for all the credentials.
+        """
+        for member in self.__members:
+            member.pdf_services.close()
+
+    def get_metrics(self) -> dict:
+        """
+        :return: counter names mapped to their values summed over all the credentials.
+        :rtype: dict
+        """
+        metrics = {}
+        for member in self.__members:
+            for name, value in member.pdf_services.get_metrics().items():
+                metrics[name] = metrics.get(name, 0) + value
+        return metrics
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def submit(self, pdf_services_job: PDFServicesJob, *, notify_config_list: Optional[List] = None,
+               tag: Optional[str] = None) -> str:
+        """
+        See :meth:`PDFServices.submit<adobe.pdfservices.operation.pdf_services.PDFServices.submit>`.
+        """
+        owner = self.__get_job_input_owner(pdf_services_job)
+        if owner is not None:
+            location = self.__call(owner, owner.pdf_services.submit, pdf_services_job,
+                                   notify_config_list=notify_config_list, tag=tag)
+            self.__set_job_owner(location, owner)
+            return location
+
+        # a job without input assets can go to any credential, so it is moved on when a usage limit is reached
+        tried = set()
+        while True:
+            member = self.__pick_member(tried)
+            tried.add(member)
+            try:
+                location = self.__call(member, member.pdf_services.submit, pdf_services_job,
+                                       notify_config_list=notify_config_list, tag=tag)
+            except ServiceUsageException:
+                if len(tried) == len(self.__members):
+                    raise
+                continue
+            self.__set_job_owner(location, member)
+            return location
+
+    def submit_async(self, pdf_services_job: PDFServicesJob, *, notify_config_list: Optional[List] = None,
+                     tag: Optional[str] = None) -> Future:
+        """
+        See :meth:`PDFServices.submit_async<adobe.pdfservices.operation.pdf_services.PDFServices.submit_async>`.
+        """
+        owner = self.__get_job_input_owner(pdf_services_job) or self.__pick_member()
+        future = owner.pdf_services.submit_async(pdf_services_job, notify_config_list=notify_config_list, tag=tag)
+        future.add_done_callback(lambda f: self.__on_done(owner, f, f.result))
+        return future
+
+    def execute(self, pdf_services_job: PDFServicesJob, result_type: PDFServicesJobResult.__class__, *,
+                notify_config_list: Optional[List] = None, download: bool = False,
+                timeout: Optional[Union[int, float]] = None, tag: Optional[str] = None) -> Future:
+        """
+        See :meth:`PDFServices.execute<adobe.pdfservices.operation.pdf_services.PDFServices.execute>`.
+        """
+        owner = self.__get_job_input_owner(pdf_services_job) or self.__pick_member()
+        future = owner.pdf_services.execute(pdf_services_job, result_type, notify_config_list=notify_config_list,
+                                            download=download, timeout=timeout, tag=tag)
+        future.add_done_callback(lambda f: self.__on_done(owner, f, lambda: f.result().get_result()
+                                                          if not download else None))
+        return future
+
+    def get_journaled_jobs(self) -> List[JournaledJob]:
+        """
+        See :meth:`PDFServices.get_journaled_jobs
+        <adobe.pdfservices.operation.pdf_services.PDFServices.get_journaled_jobs>`; returns the jobs of all the
+        credentials.
+        """
+        return [journaled_job for member in self.__members
+                for journaled_job in member.pdf_services.get_journaled_jobs()]
+
+    def recover_jobs(self, *, timeout: Optional[Union[int, float]] = None) -> dict:
+        """
+        See :meth:`PDFServices.recover_jobs<adobe.pdfservices.operation.pdf_services.PDFServices.recover_jobs>`;
+        each job is recovered with the credentials which submitted it.
+        """
+        recovered = {}
+        for member in self.__members:
+            for journaled_job, future in member.pdf_services.recover_jobs(timeout=timeout).items():
+                self.__set_job_owner(journaled_job.get_polling_url(), member)
+                future.add_done_callback(lambda f, owner=member: self.__on_done(owner, f,
+                                                                                lambda: f.result().get_result()))
+                recovered[journaled_job] = future
+        return recovered
+
+    def run_pipeline(self, pipeline: Pipeline, input_asset: Asset, *, download: bool = False,
+                     timeout: Optional[Union[int, float]] = None, delete_intermediate_assets: bool = False) -> Future:
+        """
+        See :meth:`PDFServices.run_pipeline<adobe.pdfservices.operation.pdf_services.PDFServices.run_pipeline>`.
+
+        All the jobs of a pipeline are run with the credentials owning the input asset.
+        """
+        owner = self.__get_asset_owner(input_asset) if isinstance(input_asset, CloudAsset) else self.__pick_member()
+        future = owner.pdf_services.run_pipeline(pipeline, input_asset, download=download, timeout=timeout,
+                                                 delete_intermediate_assets=delete_intermediate_assets)
+        future.add_done_callback(lambda f: self.__on_done(owner, f, lambda: f.result().get_result()
+                                                          if not download else None))
+        return future
+
+    def get_job_result(self, polling_url: str, result_type: PDFServicesJobResult.__class__) -> PDFServicesResponse:
+        """
+        See :meth:`PDFServices.get_job_result<adobe.pdfservices.operation.pdf_services.PDFServices.get_job_result>`.
+        The polling URL is forgotten once the result has been returned.
+        """
+        owner = self.__get_job_owner(polling_url)
+        pdf_services_response = owner.pdf_services.get_job_result(polling_url, result_type)
+        self.__set_asset_owner(pdf_services_response.get_result(), owner)
+        # the job is done, further calls are made with its result assets
+        self.__job_owners.pop(polling_url)
+        return pdf_services_response
+
+    def get_job_status(self, polling_url: str) -> PDFServicesJobStatusResponse:
+        """
+        See :meth:`PDFServices.get_job_status<adobe.pdfservices.operation.pdf_services.PDFServices.get_job_status>`.
+        """
+        return self.__get_job_owner(polling_url).pdf_services.get_job_status(polling_url)
+
+    def upload(self, input_stream: Any, mime_type: str) -> Asset:
+        """
+        See :meth:`PDFServices.upload<adobe.pdfservices.operation.pdf_services.PDFServices.upload>`.
+        """
+        return self.__upload(lambda pdf_services: pdf_services.upload(input_stream, mime_type), [input_stream])
+
+    def upload_file(self, file_path: str, mime_type: str) -> Asset:
+        """
+        See :meth:`PDFServices.upload_file<adobe.pdfservices.operation.pdf_services.PDFServices.upload_file>`.
+        """
+        return self.__upload(lambda pdf_services: pdf_services.upload_file(file_path, mime_type), [])
+
+    def upload_assets(self, upload_asset_list: List, *, timeout: Optional[Union[int, float]] = None) -> []:
+        """
+        See :meth:`PDFServices.upload_assets<adobe.pdfservices.operation.pdf_services.PDFServices.upload_assets>`.
+        All the assets are uploaded with the same credential so that they can be used in the same job.
+        """
+        return self.__upload(lambda pdf_services: pdf_services.upload_assets(upload_asset_list, timeout=timeout),
+                             [stream_asset.get_input_stream() for stream_asset in upload_asset_list
+                              if isinstance(stream_asset, StreamAsset)])
+
+    def try_upload_assets(self, upload_asset_list: List, *,
+                          timeout: Optional[Union[int, float]] = None) -> UploadAssetsResult:
+        """
+        See
+        :meth:`PDFServices.try_upload_assets<adobe.pdfservices.operation.pdf_services.PDFServices.try_upload_assets>`.
+        All the assets are uploaded with the same credential so that they can be used in the same job.
+        """
+        member = self.__pick_member()
+        upload_assets_result = member.pdf_services.try_upload_assets(upload_asset_list, timeout=timeout)
+        if any(isinstance(error, ServiceUsageException) for error in upload_assets_result.get_errors().values()):
+            self.__drain(member)
+        self.__set_asset_owner(upload_assets_result.get_assets(), member)
+        return upload_assets_result
+
+    def iter_upload_assets(self, upload_asset_list: List, *,
+                           timeout: Optional[Union[int, float]] = None) -> Iterator[tuple]:
+        """
+        See
+        :meth:`PDFServices.iter_upload_assets<adobe.pdfservices.operation.pdf_services.PDFServices.iter_upload_assets>`.
+        All the assets are uploaded with the same credential so that they can be used in the same job.
+        """
+        member = self.__pick_member()
+        return self.__iter_owned_uploads(member, member.pdf_services.iter_upload_assets(upload_asset_list,
+                                                                                       timeout=timeout))
+
+    def get_content(self, asset: Asset, *, spool_threshold: Optional[int] = None) -> StreamAsset:
+        """
+        See :meth:`PDFServices.get_content<adobe.pdfservices.operation.pdf_services.PDFServices.get_content>`.
+        """
+        return self.__get_asset_owner(asset).pdf_services.get_content(asset, spool_threshold=spool_threshold)
+
+    def get_content_to_path(self, asset: Asset, file_path: str, *,
+                            chunk_size: int = ServiceConstants.DOWNLOAD_CHUNK_SIZE):
+        """
+        See :meth:`PDFServices.get_content_to_path
+        <adobe.pdfservices.operation.pdf_services.PDFServices.get_content_to_path>`.
+        """
+        self.__get_asset_owner(asset).pdf_services.get_content_to_path(asset, file_path, chunk_size=chunk_size)
+
+    def iter_content(self, asset: Asset, *, chunk_size: int = ServiceConstants.DOWNLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        See :meth:`PDFServices.iter_content<adobe.pdfservices.operation.pdf_services.PDFServices.iter_content>`.
+        """
+        return self.__get_asset_owner(asset).pdf_services.iter_content(asset, chunk_size=chunk_size)
+
+    def refresh_download_uri(self, asset: Asset) -> Asset:
+        """
+        See :meth:`PDFServices.refresh_download_uri
+        <adobe.pdfservices.operation.pdf_services.PDFServices.refresh_download_uri>`.
+        """
+        return self.__get_asset_owner(asset).pdf_services.refresh_download_uri(asset)
+
+    def delete_asset(self, asset: Asset):
+        """
+        See :meth:`PDFServices.delete_asset<adobe.pdfservices.operation.pdf_services.PDFServices.delete_asset>`.
+        """
+        self.__get_asset_owner(asset).pdf_services.delete_asset(asset)
+        for cloud_asset in JobAssetUtil.get_cloud_assets(asset):
+            self.__asset_owners.pop(cloud_asset.get_asset_id())
+
+    def delete_assets(self, assets: Iterable, *, timeout: Optional[Union[int, float]] = None) -> dict:
+        """
+        See :meth:`PDFServices.delete_assets<adobe.pdfservices.operation.pdf_services.PDFServices.delete_assets>`.
+        The assets are grouped by the credentials owning them, and the groups are deleted concurrently.
+        """
+        assets_by_owner = {}
+        for asset in assets:
+            assets_by_owner.setdefault(self.__get_asset_owner(asset), []).append(asset)
+        errors = {}
+        if not assets_by_owner:
+            return errors
+        with ThreadPoolExecutor(max_workers=len(assets_by_owner)) as executor:
+            futures = [executor.submit(member.pdf_services.delete_assets, owned_assets, timeout=timeout)
+                       for member, owned_assets in assets_by_owner.items()]
+            for future in futures:
+                errors.update(future.result())
+        for owned_assets in assets_by_owner.values():
+            for asset in owned_assets:
+                if asset.get_asset_id() not in errors:
+                    self.__asset_owners.pop(asset.get_asset_id())
+        return errors
+
+    def delete_assets_in_background(self, assets: Iterable):
+        """
+        See :meth:`PDFServices.delete_assets_in_background
+        <adobe.pdfservices.operation.pdf_services.PDFServices.delete_assets_in_background>`.
+        """
+        for asset in assets:
+            self.__get_asset_owner(asset).pdf_services.delete_assets_in_background([asset])
+            self.__asset_owners.pop(asset.get_asset_id())
+
+    def get_pending_deletion_count(self) -> int:
+        """
+        :return: Number of assets queued for deletion with any of the credentials, whose deletion is not done yet.
+        :rtype: int
+        """
+        return sum(member.pdf_services.get_pending_deletion_count() for member in self.__members)
+
+    def __iter_owned_uploads(self, member: _PoolMember, uploads: Iterator[tuple]):
+        with closing(uploads):
+            for index, outcome in uploads:
+                if isinstance(outcome, ServiceUsageException):
+                    self.__drain(member)
+                elif not isinstance(outcome, Exception):
+                    self.__set_asset_owner(outcome, member)
+                yield index, outcome
+
+    def __upload(self, upload, input_streams: list):
+        # the content has to be read again when moving on to another credential, so it is only done for content
+        # which can be rewound
+        positions = self.__get_stream_positions(input_streams)
+        tried = set()
+        while True:
+            member = self.__pick_member(tried)
+            tried.add(member)
+            try:
+                uploaded = upload(member.pdf_services)
+            except (ServiceUsageException, ServiceApiException) as e:
+                if isinstance(e, ServiceUsageException):
+                    self.__drain(member)
+                elif e.status_code == 429 or e.status_code >= 500:
+                    self.__drain(member, "Upload failed with status code {status_code}".format(
+                        status_code=e.status_code))
+                else:
+                    raise
+                if positions is None or len(tried) == len(self.__members):
+                    raise
+                for input_stream, position in zip(input_streams, positions):
+                    if position is not None:
+                        input_stream.seek(position)
+                continue
+            self.__set_asset_owner(uploaded, member)
+            return uploaded
+
+    @staticmethod
+    def __get_stream_positions(input_streams: list) -> Optional[list]:
+        positions = []
+        for input_stream in input_streams:
+            if input_stream is None or isinstance(input_stream, (bytes, bytearray, memoryview)):
+                positions.append(None)
+            elif hasattr(input_stream, 'seek') and hasattr(input_stream, 'tell') and \
+                    getattr(input_stream, 'seekable', lambda: True)():
+                positions.append(input_stream.tell())
+            else:
+                return None
+        return positions
+
+    def __pick_member(self, excluded: set = frozenset()) -> _PoolMember:
+        now = time.monotonic()
+        candidates = [member for member in self.__members if member not in excluded]
+        available = [member for member in candidates if member.drained_until <= now]
+        if not available:
+            # all the usage limits were reached, use the credential which has been left out the longest
+            return min(candidates, key=lambda member: member.drained_until)
+        return random.choices(available, weights=[member.weight for member in available])[0]
+
+    def __call(self, member: _PoolMember, func, *args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except ServiceUsageException:
+            self.__drain(member)
+            raise
+
+    def __drain(self, member: _PoolMember, reason: str = "Usage limit reached"):
+        self._logger.warning("{reason} for credentials {index}, leaving them out for {interval} seconds"
+                             .format(reason=reason, index=self.__members.index(member),
+                                     interval=self.__drain_interval))
+        member.drained_until = time.monotonic() + self.__drain_interval
+
+    def __on_done(self, member: _PoolMember, future: Future, get_owned):
+        if future.cancelled():
+            return
+        exception = future.exception()
+        if isinstance(exception, ServiceUsageException):
+            self.__drain(member)
+        elif exception is None:
+            owned = get_owned()
+            if isinstance(owned, str):
+                self.__set_job_owner(owned, member)
+            else:
+                self.__set_asset_owner(owned, member)
+
+    def __get_job_input_owner(self, pdf_services_job: PDFServicesJob) -> Optional[_PoolMember]:
+        # None only for a job without input assets; inputs of unknown owner go to the first credential, like the
+        # other calls taking assets, since no other credential can see them
+        cloud_assets = JobAssetUtil.get_cloud_assets(pdf_services_job)
+        for asset in cloud_assets:
+            owner = self.__asset_owners.get(asset.get_asset_id())
+            if owner is not None:
+                return owner
+        return self.__members[0] if cloud_assets else None
+
+    def __set_job_owner(self, polling_url: str, member: _PoolMember):
+        self.__job_owners.put(polling_url, member, time.monotonic() + ServiceConstants.ASSET_RETENTION_SECONDS)
+
+    def __get_job_owner(self, polling_url: str) -> _PoolMember:
+        return self.__job_owners.get(polling_url) or self.__members[0]
+
+    def __set_asset_owner(self, obj, member: _PoolMember):
+        expires_at = time.monotonic() + ServiceConstants.ASSET_RETENTION_SECONDS
+        for asset in JobAssetUtil.get_cloud_assets(obj):
+            self.__asset_owners.put(asset.get_asset_id(), member, expires_at)
+
+    def __get_asset_owner(self, asset: Asset) -> _PoolMember:
+        ObjectUtil.require_not_null(asset, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Asset"))
+        if not isinstance(asset, CloudAsset):
+            return self.__members[0]
+        return self.__asset_owners.get(asset.get_asset_id()) or self.__members[0]
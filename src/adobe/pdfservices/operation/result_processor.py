@@ -0,0 +1,149 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Optional
+
+from adobe.pdfservices.operation.internal.constants.custom_error_messages import CustomErrorMessages
+from adobe.pdfservices.operation.internal.constants.service_constants import ServiceConstants
+from adobe.pdfservices.operation.internal.pdf_services_helper import PDFServicesHelper
+from adobe.pdfservices.operation.internal.process.shared_content import process_shared_content
+from adobe.pdfservices.operation.internal.util.enforce_types import enforce_types
+from adobe.pdfservices.operation.internal.util.object_util import ObjectUtil
+from adobe.pdfservices.operation.io.asset import Asset
+from adobe.pdfservices.operation.pdf_services import PDFServices
+
+
+class ResultProcessor:
+    """
+    Post-processes the content of result assets, such as parsing Extract JSON, unzipping resources or converting
+    images, in a pool of worker processes so that CPU-bound work is not limited by the GIL of the process issuing the
+    HTTP requests.
+
+    The content is downloaded by the calling thread straight into a shared memory segment, and the worker process
+    maps that segment instead of receiving a pickled copy of the content. The post-processor is called in the worker
+    with a read-only :samp:`memoryview` of the content, its mime type, and the extra :samp:`args` given to
+    :meth:`process`; its return value is pickled back as the result of the future. The post-processor, its arguments
+    and its return value must therefore be picklable, e.g. a function defined at the top level of a module.
+
+    Worker processes are started with the :samp:`spawn` method, which re-imports the main module, so scripts using a
+    :samp:`ResultProcessor` must guard their entry point with :samp:`if __name__ == "__main__":`.
+
+    Sample usage.
+
+    .. code-block:: python
+
+        def count_elements(content, mime_type, output_path):
+            with zipfile.ZipFile(io.BytesIO(content)) as archive:
+                elements = json.loads(archive.read("structuredData.json"))["elements"]
+            ...
+            return len(elements)
+
+        with ResultProcessor(pdf_services, count_elements) as result_processor:
+            pdf_services_response = pdf_services.run_pipeline(pipeline, input_asset).result()
+            future = result_processor.process(pdf_services_response.get_result().get_resource(),
+                                              args=("output/",))
+            print(future.result())
+    """
+
+    @enforce_types
+    def __init__(self, pdf_services: PDFServices, post_processor: Callable, *, max_workers: Optional[int] = None,
+                 max_pending: Optional[int] = None, chunk_size: int = ServiceConstants.DOWNLOAD_CHUNK_SIZE):
+        """
+        Constructs a new :samp:`ResultProcessor` downloading with the credentials and configuration of the given
+        PDFServices.
+
+        :param pdf_services: PDFServices instance used to download the content; can not be None.
+        :type pdf_services: PDFServices
+        :param post_processor: Picklable callable called in a worker process with the content, its mime type and the
+            extra :samp:`args` given to :meth:`process`; can not be None.
+        :type post_processor: Callable
+        :param max_workers: Number of worker processes. Default value is the number of CPUs. (Optional, use key-value)
+        :type max_workers: int
+        :param max_pending: Maximum number of contents downloaded and not yet post-processed, beyond which
+            :meth:`process` blocks so that shared memory stays bounded. Default value is twice the number of worker
+            processes. (Optional, use key-value)
+        :type max_pending: int
+        :param chunk_size: Number of bytes read from the network at a time. Default value is 65536.
+            (Optional, use key-value)
+        :type chunk_size: int
+        """
+        ObjectUtil.require_not_null(post_processor,
+                                    CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Post-processor"))
+        max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        max_pending = max_pending if max_pending is not None else 2 * max_workers
+        for name, value in (("max workers", max_workers), ("max pending", max_pending), ("chunk size", chunk_size)):
+            if value <= 0:
+                raise ValueError("Invalid value for {name} {value}. Must be valid integer greater than 0"
+                                 .format(name=name, value=value))
+        self.__context = pdf_services._get_execution_context()
+        self.__post_processor = post_processor
+        self.__chunk_size = chunk_size
+        self.__pending = threading.BoundedSemaphore(max_pending)
+        self.__executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+        self._logger = logging.getLogger(__name__)
+
+    @enforce_types
+    def process(self, asset: Asset, *, args: tuple = ()) -> Future:
+        """
+        Downloads the content of the asset into shared memory and submits its post-processing to a worker process.
+
+        :param asset: Result asset whose content is post-processed; can not be None.
+        :type asset: Asset
+        :param args: Extra arguments passed to the post-processor after the content and its mime type. Default value
+            is no extra argument. (Optional, use key-value)
+        :type args: tuple
+        :raises ServiceApiException: If an error is encountered while downloading the content.
+        :raises SdkException: Is thrown for client-side or network errors.
+        :return: A future resolved with the return value of the post-processor, or with the exception it raised.
+        :rtype: concurrent.futures.Future
+        """
+        ObjectUtil.require_not_null(asset, CustomErrorMessages.GENERIC_CAN_NOT_BE_NONE.format("Asset"))
+        self.__pending.acquire()
+        try:
+            shared_content = PDFServicesHelper.get_content_to_shared_memory(self.__context, asset, self.__chunk_size)
+        except Exception:
+            self.__pending.release()
+            raise
+        try:
+            future = self.__executor.submit(process_shared_content, self.__post_processor, shared_content.get_name(),
+                                            shared_content.get_size(), shared_content.get_mime_type(), args)
+        except Exception:
+            shared_content.release()
+            self.__pending.release()
+            raise
+        future.add_done_callback(lambda f: self.__release(shared_content))
+        return future
+
+    def close(self):
+        """
+        Waits for the submitted post-processing to finish and stops the worker processes.
+        """
+        self.__executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __release(self, shared_content):
+        try:
+            shared_content.release()
+        except OSError:
+            self._logger.warning("Could not free the shared memory of {name}".format(name=shared_content.get_name()),
+                                 exc_info=True)
+        finally:
+            self.__pending.release()
@@ -0,0 +1,56 @@
+# Copyright 2024 Adobe
+# All Rights Reserved.
+#
+# NOTICE:  All information contained herein is, and remains
+# the property of Adobe and its suppliers, if any. The intellectual
+# and technical concepts contained herein are proprietary to Adobe
+# and its suppliers and are protected by all applicable intellectual
+# property laws, including trade secret and copyright laws.
+# Dissemination of this information or reproduction of this material
+# is strictly forbidden unless prior written permission is obtained
+# from Adobe.
+from typing import List
+
+
+class UploadAssetsResult:
+    """
+    Result of
+    :meth:`PDFServices.try_upload_assets<adobe.pdfservices.operation.pdf_services.PDFServices.try_upload_assets>`,
+    holding the assets of the uploads which succeeded and the errors of those which failed, at the index of their
+    :class:`StreamAsset<adobe.pdfservices.operation.io.stream_asset.StreamAsset>` in the uploaded list.
+    """
+
+    def __init__(self, assets: List, errors: dict):
+        """
+        Constructs a new :samp:`UploadAssetsResult`.
+
+        :param assets: uploaded assets, None at the index of the uploads which failed.
+        :type assets: list
+        :param errors: errors of the uploads which failed, by index.
+        :type errors: dict
+        """
+        self.__assets = assets
+        self.__errors = errors
+
+    def get_assets(self):
+        """
+        :return: the uploaded :class:`Asset<adobe.pdfservices.operation.io.asset.Asset>` list, in the order of the
+            stream assets, with None at the index of the uploads which failed.
+        :rtype: list
+        """
+        return self.__assets
+
+    def get_errors(self):
+        """
+        :return: the :samp:`ServiceApiException` or :samp:`SdkException` of the uploads which failed, by index of
+            their stream asset.
+        :rtype: dict
+        """
+        return self.__errors
+
+    def is_successful(self):
+        """
+        :return: True if all the stream assets were uploaded.
+        :rtype: bool
+        """
+        return not self.__errors